@@ -4,10 +4,17 @@ RFC7807 Problem Details 커스텀 exception handler.
 모든 DRF 에러 응답을 RFC7807 (application/problem+json) 형식으로 변환합니다.
 https://datatracker.ietf.org/doc/html/rfc7807
 """
-from rest_framework.exceptions import NotAuthenticated
+from rest_framework.exceptions import APIException, NotAuthenticated
 from rest_framework.views import exception_handler as drf_exception_handler
 
 
+class InferenceServiceUnavailable(APIException):
+    """추론 워커 연결 실패/응답 시간 초과 (AI_INFERENCE_MODE=worker)"""
+    status_code = 503
+    default_detail = 'Inference worker unavailable.'
+    default_code = 'inference_unavailable'
+
+
 def rfc7807_exception_handler(exc, context):
     """
     DRF 예외를 RFC7807 Problem Details 형식으로 변환.
@@ -21,6 +28,12 @@ def rfc7807_exception_handler(exc, context):
         "instance": "/api/ai/summarize"
     }
     """
+    from api.services.inference_worker import InferenceError, InferenceUnavailable
+
+    # 추론 워커 오류는 500 대신 503으로 (클라이언트가 재시도할 수 있음)
+    if isinstance(exc, (InferenceError, InferenceUnavailable)):
+        exc = InferenceServiceUnavailable(str(exc))
+
     response = drf_exception_handler(exc, context)
 
     if response is None:
@@ -86,5 +99,6 @@ def _status_title(status_code: int) -> str:
         415: "Unsupported Media Type",
         429: "Too Many Requests",
         500: "Internal Server Error",
+        503: "Service Unavailable",
     }
     return titles.get(status_code, "Error")
@@ -6,7 +6,9 @@ import os
 from django.core.management.base import BaseCommand, CommandError
 from django.db import connection
 
+from api.services.corpus_index import update_corpus_index
 from api.services.news_ingestion import (
+    MAX_COLLECTION_CONCURRENCY,
     collect_news,
     load_active_artist_targets,
     resolve_news_crawler,
@@ -33,14 +35,25 @@ class Command(BaseCommand):
             type=int,
             default=int(os.getenv("NEWS_COLLECTION_PER_ARTIST", "10")),
         )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=int(os.getenv("NEWS_COLLECTION_CONCURRENCY", "1")),
+            help="동시에 조회할 아티스트 검색어 수 (1이면 순차 실행)",
+        )
 
     def handle(self, *args, **options):
         max_artists = options["max_artists"]
         per_artist = options["per_artist"]
+        concurrency = options["concurrency"]
         if not 1 <= max_artists <= 200:
             raise CommandError("--max-artists must be between 1 and 200")
         if not 1 <= per_artist <= 100:
             raise CommandError("--per-artist must be between 1 and 100")
+        if not 1 <= concurrency <= MAX_COLLECTION_CONCURRENCY:
+            raise CommandError(
+                f"--concurrency must be between 1 and {MAX_COLLECTION_CONCURRENCY}"
+            )
 
         try:
             crawler, source = resolve_news_crawler(options["provider"])
@@ -53,12 +66,20 @@ class Command(BaseCommand):
                 targets=targets,
                 display=per_artist,
                 source=source,
+                concurrency=concurrency,
             )
         except CommandError:
             raise
         except Exception as exc:
             raise CommandError(str(exc)) from exc
 
+        # 새로 저장된 기사의 문서 빈도를 키워드/IDF 인덱스에 반영 (실패해도 수집 결과는 유지)
+        try:
+            report["corpus_index"] = update_corpus_index()
+        except Exception as exc:
+            self.stderr.write(f"corpus index update failed: {type(exc).__name__}: {exc}")
+            report["corpus_index"] = {"error": str(exc)}
+
         self.stdout.write(json.dumps(report, ensure_ascii=False, sort_keys=True))
         if report["failed_queries"] == report["queries"]:
             raise CommandError("All news queries failed")
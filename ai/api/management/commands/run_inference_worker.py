@@ -0,0 +1,38 @@
+"""모델을 소유하는 추론 전용 워커 프로세스를 실행한다 (AI_INFERENCE_MODE=worker)."""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from api.services.inference_worker import INFERENCE_SOCKET, InferenceServer
+from api.services.model_preload import start_preload
+
+
+class Command(BaseCommand):
+    help = "Unix 소켓으로 요약/댓글 필터/모더레이션 추론 요청을 받는 워커를 실행합니다."
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--socket", default=INFERENCE_SOCKET, help="Unix 소켓 경로")
+        parser.add_argument(
+            "--no-preload",
+            action="store_true",
+            help="AI_PRELOAD_MODELS 사전 로드를 건너뜀 (첫 요청 때 지연 로딩)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            server = InferenceServer(address=options["socket"])
+        except ImproperlyConfigured as e:
+            raise CommandError(str(e)) from e
+
+        if not options["no_preload"]:
+            # 리스닝은 바로 시작하고, 로드 중 상태는 status op로 /api/health에 노출
+            start_preload()
+
+        self.stdout.write(f"Inference worker listening on {server.address}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
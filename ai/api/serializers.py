@@ -47,7 +47,7 @@ class SummarizeRequestSerializer(serializers.Serializer):
     #######################
     INPUT_TYPE_CHOICES = ['url', 'text']           # 입력 타입 옵션
     LANGUAGE_CHOICES = ['ko', 'en']                # 지원 언어
-    SUMMARIZE_METHOD_CHOICES = ['rule', 'ai']      # 요약 방식
+    SUMMARIZE_METHOD_CHOICES = ['rule', 'ai', 'tfidf', 'textrank']  # 요약 방식
 
     #######################
     # 필드 정의
@@ -65,7 +65,7 @@ class SummarizeRequestSerializer(serializers.Serializer):
         choices=SUMMARIZE_METHOD_CHOICES,
         required=False,
         default='rule',
-        help_text="요약 방식: 'rule' (알고리즘) 또는 'ai' (AI 모델)"
+        help_text="요약 방식: 'rule' (알고리즘), 'ai' (AI 모델), 'tfidf' (TF-IDF 추출), 'textrank' (TextRank 추출)"
     )
 
     # URL (input_type='url'일 때 필수)
@@ -205,6 +205,7 @@ class SummarizeResponseSerializer(serializers.Serializer):
     - bullets: 핵심 포인트 목록
     - keywords: 추출된 키워드 목록
     - elapsed_ms: 처리 시간 (밀리초)
+    - cached: 요약 캐시에서 가져온 결과인지 여부
     """
 
     #######################
@@ -218,7 +219,7 @@ class SummarizeResponseSerializer(serializers.Serializer):
     input_type = serializers.CharField(help_text="입력 타입 (url/text)")
 
     # 사용된 요약 방식
-    summarize_method = serializers.CharField(help_text="사용된 요약 방식 (rule/ai)")
+    summarize_method = serializers.CharField(help_text="사용된 요약 방식 (rule/ai/tfidf/textrank)")
 
     # 기사 제목 (URL 입력 시에만 값 있음, 없으면 null)
     title = serializers.CharField(allow_null=True, help_text="기사 제목 (URL 입력 시)")
@@ -253,6 +254,9 @@ class SummarizeResponseSerializer(serializers.Serializer):
     # 처리 시간 (밀리초)
     elapsed_ms = serializers.IntegerField(help_text="처리 시간 (밀리초)")
 
+    # 요약 캐시 재사용 여부
+    cached = serializers.BooleanField(default=False, help_text="요약 캐시 사용 여부")
+
     #######################
     # Swagger 문서용 예시
     #######################
@@ -273,7 +277,8 @@ class SummarizeResponseSerializer(serializers.Serializer):
                     "GPT와 같은 대규모 언어 모델이 주목받음"
                 ],
                 "keywords": ["인공지능", "자연어", "처리", "기술", "GPT"],
-                "elapsed_ms": 125
+                "elapsed_ms": 125,
+                "cached": False
             }
         }
 
@@ -466,6 +471,10 @@ class AIModerationCheckResponseSerializer(serializers.Serializer):
     processing_time_ms = serializers.IntegerField(help_text="처리 시간 (밀리초)")
     cached = serializers.BooleanField(help_text="캐시된 결과 여부")
     error = serializers.CharField(allow_null=True, help_text="오류 메시지")
+    matched_rules = serializers.ListField(
+        child=serializers.CharField(),
+        help_text="발동한 규칙 기반 필터 이름 목록 (예: profanity.sibal, spam.keywords)"
+    )
 
     class Meta:
         swagger_schema_fields = {
@@ -489,10 +498,11 @@ class AIModerationCheckResponseSerializer(serializers.Serializer):
                 "highest_category": "profanity",
                 "highest_score": 0.95,
                 "confidence": 0.95,
-                "model_used": "ko",
-                "processing_time_ms": 45,
+                "model_used": "rule_based",
+                "processing_time_ms": 1,
                 "cached": False,
-                "error": None
+                "error": None,
+                "matched_rules": ["profanity.sibal"]
             }
         }
 
@@ -538,6 +548,12 @@ class AIModerationStatusSerializer(serializers.Serializer):
         child=serializers.CharField(),
         help_text="로드된 모델 목록"
     )
+    cache = serializers.DictField(
+        help_text="결과 캐시 통계 (hits, misses, evictions, expirations, size, hit_rate, backend 등)"
+    )
+    model_retry = serializers.DictField(
+        help_text="재시도 대기 중인 모델 (모델 이름 -> failures, retry_in_s, last_error)"
+    )
     error = serializers.CharField(allow_null=True, help_text="오류 메시지")
 
     class Meta:
@@ -548,6 +564,12 @@ class AIModerationStatusSerializer(serializers.Serializer):
                 "torch_installed": True,
                 "gpu_available": True,
                 "models_loaded": ["korean", "multilingual"],
+                "cache": {
+                    "hits": 120, "misses": 45, "size": 45, "hit_rate": 0.7273,
+                    "evictions": 0, "expirations": 3,
+                    "maxsize": 1000, "ttl": 300, "backend": "local"
+                },
+                "model_retry": {},
                 "error": None
             }
         }
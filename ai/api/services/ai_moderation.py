@@ -31,9 +31,15 @@
 import logging
 import hashlib
 import json
+import os
+import re
+import struct
+import threading
+import time
 from typing import Optional, Dict, List, Any
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field, asdict, replace
+
+from .result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +59,24 @@ DEFAULT_THRESHOLDS = {
 # 조치 수준 (낮은 순서)
 ACTION_LEVELS = ['allow', 'warning', 'review', 'block']
 
+# 모델 입력 제한: 문자 단위로 먼저 자르고, 토크나이저에서 토큰 단위로 한 번 더 자름
+MODERATION_MAX_CHARS = int(os.getenv('MODERATION_MAX_CHARS', '512'))
+MODERATION_MAX_TOKENS = int(os.getenv('MODERATION_MAX_TOKENS', '512'))
+# batch_check에서 pipeline 한 번에 넣을 텍스트 수
+MODERATION_BATCH_SIZE = int(os.getenv('MODERATION_BATCH_SIZE', '16'))
+
+# 결과 캐시: 프로세스 내 LRU+TTL, 필요하면 Django 캐시(Redis 등)로 워커 간 공유
+MODERATION_CACHE_TTL = int(os.getenv('MODERATION_CACHE_TTL', '300'))
+MODERATION_CACHE_MAXSIZE = int(os.getenv('MODERATION_CACHE_MAXSIZE', '1000'))
+MODERATION_CACHE_USE_DJANGO = os.getenv('MODERATION_CACHE_USE_DJANGO', 'false').lower() == 'true'
+# 모델 없음/추론 오류 같은 저하(degraded) 결과는 짧게만 캐시 (0이면 캐시 안 함)
+MODERATION_NEGATIVE_CACHE_TTL = int(os.getenv('MODERATION_NEGATIVE_CACHE_TTL', '30'))
+DEGRADED_MODELS = ('rule_based_only', 'error')
+
+# 모델 로드/추론 실패 후 재시도 간격 (초): base, 2*base, 4*base ... 최대 max
+MODERATION_MODEL_RETRY_BASE = float(os.getenv('MODERATION_MODEL_RETRY_BASE', '30'))
+MODERATION_MODEL_RETRY_MAX = float(os.getenv('MODERATION_MODEL_RETRY_MAX', '600'))
+
 #######################
 # 결과 데이터 클래스
 #######################
@@ -78,6 +102,7 @@ class ModerationResult:
     processing_time_ms: int = 0
     cached: bool = False
     error: Optional[str] = None
+    matched_rules: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리 변환"""
@@ -99,7 +124,8 @@ class ModerationResult:
             'model_used': self.model_used,
             'processing_time_ms': self.processing_time_ms,
             'cached': self.cached,
-            'error': self.error
+            'error': self.error,
+            'matched_rules': list(self.matched_rules)
         }
 
 
@@ -109,8 +135,12 @@ class ModerationResult:
 _pipeline = None
 _models = {}
 _tokenizers = {}
-_cache = {}  # 간단한 메모리 캐시 (Redis 대체)
-_cache_ttl = 300  # 캐시 유효시간 (5분)
+_cache = ResultCache(
+    'moderation',
+    maxsize=MODERATION_CACHE_MAXSIZE,
+    ttl=MODERATION_CACHE_TTL,
+    use_django=MODERATION_CACHE_USE_DJANGO,
+)
 
 
 #######################
@@ -138,41 +168,96 @@ def _get_pipeline():
 #######################
 # 캐시 관리
 #######################
-def _get_cache_key(text: str, settings: dict) -> str:
-    """캐시 키 생성"""
+def _get_cache_key(text: str, settings: dict) -> bytes:
+    """캐시 키 생성 (16바이트 digest, hex 문자열 키보다 작음)"""
     content = f"{text}:{json.dumps(settings, sort_keys=True)}"
-    return hashlib.md5(content.encode()).hexdigest()
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
 
 
-def _get_from_cache(key: str) -> Optional[ModerationResult]:
-    """캐시에서 결과 조회"""
-    if key in _cache:
-        entry = _cache[key]
-        if datetime.now() < entry['expires']:
-            result = entry['result']
-            result.cached = True
-            return result
-        else:
-            del _cache[key]
-    return None
+def get_moderation_cache() -> ResultCache:
+    """프로세스 공용 모더레이션 결과 캐시"""
+    return _cache
 
 
-def _set_cache(key: str, result: ModerationResult):
-    """캐시에 결과 저장"""
-    _cache[key] = {
-        'result': result,
-        'expires': datetime.now() + timedelta(seconds=_cache_ttl)
-    }
+def _get_from_cache(key: bytes) -> Optional[ModerationResult]:
+    """캐시에서 결과 조회 (압축 항목을 cached=True 결과로 복원)"""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    result = _unpack_result(entry)
+    result.cached = True
+    return result
 
-    # 캐시 크기 제한 (최대 1000개)
-    if len(_cache) > 1000:
-        # 오래된 항목 삭제
-        expired_keys = [
-            k for k, v in _cache.items()
-            if datetime.now() >= v['expires']
-        ]
-        for k in expired_keys[:100]:
-            del _cache[k]
+
+def _set_cache(key: bytes, result: ModerationResult):
+    """
+    캐시에 결과 저장 (LRU 제거/TTL 만료는 ResultCache가 O(1)로 처리)
+
+    모델 없음/추론 오류 결과는 MODERATION_NEGATIVE_CACHE_TTL 동안만 보관합니다.
+    """
+    ttl = MODERATION_NEGATIVE_CACHE_TTL if result.model_used in DEGRADED_MODELS else None
+    _cache.set(key, _pack_result(result), ttl=ttl)
+
+
+#######################
+# 모델 재시도 스케줄
+#######################
+class ModelRetrySchedule:
+    """
+    모델 로드/추론 실패 후 재시도 시각 관리 (지수 백오프)
+
+    실패한 모델은 다음 재시도 시각 전까지 로드/추론을 건너뛰어
+    장애 중에 요청마다 모델 로드를 다시 시도하지 않게 합니다.
+    """
+
+    def __init__(self, base: float, max_delay: float):
+        self.base = base
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._failures = {}  # 모델 이름 -> (연속 실패 수, 다음 재시도 시각, 마지막 오류)
+
+    def ready(self, name: str) -> bool:
+        """지금 로드/추론을 시도해도 되는지"""
+        entry = self._failures.get(name)
+        return entry is None or time.monotonic() >= entry[1]
+
+    def record_failure(self, name: str, error) -> float:
+        """실패 기록 후 다음 재시도까지 대기 시간(초) 반환"""
+        with self._lock:
+            failures = self._failures.get(name, (0, 0.0, None))[0] + 1
+            delay = min(self.base * (2 ** (failures - 1)), self.max_delay)
+            self._failures[name] = (failures, time.monotonic() + delay, str(error))
+        logger.warning(f"Moderation model '{name}' failed ({failures}x), retry in {delay:.0f}s: {error}")
+        return delay
+
+    def record_success(self, name: str):
+        if name in self._failures:
+            with self._lock:
+                self._failures.pop(name, None)
+
+    def clear(self):
+        with self._lock:
+            self._failures.clear()
+
+    def status(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: {
+                    'failures': failures,
+                    'retry_in_s': max(0, round(retry_at - now, 1)),
+                    'last_error': error,
+                }
+                for name, (failures, retry_at, error) in self._failures.items()
+            }
+
+
+_model_retry = ModelRetrySchedule(MODERATION_MODEL_RETRY_BASE, MODERATION_MODEL_RETRY_MAX)
+
+
+def get_model_retry_schedule() -> ModelRetrySchedule:
+    """프로세스 공용 모델 재시도 스케줄"""
+    return _model_retry
 
 
 #######################
@@ -184,6 +269,8 @@ def _get_korean_model():
 
     if 'korean' in _models:
         return _models['korean']
+    if not _model_retry.ready('korean'):
+        return None
 
     try:
         import torch
@@ -199,11 +286,13 @@ def _get_korean_model():
         )
 
         _models['korean'] = model
+        _model_retry.record_success('korean')
         logger.info("Korean moderation model loaded")
         return model
 
     except Exception as e:
         logger.warning(f"Failed to load Korean model: {e}")
+        _model_retry.record_failure('korean', e)
         return None
 
 
@@ -213,6 +302,8 @@ def _get_multilingual_model():
 
     if 'multilingual' in _models:
         return _models['multilingual']
+    if not _model_retry.ready('multilingual'):
+        return None
 
     try:
         import torch
@@ -226,14 +317,217 @@ def _get_multilingual_model():
         )
 
         _models['multilingual'] = model
+        _model_retry.record_success('multilingual')
         logger.info("Multilingual moderation model loaded")
         return model
 
     except Exception as e:
         logger.warning(f"Failed to load multilingual model: {e}")
+        _model_retry.record_failure('multilingual', e)
         return None
 
 
+#######################
+# 규칙 엔진
+#######################
+# 한국어 욕설 규칙 (기본적인 패턴만 포함) - (규칙 이름, 키워드 목록)
+# 이전 정규식 '시[발빠팔][ㄱ-ㅎㅏ-ㅣ]*' 등의 뒤쪽 자모 반복은 매치 여부에 영향이 없으므로
+# 리터럴 키워드로 펼쳐 둠
+PROFANITY_RULES = [
+    ('profanity.sibal', ['시발', '시빠', '시팔']),
+    ('profanity.ssibal', ['씨발', '씨빠', '씨팔']),
+    ('profanity.sb_initials', ['ㅅㅂ']),
+    ('profanity.bs_initials', ['ㅂㅅ']),
+    ('profanity.gsk_initials', ['ㄱㅅㄲ']),
+    ('profanity.byungsin', ['병신', '병싄']),
+    ('profanity.bs_ligature', ['ㅄ']),
+]
+PROFANITY_SCORE = 0.95
+
+# 스팸 지표: 발동한 지표 수 / 전체 지표 수가 0.5 이상이면 spam 카테고리 기록
+SPAM_MAX_URLS = 3            # 초과 시 과도한 URL
+SPAM_MAX_EMOJIS = 10         # 초과 시 과도한 이모지
+SPAM_REPEAT_LENGTH = 11      # 같은 문자가 이 길이 이상 연속되면 반복 스팸
+SPAM_KEYWORDS = ['광고', '홍보', '클릭', '무료', '당첨']
+SPAM_RULES = [
+    'spam.excessive_urls',
+    'spam.excessive_emoji',
+    'spam.repeated_chars',
+    'spam.keywords',
+]
+
+
+class ModerationRuleEngine:
+    """
+    규칙 기반 사전 필터 엔진
+
+    정규식은 생성 시 한 번만 컴파일합니다.
+    - 욕설/스팸 키워드: 리터럴 키워드 전체를 하나의 alternation으로 묶어 한 번만 스캔하고,
+      매치된 키워드로 규칙 이름을 찾음 (이름 있는 그룹은 re 엔진의 리터럴 최적화를 깨뜨려 사용하지 않음)
+    - URL/이모지 개수: finditer로 스트리밍하며 임계값을 넘는 순간 중단 (리스트 생성 없음)
+    - 반복 문자: '(.)\\1{10,}' 대신 역참조를 펼친 패턴 (같은 매치 여부, 약 2배 빠름)
+    """
+
+    def __init__(self):
+        self._keyword_rules = {}
+        for rule_name, keywords in PROFANITY_RULES:
+            for keyword in keywords:
+                self._keyword_rules[keyword] = rule_name
+        for keyword in SPAM_KEYWORDS:
+            self._keyword_rules[keyword] = 'spam.keywords'
+        # 긴 키워드 우선 (접두사가 겹치는 경우 대비)
+        keywords = sorted(self._keyword_rules, key=len, reverse=True)
+        self._keyword_re = re.compile('|'.join(map(re.escape, keywords)))
+        self._url_re = re.compile(r'http[s]?://\S+')
+        self._emoji_re = re.compile(r'[\U0001F600-\U0001F64F]')
+        self._repeat_re = re.compile(r'(.)' + r'\1' * (SPAM_REPEAT_LENGTH - 1))
+
+    @staticmethod
+    def _count_exceeds(pattern, text: str, limit: int) -> bool:
+        """매치 수가 limit를 넘는지 (limit+1번째 매치에서 바로 중단)"""
+        count = 0
+        for _ in pattern.finditer(text):
+            count += 1
+            if count > limit:
+                return True
+        return False
+
+    def scan(self, text: str):
+        """
+        텍스트 한 건 검사
+
+        Returns:
+            (첫 욕설 규칙 이름 또는 None, 발동한 스팸 지표 규칙 목록 - SPAM_RULES 순서)
+        """
+        profanity_rule = None
+        spam_keyword = False
+        for match in self._keyword_re.finditer(text):
+            rule_name = self._keyword_rules[match.group()]
+            if rule_name == 'spam.keywords':
+                spam_keyword = True
+            elif profanity_rule is None:
+                profanity_rule = rule_name
+            if spam_keyword and profanity_rule:
+                break
+
+        spam_rules = []
+        if self._count_exceeds(self._url_re, text, SPAM_MAX_URLS):
+            spam_rules.append('spam.excessive_urls')
+        if self._count_exceeds(self._emoji_re, text, SPAM_MAX_EMOJIS):
+            spam_rules.append('spam.excessive_emoji')
+        if self._repeat_re.search(text):
+            spam_rules.append('spam.repeated_chars')
+        if spam_keyword:
+            spam_rules.append('spam.keywords')
+        return profanity_rule, spam_rules
+
+
+_rule_engine = None
+
+
+def get_rule_engine() -> ModerationRuleEngine:
+    """컴파일된 규칙 엔진 (프로세스당 하나)"""
+    global _rule_engine
+
+    if _rule_engine is None:
+        _rule_engine = ModerationRuleEngine()
+    return _rule_engine
+
+
+#######################
+# 캐시 항목 압축
+#######################
+# ModerationResult 객체(카테고리 객체 리스트 포함) 대신 bytes 하나로 저장합니다.
+# - 점수: x10000 uint16 고정소수점 (to_dict 출력 정밀도인 소수점 4자리와 같음)
+# - 조치/카테고리/규칙/모델 이름: 코드 테이블 인덱스 1바이트
+# - 임계값: 요청마다 달라질 수 있어 float64 그대로
+# 코드 테이블에 없는 값이 있으면 객체를 그대로 저장합니다.
+CATEGORY_CODES = [
+    'profanity', 'spam', 'adult', 'violence', 'hate', 'harassment', 'clean', 'unknown',
+]
+MODEL_CODES = ['', 'none', 'rule_based', 'rule_based_only', 'error', 'ko', 'en']
+RULE_CODES = [rule_name for rule_name, _ in PROFANITY_RULES] + SPAM_RULES
+SCORE_SCALE = 10000
+
+_CATEGORY_INDEX = {name: i for i, name in enumerate(CATEGORY_CODES)}
+_MODEL_INDEX = {name: i for i, name in enumerate(MODEL_CODES)}
+_RULE_INDEX = {name: i for i, name in enumerate(RULE_CODES)}
+_NO_CODE = 255
+_FLAGGED = 0x01
+_HAS_ERROR = 0x02
+# flags, action, model, highest_category, highest_score, confidence, processing_time_ms, 카테고리 수, 규칙 수
+_ENTRY_HEADER = struct.Struct('<BBBBHHIBB')
+# category, score, is_flagged, threshold
+_ENTRY_CATEGORY = struct.Struct('<BH?d')
+
+
+def _quantize(score: float) -> int:
+    return min(max(int(round(score * SCORE_SCALE)), 0), 0xFFFF)
+
+
+def _pack_result(result: ModerationResult):
+    """ModerationResult -> 캐시 항목 (bytes)"""
+    try:
+        categories = b''.join(
+            _ENTRY_CATEGORY.pack(
+                _CATEGORY_INDEX[c.category], _quantize(c.score), c.is_flagged, c.threshold
+            )
+            for c in result.categories
+        )
+        rules = bytes(_RULE_INDEX[rule] for rule in result.matched_rules)
+        highest = (
+            _NO_CODE if result.highest_category is None
+            else _CATEGORY_INDEX[result.highest_category]
+        )
+        model = _MODEL_INDEX.get(result.model_used, _NO_CODE)
+        flags = (_FLAGGED if result.is_flagged else 0) | (_HAS_ERROR if result.error is not None else 0)
+        header = _ENTRY_HEADER.pack(
+            flags, ACTION_LEVELS.index(result.action), model, highest,
+            _quantize(result.highest_score), _quantize(result.confidence),
+            result.processing_time_ms, len(result.categories), len(rules),
+        )
+    except (KeyError, ValueError, struct.error):
+        return result
+    model_name = result.model_used if model == _NO_CODE else ''
+    tail = f"{model_name}\x00{result.error or ''}".encode()
+    return header + categories + rules + tail
+
+
+def _unpack_result(entry) -> ModerationResult:
+    """캐시 항목 -> 새 ModerationResult"""
+    if isinstance(entry, ModerationResult):
+        return replace(entry)
+
+    (flags, action, model, highest, highest_score, confidence,
+     processing_time_ms, n_categories, n_rules) = _ENTRY_HEADER.unpack_from(entry)
+    offset = _ENTRY_HEADER.size
+    categories = []
+    for _ in range(n_categories):
+        code, score, is_flagged, threshold = _ENTRY_CATEGORY.unpack_from(entry, offset)
+        offset += _ENTRY_CATEGORY.size
+        categories.append(ModerationCategory(
+            category=CATEGORY_CODES[code],
+            score=score / SCORE_SCALE,
+            is_flagged=is_flagged,
+            threshold=threshold
+        ))
+    matched_rules = [RULE_CODES[code] for code in entry[offset:offset + n_rules]]
+    model_name, error = entry[offset + n_rules:].decode().split('\x00', 1)
+
+    return ModerationResult(
+        is_flagged=bool(flags & _FLAGGED),
+        action=ACTION_LEVELS[action],
+        categories=categories,
+        highest_category=None if highest == _NO_CODE else CATEGORY_CODES[highest],
+        highest_score=highest_score / SCORE_SCALE,
+        confidence=confidence / SCORE_SCALE,
+        model_used=model_name if model == _NO_CODE else MODEL_CODES[model],
+        processing_time_ms=processing_time_ms,
+        error=error if flags & _HAS_ERROR else None,
+        matched_rules=matched_rules
+    )
+
+
 #######################
 # AI 모더레이션 서비스 클래스
 #######################
@@ -273,16 +567,37 @@ class AIContentModerator:
             'high': 'block',      # 0.85 이상
         }
         self._model = None
+        self._rules = get_rule_engine()
+
+    @property
+    def _model_key(self) -> str:
+        return 'korean' if self.language == 'ko' else 'multilingual'
 
     def _ensure_model(self):
-        """모델 로드 확인"""
+        """
+        모델 로드 확인
+
+        로드/추론 실패로 재시도 대기 중이면 None (규칙 기반만 사용)
+        """
         if self._model is None:
             if self.language == 'ko':
                 self._model = _get_korean_model()
             else:
                 self._model = _get_multilingual_model()
+        if self._model is not None and not _model_retry.ready(self._model_key):
+            return None
         return self._model
 
+    def _run_model(self, model, inputs, **kwargs):
+        """모델 추론 (실패하면 재시도 스케줄에 기록 후 예외 전파)"""
+        try:
+            outputs = model(inputs, **kwargs)
+        except Exception as e:
+            _model_retry.record_failure(self._model_key, e)
+            raise
+        _model_retry.record_success(self._model_key)
+        return outputs
+
     def _determine_action(self, score: float) -> str:
         """점수에 따른 조치 결정"""
         if score >= 0.85:
@@ -343,17 +658,20 @@ class AIContentModerator:
             # AI 모델 기반 검사
             model = self._ensure_model()
             if model is None:
-                # 모델 로드 실패 시 규칙 기반 결과 반환
-                return ModerationResult(
+                # 모델 로드 실패 시 규칙 기반 결과 반환 (짧은 TTL로 캐시)
+                result = ModerationResult(
                     is_flagged=False,
                     action='allow',
                     model_used='rule_based_only',
                     processing_time_ms=int((time.time() - start_time) * 1000),
                     error='AI model not available, using rule-based only'
                 )
+                if use_cache:
+                    _set_cache(cache_key, result)
+                return result
 
             # 모델 예측
-            predictions = model(text[:512])  # 최대 512 토큰
+            predictions = self._run_model(model, text[:MODERATION_MAX_CHARS])
 
             # 결과 분석
             result = self._analyze_predictions(predictions, thresholds)
@@ -368,58 +686,38 @@ class AIContentModerator:
 
         except Exception as e:
             logger.error(f"AI moderation failed: {e}")
-            return ModerationResult(
+            result = ModerationResult(
                 is_flagged=False,
                 action='allow',
                 model_used='error',
                 processing_time_ms=int((time.time() - start_time) * 1000),
                 error=str(e)
             )
+            if use_cache:
+                _set_cache(cache_key, result)
+            return result
 
     def _rule_based_check(self, text: str) -> ModerationResult:
         """
         규칙 기반 사전 필터링
-        AI 모델 호출 전 빠른 검사
+        AI 모델 호출 전 빠른 검사 (발동한 규칙은 matched_rules에 기록)
         """
-        import re
-
         categories = []
+        matched_rules = []
 
-        # 한국어 욕설 패턴 (기본적인 패턴만 포함)
-        profanity_patterns = [
-            r'시[발빠팔][ㄱ-ㅎㅏ-ㅣ]*',
-            r'씨[발빠팔][ㄱ-ㅎㅏ-ㅣ]*',
-            r'ㅅㅂ',
-            r'ㅂㅅ',
-            r'ㄱㅅㄲ',
-            r'병[신싄][ㄱ-ㅎㅏ-ㅣ]*',
-            r'ㅄ',
-        ]
-
-        profanity_score = 0.0
-        for pattern in profanity_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                profanity_score = 0.95
-                break
-
-        if profanity_score > 0:
+        profanity_rule, spam_rules = self._rules.scan(text)
+        if profanity_rule:
+            matched_rules.append(profanity_rule)
             categories.append(ModerationCategory(
                 category='profanity',
-                score=profanity_score,
+                score=PROFANITY_SCORE,
                 is_flagged=True,
                 threshold=self.thresholds.get('profanity', 0.7)
             ))
 
-        # 스팸 패턴
-        spam_indicators = [
-            len(re.findall(r'http[s]?://\S+', text)) > 3,  # 과도한 URL
-            len(re.findall(r'[\U0001F600-\U0001F64F]', text)) > 10,  # 과도한 이모지
-            bool(re.search(r'(.)\1{10,}', text)),  # 10회 이상 반복 문자
-            bool(re.search(r'(광고|홍보|클릭|무료|당첨)', text)),  # 스팸 키워드
-        ]
-
-        spam_score = sum(spam_indicators) / len(spam_indicators)
+        spam_score = len(spam_rules) / len(SPAM_RULES)
         if spam_score >= 0.5:
+            matched_rules.extend(spam_rules)
             categories.append(ModerationCategory(
                 category='spam',
                 score=spam_score,
@@ -439,14 +737,16 @@ class AIContentModerator:
                     highest_category=highest.category,
                     highest_score=highest.score,
                     confidence=highest.score,
-                    model_used='rule_based'
+                    model_used='rule_based',
+                    matched_rules=matched_rules
                 )
 
         return ModerationResult(
             is_flagged=False,
             action='allow',
             categories=categories,
-            model_used='rule_based'
+            model_used='rule_based',
+            matched_rules=matched_rules
         )
 
     def _analyze_predictions(
@@ -532,19 +832,152 @@ class AIContentModerator:
     def batch_check(
         self,
         texts: List[str],
-        use_cache: bool = True
+        use_cache: bool = True,
+        custom_thresholds: Optional[Dict[str, float]] = None,
+        batch_size: Optional[int] = None,
+        max_length: Optional[int] = None
     ) -> List[ModerationResult]:
         """
         여러 텍스트 일괄 검사
 
+        빈 텍스트, 캐시 적중, 규칙 기반 차단은 check()와 같은 순서로 먼저 처리하고
+        남은 텍스트(중복 제거)만 pipeline 한 번의 배치 호출로 추론합니다.
+        결과는 입력 순서대로 반환되며 각 항목의 형식은 check()와 동일합니다.
+
         Args:
             texts: 검사할 텍스트 목록
             use_cache: 캐시 사용 여부
+            custom_thresholds: 이 요청에만 적용할 커스텀 임계값
+            batch_size: pipeline 배치 크기 (기본 MODERATION_BATCH_SIZE)
+            max_length: 토큰 단위 최대 입력 길이 (기본 MODERATION_MAX_TOKENS)
 
         Returns:
             ModerationResult 목록
         """
-        return [self.check(text, use_cache) for text in texts]
+        import time
+        start_time = time.time()
+
+        def elapsed_ms() -> int:
+            return int((time.time() - start_time) * 1000)
+
+        thresholds = custom_thresholds or self.thresholds
+        results: List[Optional[ModerationResult]] = [None] * len(texts)
+        # 텍스트 -> (캐시 키, 결과를 채울 인덱스 목록)
+        pending: Dict[str, Dict[str, Any]] = {}
+
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                results[index] = ModerationResult(
+                    is_flagged=False,
+                    action='allow',
+                    model_used='none',
+                    processing_time_ms=0
+                )
+                continue
+
+            if text in pending:
+                pending[text]['indices'].append(index)
+                continue
+
+            cache_key = _get_cache_key(text, thresholds)
+            if use_cache:
+                cached_result = _get_from_cache(cache_key)
+                if cached_result:
+                    results[index] = cached_result
+                    continue
+
+            try:
+                rule_result = self._rule_based_check(text)
+            except Exception as e:
+                logger.error(f"AI moderation failed: {e}")
+                results[index] = ModerationResult(
+                    is_flagged=False,
+                    action='allow',
+                    model_used='error',
+                    processing_time_ms=elapsed_ms(),
+                    error=str(e)
+                )
+                continue
+
+            if rule_result.is_flagged:
+                rule_result.processing_time_ms = elapsed_ms()
+                if use_cache:
+                    _set_cache(cache_key, rule_result)
+                results[index] = rule_result
+                continue
+
+            pending[text] = {'cache_key': cache_key, 'indices': [index]}
+
+        if pending:
+            for text, result in self._batch_predict(
+                list(pending.keys()), thresholds, batch_size, max_length, elapsed_ms
+            ):
+                entry = pending[text]
+                if use_cache:
+                    _set_cache(entry['cache_key'], result)
+                for index in entry['indices']:
+                    results[index] = result
+
+        return results
+
+    def _batch_predict(self, texts, thresholds, batch_size, max_length, elapsed_ms):
+        """
+        캐시/규칙을 통과한 텍스트를 pipeline 한 번으로 추론
+
+        Returns:
+            (text, ModerationResult) 목록 (입력 순서)
+        """
+        try:
+            model = self._ensure_model()
+            if model is None:
+                return [
+                    (text, ModerationResult(
+                        is_flagged=False,
+                        action='allow',
+                        model_used='rule_based_only',
+                        processing_time_ms=elapsed_ms(),
+                        error='AI model not available, using rule-based only'
+                    ))
+                    for text in texts
+                ]
+
+            outputs = self._run_model(
+                model,
+                [text[:MODERATION_MAX_CHARS] for text in texts],
+                batch_size=batch_size or MODERATION_BATCH_SIZE,
+                truncation=True,
+                max_length=max_length or MODERATION_MAX_TOKENS,
+            )
+            if len(outputs) != len(texts):
+                raise ValueError(
+                    f"pipeline returned {len(outputs)} outputs for {len(texts)} inputs"
+                )
+
+            pairs = []
+            for text, output in zip(texts, outputs):
+                # 단건 호출은 [{label, score}], 리스트 호출은 항목마다 {label, score}
+                predictions = [output] if isinstance(output, dict) else output
+                result = self._analyze_predictions(predictions, thresholds)
+                result.model_used = self.language
+                pairs.append((text, result))
+
+            processing_time_ms = elapsed_ms()
+            for _, result in pairs:
+                result.processing_time_ms = processing_time_ms
+            return pairs
+
+        except Exception as e:
+            logger.error(f"AI moderation failed: {e}")
+            return [
+                (text, ModerationResult(
+                    is_flagged=False,
+                    action='allow',
+                    model_used='error',
+                    processing_time_ms=elapsed_ms(),
+                    error=str(e)
+                ))
+                for text in texts
+            ]
 
 
 #######################
@@ -579,6 +1012,8 @@ def check_ai_moderation_available() -> Dict[str, Any]:
         'torch_installed': False,
         'gpu_available': False,
         'models_loaded': list(_models.keys()),
+        'cache': _cache.stats(),
+        'model_retry': _model_retry.status(),
         'error': None
     }
 
@@ -12,6 +12,13 @@
 # - 한국어: eenzeenee/t5-base-korean-summarization
 # - 영어: facebook/bart-large-cnn
 #
+# 긴 기사 (map-reduce):
+# - 문장 단위로 잘라 AI_SUMMARY_CHUNK_TOKENS 토큰 이하의 chunk로 묶음 (최대 AI_SUMMARY_MAX_CHUNKS개)
+# - map: 모든 chunk를 generate 한 번(배치)으로 부분 요약
+# - reduce: 부분 요약을 이어 붙여 한 번 더 요약
+# - 단계별 입력/생성 토큰 수와 시간을 결과의 stages로 반환
+# - 기사당 최악 지연 시간: prefill 토큰은 chunk 수/크기로, 디코딩은 AI_SUMMARY_TIME_BUDGET(generate max_time)으로 제한
+#
 # 주의사항:
 # - 처음 실행 시 모델 다운로드 필요 (수백MB~수GB)
 # - GPU 있으면 빠름, 없으면 CPU로 동작 (느림)
@@ -20,6 +27,11 @@
 """
 import contextlib
 import logging
+import os
+import re
+import time
+
+from .prefix_cache import PROMPT_PREFIX_CACHE_ENABLED, PromptPrefixCache, pad_after_prefix
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +51,71 @@ except ImportError:
 _pipeline = None  # transformers의 pipeline 함수
 _models = {}      # 언어별 모델 캐시 {'ko': model, 'en': model}
 
+# 언어별 요약 모델 (요약 캐시 키의 모델 ID로도 사용)
+KO_LLM_MODEL_NAME = "mistralai/Mistral-7B-Instruct-v0.3"
+DEFAULT_SUMMARY_MODEL_NAME = "facebook/bart-large-cnn"
+
+#######################
+# 긴 기사 chunk 설정
+#######################
+# chunk 하나에 넣는 기사 토큰 수 (프롬프트 지시문 제외)
+AI_SUMMARY_CHUNK_TOKENS = int(os.getenv("AI_SUMMARY_CHUNK_TOKENS", "1024"))
+# 기사당 최대 chunk 수 (넘는 뒷부분은 버리고 truncated=True)
+AI_SUMMARY_MAX_CHUNKS = int(os.getenv("AI_SUMMARY_MAX_CHUNKS", "8"))
+# map 단계 chunk별 최대 생성 토큰 수
+AI_SUMMARY_CHUNK_NEW_TOKENS = int(os.getenv("AI_SUMMARY_CHUNK_NEW_TOKENS", "128"))
+# 기사당 generate 시간 예산 (초, AI_INFERENCE_TIMEOUT보다 작게)
+AI_SUMMARY_TIME_BUDGET = float(os.getenv("AI_SUMMARY_TIME_BUDGET", "90"))
+# map 단계에 주는 시간 예산 비율 (나머지는 reduce)
+AI_SUMMARY_MAP_TIME_SHARE = float(os.getenv("AI_SUMMARY_MAP_TIME_SHARE", "0.6"))
+
+# chunk 분할용 문장 경계 (문장 부호는 문장에 남김)
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+# 부분 요약 앞의 "[요약]" 표식 (reduce 입력에서는 제거)
+_SUMMARY_MARKER = re.compile(r'^\s*\[요약\]\s*')
+
+
+def plan_chunks(token_counts, budget, max_chunks):
+    """
+    문장(조각)별 토큰 수를 순서대로 budget 이하 chunk로 묶기
+
+    Args:
+        token_counts: 문장별 토큰 수 (각각 budget 이하)
+        budget: chunk당 최대 토큰 수
+        max_chunks: 최대 chunk 수
+
+    Returns:
+        tuple: (chunk별 문장 index 리스트, 뒷부분을 버렸는지)
+    """
+    chunks = []
+    current = []
+    used = 0
+    for index, count in enumerate(token_counts):
+        if current and used + count > budget:
+            chunks.append(current)
+            current = []
+            used = 0
+        current.append(index)
+        used += count
+    if current:
+        chunks.append(current)
+    return chunks[:max_chunks], len(chunks) > max_chunks
+
+
+def summary_latency_limits(max_length):
+    """
+    기사 한 건 요약의 최악 조건 상한
+
+    Returns:
+        dict: prefill 토큰 수 상한(프롬프트 지시문 제외), generate 디코딩 단계 수 상한, 시간 예산(초)
+    """
+    return {
+        'max_input_tokens': AI_SUMMARY_MAX_CHUNKS * AI_SUMMARY_CHUNK_TOKENS,
+        'max_reduce_input_tokens': AI_SUMMARY_MAX_CHUNKS * AI_SUMMARY_CHUNK_NEW_TOKENS,
+        'max_decode_steps': AI_SUMMARY_CHUNK_NEW_TOKENS + max_length,
+        'time_budget_s': AI_SUMMARY_TIME_BUDGET,
+    }
+
 
 #######################
 # Pipeline 지연 로딩
@@ -150,15 +227,18 @@ def _get_model(language='ko'):
         return _models[language]
 
     if language == 'ko':
-        model_name = "mistralai/Mistral-7B-Instruct-v0.3"
-
-        tokenizer, model = _get_llm_model(model_name)
+        tokenizer, model = _get_llm_model(KO_LLM_MODEL_NAME)
 
         _models[language] = {
             "type": "llm",
             "tokenizer": tokenizer,
             "model": model
         }
+        if PROMPT_PREFIX_CACHE_ENABLED:
+            # 고정 지시문의 KV 캐시 (첫 요약 요청 때 한 번 계산)
+            _models[language]["prefix_cache"] = PromptPrefixCache(
+                "news_summarizer", tokenizer, model, NEWS_PROMPT_PREFIX
+            )
 
     else:
         pipeline_fn = _get_pipeline()
@@ -166,7 +246,7 @@ def _get_model(language='ko'):
             "type": "pipeline",
             "model": pipeline_fn(
                 task="summarization",
-                model="facebook/bart-large-cnn",
+                model=DEFAULT_SUMMARY_MODEL_NAME,
                 device=0 if (TORCH_AVAILABLE and torch.cuda.is_available()) else -1
             )
         }
@@ -176,8 +256,8 @@ def _get_model(language='ko'):
 #######################
 # LLM 뉴스 요약 프롬프트
 #######################
-def build_news_prompt(text: str) -> str:
-    return f"""
+# 고정 지시문 (KV 캐시로 재사용되는 prefix)
+NEWS_PROMPT_PREFIX = """
 너는 뉴스 요약 AI다.
 아래 기사에 **있는 정보만 사용**하여 요약하라.
 추측, 해석, 평가, 배경 설명은 절대 추가하지 마라.
@@ -190,7 +270,11 @@ def build_news_prompt(text: str) -> str:
 - 결과물 첫단어는 무조건 "[요약]"로 시작
 
 기사:
-\"\"\"
+"""
+
+
+def build_news_prompt(text: str) -> str:
+    return NEWS_PROMPT_PREFIX + f"""\"\"\"
 {text}
 \"\"\"
 
@@ -215,6 +299,10 @@ class AISummarizer:
         result = summarizer.summarize(text, max_length=200, min_length=50)
     """
 
+    # 요약 캐시 키에 들어가는 알고리즘 버전 (결과가 달라지는 변경 시 올릴 것)
+    # v2: 코퍼스 IDF 키워드 순위, 긴 기사 map-reduce (chunks/truncated/stages/limits 필드)
+    ALGORITHM_VERSION = 'v2'
+
     def __init__(self, language='ko'):
         """
         AI 요약기 초기화
@@ -225,6 +313,12 @@ class AISummarizer:
         self.language = language
         self._model = None  # 지연 로딩을 위해 None으로 초기화
 
+    @property
+    def model_id(self):
+        """이 요약기가 사용하는 모델 이름 + 알고리즘 버전 (모델을 로드하지 않고 반환)"""
+        model_name = KO_LLM_MODEL_NAME if self.language == 'ko' else DEFAULT_SUMMARY_MODEL_NAME
+        return f"{model_name}:{self.ALGORITHM_VERSION}"
+
     #######################
     # 모델 지연 로딩
     #######################
@@ -248,68 +342,49 @@ class AISummarizer:
     # 메인 요약 함수
     #######################
     def summarize(self, text, max_length=200, min_length=50):
+        """
+        기사 요약 (짧은 기사는 generate 한 번, 긴 기사는 chunk map-reduce)
+
+        Returns:
+            dict: summary, bullets, keywords, model_type
+                + chunks, truncated, stages(단계별 토큰 수/시간), limits(최악 조건 상한)
+        """
         try:
             model_bundle = self._ensure_model()
-
-            prompt = build_news_prompt(text)
-
-            # =========================
-            # LLM 분기 (Mistral)
-            # =========================
-            if model_bundle["type"] == "llm":
-                tokenizer = model_bundle["tokenizer"]
-                model = model_bundle["model"]
-
-                inputs = tokenizer(
-                    prompt,
-                    return_tensors="pt"
-                ).to(model.device)
-
-                #######################
-                # 종화 모델 변경안
-                #######################
-                # do_sample=False (greedy decoding)일 때는 temperature/top_p 무시됨
-                no_grad = torch.no_grad() if TORCH_AVAILABLE else contextlib.nullcontext()
-                with no_grad:
-                    outputs = model.generate(
-                        **inputs,
-                        max_new_tokens=max_length,
-                        do_sample=False,  # greedy decoding: 항상 최고 확률 토큰 선택
-                        repetition_penalty=1.1,
-                        pad_token_id=tokenizer.eos_token_id
-                    )
-                #######################
-                # 원본 (temperature 경고 발생)
-                #######################
-                # with torch.no_grad():
-                #     outputs = model.generate(
-                #         **inputs,
-                #         max_new_tokens=max_length,
-                #         do_sample=False,
-                #         temperature=0.0,
-                #         top_p=1.0,
-                #         repetition_penalty=1.1,
-                #         pad_token_id=tokenizer.eos_token_id
-                #     )
-
-                summary = tokenizer.decode(
-                    outputs[0][inputs["input_ids"].shape[-1]:],
-                    skip_special_tokens=True
-                ).strip()
-
-            # =========================
-            # Pipeline 분기 (T5 / BART)
-            # =========================
+            started = time.perf_counter()
+            stages = []
+
+            chunks, truncated = self._split_chunks(model_bundle, text)
+            if len(chunks) == 1:
+                summary = self._run_stage(
+                    model_bundle, 'single', chunks, max_length, min_length,
+                    AI_SUMMARY_TIME_BUDGET, stages,
+                )[0]
             else:
-                pipeline_model = model_bundle["model"]
-
-                result = pipeline_model(
-                    text,
-                    max_length=max_length,
-                    min_length=min_length
+                # map: chunk 전체를 한 번에 부분 요약
+                partials = self._run_stage(
+                    model_bundle, 'map', chunks, AI_SUMMARY_CHUNK_NEW_TOKENS,
+                    min(min_length, AI_SUMMARY_CHUNK_NEW_TOKENS),
+                    AI_SUMMARY_TIME_BUDGET * AI_SUMMARY_MAP_TIME_SHARE, stages,
                 )
-
-                summary = result[0]["summary_text"].strip()
+                # reduce: 남은 시간 예산만 씀 (map이 일찍 끝나면 그만큼 더 씀, 예산을 넘기지 않음)
+                remaining = AI_SUMMARY_TIME_BUDGET - (time.perf_counter() - started)
+                combined = ' '.join(_SUMMARY_MARKER.sub('', partial) for partial in partials if partial)
+                if remaining > 0:
+                    summary = self._run_stage(
+                        model_bundle, 'reduce', [combined], max_length, min_length, remaining, stages,
+                    )[0]
+                else:
+                    # 예산 소진: 부분 요약을 이어 붙인 것을 그대로 반환
+                    summary = combined
+                    stages.append({
+                        "stage": "reduce",
+                        "inputs": 0,
+                        "input_tokens": 0,
+                        "generated_tokens": 0,
+                        "elapsed_ms": 0,
+                        "skipped": True,
+                    })
 
             # ===== 이후 로직은 동일 =====
             bullets = self._extract_bullets(summary)
@@ -319,13 +394,161 @@ class AISummarizer:
                 "summary": summary,
                 "bullets": bullets,
                 "keywords": keywords,
-                "model_type": model_bundle["type"]
+                "model_type": model_bundle["type"],
+                "chunks": len(chunks),
+                "truncated": truncated,
+                "stages": stages,
+                "limits": summary_latency_limits(max_length),
             }
 
         except Exception as e:
             logger.error(f"AI summarization failed: {e}")
             raise RuntimeError(f"AI summarization failed: {e}")
 
+    #######################
+    # chunk 분할
+    #######################
+    @staticmethod
+    def _tokenizer(model_bundle):
+        if model_bundle["type"] == "llm":
+            return model_bundle["tokenizer"]
+        return model_bundle["model"].tokenizer
+
+    def _split_chunks(self, model_bundle, text):
+        """
+        문장 단위로 AI_SUMMARY_CHUNK_TOKENS 이하 chunk 분할
+
+        chunk 하나에 들어가는 기사는 원문 그대로 반환하고,
+        토큰 예산보다 긴 문장은 토큰 경계에서 나눕니다.
+
+        Returns:
+            tuple: (chunk 텍스트 리스트, 뒷부분을 버렸는지)
+        """
+        sentences = [sentence for sentence in _SENTENCE_BOUNDARY.split(text.strip()) if sentence]
+        if not sentences:
+            return [text], False
+
+        tokenizer = self._tokenizer(model_bundle)
+        budget = AI_SUMMARY_CHUNK_TOKENS
+        pieces = []  # (텍스트, 토큰 수)
+        for sentence, ids in zip(sentences, tokenizer(sentences, add_special_tokens=False)["input_ids"]):
+            if len(ids) <= budget:
+                pieces.append((sentence, len(ids)))
+                continue
+            for start in range(0, len(ids), budget):
+                piece_ids = ids[start:start + budget]
+                pieces.append((tokenizer.decode(piece_ids, skip_special_tokens=True), len(piece_ids)))
+
+        groups, truncated = plan_chunks([count for _, count in pieces], budget, AI_SUMMARY_MAX_CHUNKS)
+        if len(groups) == 1 and not truncated:
+            return [text], False
+        if truncated:
+            logger.warning("기사가 %d개 chunk를 넘어 뒷부분을 버림 (%d문장)", AI_SUMMARY_MAX_CHUNKS, len(sentences))
+        return [' '.join(pieces[index][0] for index in group) for group in groups], truncated
+
+    #######################
+    # generate 단계
+    #######################
+    def _run_stage(self, model_bundle, stage, texts, max_new_tokens, min_length, max_time, stages):
+        """텍스트 목록을 한 번의 배치 generate로 요약하고 단계 통계를 stages에 추가"""
+        started = time.perf_counter()
+        if model_bundle["type"] == "llm":
+            summaries, input_tokens, generated_tokens = self._generate_llm(
+                model_bundle, texts, max_new_tokens, max_time
+            )
+        else:
+            summaries, input_tokens, generated_tokens = self._generate_pipeline(
+                model_bundle, texts, max_new_tokens, min_length, max_time
+            )
+        stages.append({
+            "stage": stage,
+            "inputs": len(texts),
+            "input_tokens": input_tokens,
+            "generated_tokens": generated_tokens,
+            "elapsed_ms": int((time.perf_counter() - started) * 1000),
+        })
+        return summaries
+
+    def _generate_llm(self, model_bundle, texts, max_new_tokens, max_time):
+        """
+        LLM (Mistral) 배치 generate
+
+        Returns:
+            tuple: (요약 리스트, 프롬프트 토큰 수 합, 생성 토큰 수 합)
+        """
+        tokenizer = model_bundle["tokenizer"]
+        model = model_bundle["model"]
+        # decoder-only 모델 배치 생성: 프롬프트 끝이 정렬되도록 왼쪽 패딩
+        tokenizer.padding_side = "left"
+        if tokenizer.pad_token is None:
+            tokenizer.pad_token = tokenizer.eos_token
+
+        encoded = tokenizer([build_news_prompt(text) for text in texts])["input_ids"]
+
+        # 고정 지시문은 캐시된 KV를 재사용하고 기사 부분만 prefill
+        cache_kwargs = {}
+        prefix_cache = model_bundle.get("prefix_cache")
+        if prefix_cache is not None and all(prefix_cache.matches(row) for row in encoded):
+            inputs = pad_after_prefix(tokenizer, encoded, prefix_cache.prefix_length).to(model.device)
+            cache_kwargs["past_key_values"] = prefix_cache.past_key_values(len(encoded))
+            prefix_cache.record(reused=len(encoded))
+        else:
+            inputs = tokenizer.pad(
+                {"input_ids": encoded},
+                padding=True,
+                return_tensors="pt",
+            ).to(model.device)
+            if prefix_cache is not None:
+                prefix_cache.record(reused=0, fallback=len(encoded))
+
+        # do_sample=False (greedy decoding)일 때는 temperature/top_p 무시됨
+        # max_time: 디코딩이 시간 예산을 넘으면 그때까지 생성한 토큰으로 종료
+        no_grad = torch.no_grad() if TORCH_AVAILABLE else contextlib.nullcontext()
+        with no_grad:
+            outputs = model.generate(
+                **inputs,
+                **cache_kwargs,
+                max_new_tokens=max_new_tokens,
+                max_time=max_time,
+                do_sample=False,  # greedy decoding: 항상 최고 확률 토큰 선택
+                repetition_penalty=1.1,
+                pad_token_id=tokenizer.pad_token_id
+            )
+
+        prompt_length = inputs["input_ids"].shape[-1]
+        summaries = []
+        generated_tokens = 0
+        for output in outputs:
+            new_tokens = [token for token in output[prompt_length:].tolist() if token != tokenizer.pad_token_id]
+            generated_tokens += len(new_tokens)
+            summaries.append(tokenizer.decode(new_tokens, skip_special_tokens=True).strip())
+        return summaries, sum(len(row) for row in encoded), generated_tokens
+
+    def _generate_pipeline(self, model_bundle, texts, max_new_tokens, min_length, max_time):
+        """
+        Pipeline (BART) 배치 요약
+
+        Returns:
+            tuple: (요약 리스트, 입력 토큰 수 합, 생성 토큰 수 합)
+        """
+        pipeline_model = model_bundle["model"]
+        tokenizer = pipeline_model.tokenizer
+
+        results = pipeline_model(
+            texts,
+            max_length=max_new_tokens,
+            min_length=min(min_length, max_new_tokens),
+            truncation=True,
+            batch_size=len(texts),
+            max_time=max_time,
+        )
+        summaries = [result["summary_text"].strip() for result in results]
+
+        def count_tokens(values):
+            return sum(len(ids) for ids in tokenizer(values, add_special_tokens=False)["input_ids"])
+
+        return summaries, count_tokens(texts), count_tokens(summaries)
+
     #######################
     # 핵심 포인트 추출
     #######################
@@ -371,7 +594,7 @@ class AISummarizer:
         방식:
         - 단어 빈도수 기반 추출
         - 불용어(조사, 관사 등) 제거
-        - 상위 빈도 단어 반환
+        - 빈도 x 코퍼스 IDF 상위 단어 반환 (crawled_news 문서 빈도 인덱스)
 
         Args:
             text: 원문 텍스트
@@ -382,6 +605,8 @@ class AISummarizer:
         import re
         from collections import Counter
 
+        from .corpus_index import rank_keywords
+
         # 단어 추출 (소문자 변환)
         words = re.findall(r'\b\w+\b', text.lower())
 
@@ -403,11 +628,8 @@ class AISummarizer:
         # 불용어 및 2글자 이하 제거
         words = [w for w in words if w not in stop_words and len(w) > 2]
 
-        # 빈도수 기준 상위 10개
-        freq = Counter(words)
-        keywords = [word for word, count in freq.most_common(10)]
-
-        return keywords
+        # 빈도 x IDF 기준 상위 10개
+        return rank_keywords(Counter(words), limit=10)
 
 
 #######################
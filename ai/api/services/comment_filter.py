@@ -9,12 +9,47 @@ AI 기반 댓글 필터링 서비스 (LLM)
 
 import torch
 import logging
+import math
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from .prefix_cache import PROMPT_PREFIX_CACHE_ENABLED, PromptPrefixCache, pad_after_prefix
 
 logger = logging.getLogger(__name__)
 
 _models = {}
 _filter_service = None
 
+# ---------------------------
+# 마이크로 배치 설정
+# ---------------------------
+MAX_NEW_TOKENS = 64
+# generate 한 번에 넣을 최대 댓글 수
+FILTER_MAX_BATCH_SIZE = int(os.getenv("COMMENT_FILTER_MAX_BATCH_SIZE", "16"))
+# 배치당 (가장 긴 프롬프트 토큰 수 x 배치 크기) 상한. 패딩 포함 VRAM 사용량 기준
+FILTER_MAX_BATCH_TOKENS = int(os.getenv("COMMENT_FILTER_MAX_BATCH_TOKENS", "4096"))
+# 단건 요청을 모으는 대기 시간(ms). 0이면 단건 요청은 바로 처리
+FILTER_BATCH_WAIT_MS = float(os.getenv("COMMENT_FILTER_BATCH_WAIT_MS", "10"))
+
+# ---------------------------
+# 판정 방식
+# ---------------------------
+# generate: BLOCK/ALLOW를 생성해서 읽음 (기존 방식)
+# score: forward 한 번으로 다음 토큰의 BLOCK/ALLOW logit을 비교해 확률로 판정
+FILTER_MODE = os.getenv("COMMENT_FILTER_MODE", "generate").lower()
+FILTER_BLOCK_THRESHOLD = float(os.getenv("COMMENT_FILTER_BLOCK_THRESHOLD", "0.5"))
+# 확률 보정(Platt scaling): sigmoid((logit_BLOCK - logit_ALLOW) / T + bias)
+FILTER_SCORE_TEMPERATURE = float(os.getenv("COMMENT_FILTER_SCORE_TEMPERATURE", "1.0"))
+FILTER_SCORE_BIAS = float(os.getenv("COMMENT_FILTER_SCORE_BIAS", "0.0"))
+# 라벨 첫 토큰 후보 (토크나이저에 따라 앞 공백 유무로 토큰이 달라짐)
+LABEL_VARIANTS = {
+    "BLOCK": ("BLOCK", " BLOCK"),
+    "ALLOW": ("ALLOW", " ALLOW"),
+}
+
 
 # ---------------------------
 # GPU VRAM
@@ -75,8 +110,8 @@ def _get_model():
 # ---------------------------
 # 프롬프트
 # ---------------------------
-def build_filter_prompt(text: str) -> str:
-    return f"""
+# 고정 지시문 (KV 캐시로 재사용되는 prefix)
+FILTER_PROMPT_PREFIX = """
 너는 댓글 필터링 AI다.
 
 아래 댓글이 욕설, 혐오, 위협, 성적 표현 등
@@ -86,7 +121,11 @@ def build_filter_prompt(text: str) -> str:
 설명, 이유, 문장은 절대 출력하지 마라.
 
 댓글:
-\"\"\"{text}\"\"\"
+"""
+
+
+def build_filter_prompt(text: str) -> str:
+    return FILTER_PROMPT_PREFIX + f"""\"\"\"{text}\"\"\"
 
 출력:
 """
@@ -104,6 +143,7 @@ class FilterResult:
         rule_name: str | None = None,
         filter_type: str | None = None,
         matched_pattern: str | None = None,
+        score: float | None = None,
     ):
         self.is_filtered = is_filtered
 
@@ -116,58 +156,296 @@ class FilterResult:
         self.matched_pattern = matched_pattern
         self.reason = reason
 
+        # score 모드의 BLOCK 확률 (generate 모드에서는 None)
+        self.score = score
+
+
+
+
+def _result_from_output(raw: str) -> FilterResult:
+    return _build_result(raw.strip().upper().startswith("BLOCK"))
+
+
+def _build_result(is_filtered: bool, score: float | None = None) -> FilterResult:
+    if is_filtered:
+        return FilterResult(
+            is_filtered=True,
+            reason="LLM 판단: 부적절한 표현",
+            rule_id="LLM_001",
+            rule_name="LLM Toxicity Filter",
+            filter_type="LLM",
+            score=score,
+        )
+
+    return FilterResult(
+        is_filtered=False,
+        filter_type="LLM",
+        score=score,
+    )
+
+
+def _logsumexp(values: list) -> float:
+    peak = max(values)
+    return peak + math.log(sum(math.exp(value - peak) for value in values))
+
+
+def block_probability(block_logits: list, allow_logits: list,
+                      temperature: float = 1.0, bias: float = 0.0) -> float:
+    """
+    BLOCK/ALLOW 라벨 logit으로 보정된 BLOCK 확률을 계산한다.
+
+    두 라벨만 놓고 softmax한 값에 temperature/bias 보정을 적용한 것과 같다.
+    라벨 토큰 후보가 여러 개면 logsumexp로 합친다.
+    """
+    z = (_logsumexp(block_logits) - _logsumexp(allow_logits)) / temperature + bias
+    if z >= 0:
+        return 1 / (1 + math.exp(-z))
+    return math.exp(z) / (1 + math.exp(z))
+
+
+def _position_ids(attention_mask, start: int = 0):
+    # 패딩이 있는 배치에서도 실제 토큰 위치가 연속되도록 (generate와 같은 방식)
+    position_ids = attention_mask.long().cumsum(-1) - 1
+    position_ids.masked_fill_(attention_mask == 0, 1)
+    return position_ids[:, start:]
+
+
+def plan_micro_batches(token_lengths: list, max_batch_size: int, max_batch_tokens: int) -> list:
+    """
+    프롬프트 인덱스를 마이크로 배치로 나눈다.
+
+    길이순으로 정렬해 비슷한 길이끼리 묶어 패딩 낭비를 줄이고, 배치마다
+    (최장 길이 x 배치 크기)가 토큰 예산을 넘지 않게 한다. 예산보다 긴 프롬프트
+    하나는 단독 배치가 된다.
+    """
+    batches = []
+    current = []
+    current_max = 0
+    for index in sorted(range(len(token_lengths)), key=lambda i: token_lengths[i]):
+        longest = max(current_max, token_lengths[index])
+        if current and (
+            len(current) >= max_batch_size or longest * (len(current) + 1) > max_batch_tokens
+        ):
+            batches.append(current)
+            current, longest = [], token_lengths[index]
+        current.append(index)
+        current_max = longest
+    if current:
+        batches.append(current)
+    return batches
 
 
+# ---------------------------
+# 단건 요청 묶기 (coalescing)
+# ---------------------------
+class _MicroBatcher:
+    """
+    동시에 들어온 단건 filter_comment 요청을 짧은 대기 시간 안에서 모아
+    한 번의 배치 추론으로 처리하는 백그라운드 스레드.
+    """
+
+    def __init__(self, run_batch, max_batch_size: int, wait_ms: float,
+                 name: str = "comment-filter-batcher"):
+        self._run_batch = run_batch
+        self._max_batch_size = max_batch_size
+        self._wait = wait_ms / 1000
+        self._name = name
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, text: str) -> FilterResult:
+        future = Future()
+        self._ensure_thread()
+        self._queue.put((text, future))
+        return future.result()
+
+    def _ensure_thread(self):
+        # gunicorn fork 이후 첫 요청에서 워커마다 스레드를 시작한다.
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._loop, name=self._name, daemon=True
+                )
+                self._thread.start()
+
+    def _loop(self):
+        while True:
+            pending = [self._queue.get()]
+            deadline = time.monotonic() + self._wait
+            while len(pending) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                results = self._run_batch([text for text, _ in pending])
+            except Exception as exc:
+                for _, future in pending:
+                    future.set_exception(exc)
+                continue
+            for (_, future), result in zip(pending, results):
+                future.set_result(result)
+
 
 # ---------------------------
 # 서비스
 # ---------------------------
 class CommentFilterService:
-    def __init__(self):
+    def __init__(self, mode: str | None = None):
+        self.mode = (mode or FILTER_MODE).lower()
+        if self.mode not in ("generate", "score"):
+            raise ValueError(f"Unknown comment filter mode: {self.mode}")
         self._bundle = None
+        self._label_ids = None
+        self._batcher = None
+        if FILTER_BATCH_WAIT_MS > 0:
+            self._batcher = _MicroBatcher(self.batch_filter, FILTER_MAX_BATCH_SIZE, FILTER_BATCH_WAIT_MS)
 
     def _ensure_model(self):
         if self._bundle is None:
-            self._bundle = _get_model()  # LLM bundle(dict) 반환
+            bundle = _get_model()  # LLM bundle(dict) 반환
+            tokenizer = bundle["tokenizer"]
+            # decoder-only 모델 배치 생성: 프롬프트 끝이 정렬되도록 왼쪽 패딩
+            tokenizer.padding_side = "left"
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
+            if PROMPT_PREFIX_CACHE_ENABLED and "prefix_cache" not in bundle:
+                bundle["prefix_cache"] = PromptPrefixCache(
+                    "comment_filter", tokenizer, bundle["model"], FILTER_PROMPT_PREFIX
+                )
+            self._bundle = bundle
         return self._bundle
 
     def filter_comment(self, text: str) -> FilterResult:
+        # 동시에 들어온 단건 요청은 대기 시간 안에서 하나의 배치로 합쳐진다.
+        if self._batcher is not None:
+            return self._batcher.submit(text)
+        return self.batch_filter([text])[0]
+
+    def batch_filter(self, texts: list) -> list:
+        """
+        댓글 목록을 마이크로 배치 단위로 generate 한 번씩 처리한다.
+
+        Returns:
+            list: 입력 순서와 같은 FilterResult 목록
+        """
+        if not texts:
+            return []
+
         bundle = self._ensure_model()
         tokenizer = bundle["tokenizer"]
         model = bundle["model"]
 
-        prompt = build_filter_prompt(text)
-        inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
+        # 토큰화는 한 번만 하고, 배치별로 왼쪽 패딩만 적용한다.
+        encoded = tokenizer([build_filter_prompt(text) for text in texts])["input_ids"]
+        batches = plan_micro_batches(
+            [len(ids) for ids in encoded], FILTER_MAX_BATCH_SIZE, FILTER_MAX_BATCH_TOKENS
+        )
 
+        prefix_cache = bundle.get("prefix_cache")
+        results = [None] * len(texts)
+        for batch in batches:
+            rows = [encoded[i] for i in batch]
+            prefix_length = 0
+            if prefix_cache is not None and all(prefix_cache.matches(row) for row in rows):
+                prefix_length = prefix_cache.prefix_length
+                inputs = self._pad_after_prefix(tokenizer, rows, prefix_length).to(model.device)
+                past = prefix_cache.past_key_values(len(rows))
+                prefix_cache.record(reused=len(rows))
+            else:
+                inputs = tokenizer.pad(
+                    {"input_ids": rows},
+                    padding=True,
+                    return_tensors="pt",
+                ).to(model.device)
+                past = None
+                if prefix_cache is not None:
+                    prefix_cache.record(reused=0, fallback=len(rows))
+
+            if self.mode == "score":
+                batch_results = self._score_batch(tokenizer, model, inputs, past, prefix_length)
+            else:
+                batch_results = self._generate_batch(tokenizer, model, inputs, past)
+            for index, result in zip(batch, batch_results):
+                results[index] = result
+
+        return results
+
+    @staticmethod
+    def _pad_after_prefix(tokenizer, rows: list, prefix_length: int):
+        """공유 prefix 뒤, 댓글 앞에 패딩을 넣는다 (prefix_cache.pad_after_prefix)."""
+        return pad_after_prefix(tokenizer, rows, prefix_length)
+
+    def _generate_batch(self, tokenizer, model, inputs, past=None) -> list:
+        # past가 있으면 generate는 캐시 길이 이후 토큰만 prefill 한다.
+        cache_kwargs = {"past_key_values": past} if past is not None else {}
         with torch.no_grad():
             outputs = model.generate(
                 **inputs,
-                max_new_tokens=64,
+                **cache_kwargs,
+                max_new_tokens=MAX_NEW_TOKENS,
                 do_sample=False,
-                pad_token_id=tokenizer.eos_token_id,
+                pad_token_id=tokenizer.pad_token_id,
             )
 
-        raw = tokenizer.decode(
-            outputs[0][inputs["input_ids"].shape[-1]:],
-            skip_special_tokens=True,
-        ).strip().upper()
-
-        if raw.startswith("BLOCK"):
-            return FilterResult(
-                is_filtered=True,
-                reason="LLM 판단: 부적절한 표현",
-                rule_id="LLM_001",
-                rule_name="LLM Toxicity Filter",
-                filter_type="LLM",
+        prompt_length = inputs["input_ids"].shape[-1]
+        return [
+            _result_from_output(tokenizer.decode(output[prompt_length:], skip_special_tokens=True))
+            for output in outputs
+        ]
+
+    def _score_batch(self, tokenizer, model, inputs, past=None, prefix_length: int = 0) -> list:
+        """
+        forward 한 번으로 다음 토큰 분포에서 BLOCK/ALLOW를 비교한다 (자기회귀 디코딩 없음).
+        패딩이 앞쪽에 있어 모든 행의 마지막 위치가 프롬프트의 마지막 토큰이다.
+        """
+        block_ids, allow_ids = self._ensure_label_ids(tokenizer)
+        attention_mask = inputs["attention_mask"]
+        with torch.no_grad():
+            if past is None:
+                outputs = model(**inputs, position_ids=_position_ids(attention_mask))
+            else:
+                # prefix는 캐시에 있으므로 가변 부분만 forward (마스크는 전체 길이)
+                outputs = model(
+                    input_ids=inputs["input_ids"][:, prefix_length:],
+                    attention_mask=attention_mask,
+                    position_ids=_position_ids(attention_mask, prefix_length),
+                    past_key_values=past,
+                )
+        selected = outputs.logits[:, -1, :][:, block_ids + allow_ids].float().tolist()
+
+        results = []
+        for row in selected:
+            probability = block_probability(
+                row[:len(block_ids)], row[len(block_ids):],
+                FILTER_SCORE_TEMPERATURE, FILTER_SCORE_BIAS,
             )
-
-        return FilterResult(
-            is_filtered=False,
-            filter_type="LLM",
-        )
-
-    def batch_filter(self, texts: list) -> list:
-        return [self.filter_comment(text) for text in texts]
+            results.append(_build_result(probability >= FILTER_BLOCK_THRESHOLD, round(probability, 4)))
+        return results
+
+    def _ensure_label_ids(self, tokenizer) -> tuple:
+        """BLOCK/ALLOW 라벨의 첫 토큰 ID 후보를 구한다 (두 라벨이 공유하는 토큰은 제외)."""
+        if self._label_ids is None:
+            first_tokens = {}
+            for label, variants in LABEL_VARIANTS.items():
+                ids = set()
+                for variant in variants:
+                    token_ids = tokenizer.encode(variant, add_special_tokens=False)
+                    if token_ids:
+                        ids.add(token_ids[0])
+                first_tokens[label] = ids
+            shared = first_tokens["BLOCK"] & first_tokens["ALLOW"]
+            block_ids = sorted(first_tokens["BLOCK"] - shared)
+            allow_ids = sorted(first_tokens["ALLOW"] - shared)
+            if not block_ids or not allow_ids:
+                raise RuntimeError("BLOCK/ALLOW labels do not have distinct first tokens")
+            self._label_ids = (block_ids, allow_ids)
+        return self._label_ids
 
 
 
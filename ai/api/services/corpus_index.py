@@ -0,0 +1,336 @@
+"""
+#######################
+# 코퍼스 문서 빈도(DF) 인덱스
+#######################
+# crawled_news 전체에서 "이 단어가 나온 기사 수"를 세어 파일 하나에 저장하고,
+# 요약/키워드 추출은 요청마다 DB를 조회하지 않고 이 파일에서 IDF를 읽습니다.
+#
+# 갱신 (collect_news 명령 실행 후):
+# - 스냅샷에 기록된 마지막 created_at보다 CORPUS_INDEX_OVERLAP_SECONDS 앞부터 다시 읽고,
+#   그 구간에서 이미 센 행(스냅샷에 id 보관)은 건너뛰어 새 행만 토큰화해 DF에 더함
+#   (created_at은 INSERT 전에 찍히므로, 늦게 커밋된 행이나 마지막 행과 같은 시각의 행도 빠뜨리지 않음)
+# - 스냅샷이 없으면 전체 행으로 처음부터 생성
+# - 임시 파일에 쓴 뒤 os.replace로 교체 (읽는 프로세스는 이전 파일을 끝까지 안전하게 사용)
+# - 이미 센 기사의 본문이 나중에 바뀌어도 다시 세지 않음 (URL 기준 upsert는 대부분 같은 본문)
+#
+# 조회 (웹/배치 프로세스):
+# - 프로세스당 한 번 mmap으로 열고, 파일이 교체되면 (mtime 확인) 다시 엶
+# - 단어 -> 64비트 해시 -> 개방 주소법 해시 테이블 슬롯이라 조회가 O(1)
+#   (단어 문자열은 저장하지 않음, 64비트 해시 충돌은 무시할 수 있는 수준)
+#
+# 파일 형식 (little-endian):
+#   헤더: magic(4s) version(I) 문서 수(Q) 단어 수(I) 테이블 크기(I, 2의 거듭제곱) 마지막 created_at(q, UTC 마이크로초, 없으면 -1)
+#         최근 행 수(I)
+#   슬롯 x 테이블 크기: 단어 해시(Q, 0이면 빈 슬롯) 문서 빈도(I)
+#   최근 행 x 최근 행 수: CrawledNews id(16s, UUID) created_at(q, UTC 마이크로초)
+#######################
+"""
+import fcntl
+import hashlib
+import heapq
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from .summarizer import WORD_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 파일 경로
+CORPUS_INDEX_PATH = Path(os.getenv(
+    "CORPUS_INDEX_PATH",
+    str(Path(__file__).parent.parent.parent / "corpus_data" / "df_index.bin"),
+))
+
+# 열어 둔 스냅샷이 교체됐는지 확인하는 간격 (초)
+CORPUS_INDEX_RELOAD_INTERVAL = float(os.getenv("CORPUS_INDEX_RELOAD_INTERVAL", "60"))
+# 갱신 시 마지막 created_at보다 이만큼 앞부터 다시 읽는 구간 (초, 수집 트랜잭션 최대 길이보다 길게)
+CORPUS_INDEX_OVERLAP_SECONDS = float(os.getenv("CORPUS_INDEX_OVERLAP_SECONDS", "600"))
+
+CORPUS_INDEX_MAGIC = b'FPDF'
+CORPUS_INDEX_VERSION = 2
+_HEADER = struct.Struct('<4sIQIIqI')
+_SLOT = struct.Struct('<QI')
+_RECENT = struct.Struct('<16sq')
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# 갱신 시 한 번에 읽는 행 수
+_UPDATE_CHUNK_SIZE = 500
+
+
+def smoothed_idf(num_docs, document_frequency):
+    """평활화한 IDF: log((1 + N) / (1 + df)) + 1 (코퍼스가 비어 있으면 모든 단어가 1)"""
+    return math.log((1 + num_docs) / (1 + document_frequency)) + 1
+
+
+def term_hash(word):
+    """단어의 64비트 해시 (프로세스/재시작과 무관하게 같은 값, 0은 빈 슬롯용이라 1로 대체)"""
+    digest = hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') or 1
+
+
+def document_terms(text):
+    """기사 한 건에서 DF로 세는 단어 집합 (요약기와 같은 토큰화, 소문자)"""
+    return set(WORD_PATTERN.findall(text.lower())) if text else set()
+
+
+def rank_keywords(word_counts, limit=10):
+    """
+    기사 내 등장 횟수 x 코퍼스 IDF 순으로 상위 키워드 선택
+
+    코퍼스 인덱스가 비어 있으면 IDF가 모두 같아 등장 횟수 순서와 같습니다
+    (동점은 첫 등장 순서).
+    """
+    index = get_corpus_index()
+    return heapq.nlargest(limit, word_counts, key=lambda word: word_counts[word] * index.idf(word))
+
+
+def _to_micros(value):
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(value):
+    return _EPOCH + timedelta(microseconds=value)
+
+
+#######################
+# 스냅샷 읽기
+#######################
+class CorpusIndex:
+    """mmap으로 연 DF 스냅샷 (파일이 없으면 빈 인덱스)"""
+
+    def __init__(self, buffer=None, num_docs=0, num_terms=0, table_size=0, watermark=None, recent_count=0):
+        self._buffer = buffer
+        self.num_docs = num_docs
+        self.num_terms = num_terms
+        self._table_size = table_size
+        self._mask = table_size - 1
+        self.watermark = watermark  # 마지막으로 센 CrawledNews.created_at
+        self._recent_count = recent_count
+
+    @classmethod
+    def load(cls, path):
+        """스냅샷 파일을 mmap으로 열기 (없으면 빈 인덱스, 형식이 다르면 ValueError)"""
+        try:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return cls()
+
+        magic, version = struct.unpack_from('<4sI', buffer, 0)
+        if magic != CORPUS_INDEX_MAGIC or version != CORPUS_INDEX_VERSION:
+            raise ValueError(f"Unsupported corpus index file: {path}")
+        _, _, num_docs, num_terms, table_size, watermark, recent_count = _HEADER.unpack_from(buffer, 0)
+        if len(buffer) != _HEADER.size + table_size * _SLOT.size + recent_count * _RECENT.size:
+            raise ValueError(f"Truncated corpus index file: {path}")
+        return cls(
+            buffer, num_docs, num_terms, table_size,
+            _from_micros(watermark) if watermark >= 0 else None,
+            recent_count,
+        )
+
+    def document_frequency(self, word):
+        """단어가 나온 기사 수 (O(1), 없으면 0)"""
+        if not self._table_size:
+            return 0
+        target = term_hash(word)
+        slot = target & self._mask
+        while True:
+            slot_hash, frequency = _SLOT.unpack_from(self._buffer, _HEADER.size + slot * _SLOT.size)
+            if slot_hash == target:
+                return frequency
+            if slot_hash == 0:
+                return 0
+            slot = (slot + 1) & self._mask
+
+    def idf(self, word):
+        return smoothed_idf(self.num_docs, self.document_frequency(word))
+
+    def frequencies(self):
+        """{단어 해시: 문서 빈도} (갱신용)"""
+        result = {}
+        for slot in range(self._table_size):
+            slot_hash, frequency = _SLOT.unpack_from(self._buffer, _HEADER.size + slot * _SLOT.size)
+            if slot_hash:
+                result[slot_hash] = frequency
+        return result
+
+    def recent_rows(self):
+        """{CrawledNews id: created_at(UTC 마이크로초)} 재확인 구간에서 이미 센 행 (갱신용)"""
+        offset = _HEADER.size + self._table_size * _SLOT.size
+        return {
+            uuid.UUID(bytes=row_id): created_at
+            for row_id, created_at in _RECENT.iter_unpack(
+                self._buffer[offset:offset + self._recent_count * _RECENT.size]
+            )
+        } if self._recent_count else {}
+
+
+def write_corpus_index(path, num_docs, frequencies, watermark=None, recent_rows=None):
+    """
+    DF 스냅샷 파일 쓰기 (임시 파일 -> os.replace)
+
+    Args:
+        path: 스냅샷 경로
+        num_docs: 문서 수
+        frequencies: {단어 해시: 문서 빈도}
+        watermark: 마지막으로 센 CrawledNews.created_at (없으면 None)
+        recent_rows: {CrawledNews id: created_at(UTC 마이크로초)} 재확인 구간에서 이미 센 행
+    """
+    path = Path(path)
+    recent_rows = recent_rows or {}
+    table_size = 8
+    while table_size < len(frequencies) * 2:  # 적재율 50% 이하
+        table_size *= 2
+    mask = table_size - 1
+
+    recent_offset = _HEADER.size + table_size * _SLOT.size
+    buffer = bytearray(recent_offset + len(recent_rows) * _RECENT.size)
+    _HEADER.pack_into(
+        buffer, 0, CORPUS_INDEX_MAGIC, CORPUS_INDEX_VERSION, num_docs, len(frequencies), table_size,
+        _to_micros(watermark) if watermark is not None else -1, len(recent_rows),
+    )
+    for word_hash, frequency in frequencies.items():
+        slot = word_hash & mask
+        while _SLOT.unpack_from(buffer, _HEADER.size + slot * _SLOT.size)[0]:
+            slot = (slot + 1) & mask
+        _SLOT.pack_into(buffer, _HEADER.size + slot * _SLOT.size, word_hash, frequency)
+    for index, (row_id, created_at) in enumerate(recent_rows.items()):
+        _RECENT.pack_into(buffer, recent_offset + index * _RECENT.size, row_id.bytes, created_at)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(buffer)
+    os.replace(tmp_path, path)
+
+
+#######################
+# 프로세스 공용 인덱스
+#######################
+_index = None
+_index_mtime = None
+_index_checked_at = 0.0
+_index_lock = threading.Lock()
+
+
+def get_corpus_index():
+    """프로세스 공용 CorpusIndex (CORPUS_INDEX_RELOAD_INTERVAL마다 파일 교체 여부만 확인)"""
+    global _index, _index_mtime, _index_checked_at
+    now = time.monotonic()
+    if _index is not None and now - _index_checked_at < CORPUS_INDEX_RELOAD_INTERVAL:
+        return _index
+
+    with _index_lock:
+        if _index is not None and now - _index_checked_at < CORPUS_INDEX_RELOAD_INTERVAL:
+            return _index
+        try:
+            mtime = os.stat(CORPUS_INDEX_PATH).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if _index is None or mtime != _index_mtime:
+            try:
+                _index = CorpusIndex.load(CORPUS_INDEX_PATH)
+            except (OSError, ValueError, struct.error) as e:
+                logger.warning("코퍼스 DF 인덱스 로드 실패, IDF 없이 계산: %s", e)
+                _index = CorpusIndex()
+            _index_mtime = mtime
+            logger.info("코퍼스 DF 인덱스 로드: 문서 %d개, 단어 %d개", _index.num_docs, _index.num_terms)
+        _index_checked_at = now
+    return _index
+
+
+def reset_corpus_index():
+    """열어 둔 인덱스를 버림 (다음 호출 때 다시 엶, 테스트/갱신 직후용)"""
+    global _index, _index_mtime
+    with _index_lock:
+        _index = None
+        _index_mtime = None
+
+
+#######################
+# 증분 갱신
+#######################
+@contextmanager
+def _update_lock(path):
+    """같은 스냅샷을 동시에 갱신하지 않도록 파일 잠금 (여러 collect_news 실행 대비)"""
+    lock_path = Path(f'{path}.lock')
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def update_corpus_index(path=None):
+    """
+    스냅샷 이후 새로 들어온 CrawledNews 행의 DF를 더해 스냅샷 교체
+
+    기사 텍스트는 제목 + 요약(content) + 원문(origin_news)입니다.
+    마지막 created_at보다 CORPUS_INDEX_OVERLAP_SECONDS 앞부터 다시 읽고,
+    스냅샷에 보관한 그 구간의 id로 이미 센 행을 건너뜁니다.
+
+    Returns:
+        dict: {'added_docs': int, 'num_docs': int, 'num_terms': int}
+    """
+    from api.models import CrawledNews
+
+    path = Path(path or CORPUS_INDEX_PATH)
+    with _update_lock(path):
+        try:
+            current = CorpusIndex.load(path)
+        except (ValueError, struct.error) as e:
+            # 이전 형식/손상된 스냅샷: 전체 행으로 다시 생성
+            logger.warning("코퍼스 DF 인덱스를 처음부터 다시 생성: %s", e)
+            current = CorpusIndex()
+        frequencies = current.frequencies()
+        num_docs = current.num_docs
+        watermark = current.watermark
+        recent_rows = current.recent_rows()
+
+        queryset = CrawledNews.objects.order_by('created_at')
+        if watermark is not None:
+            overlap = timedelta(seconds=CORPUS_INDEX_OVERLAP_SECONDS)
+            queryset = queryset.filter(created_at__gte=watermark - overlap)
+
+        added_docs = 0
+        seen_rows = 0
+        rows = queryset.values_list('id', 'title', 'content', 'origin_news', 'created_at')
+        for row_id, title, content, origin_news, created_at in rows.iterator(chunk_size=_UPDATE_CHUNK_SIZE):
+            if row_id in recent_rows:
+                continue
+            seen_rows += 1
+            recent_rows[row_id] = _to_micros(created_at)
+            if watermark is None or created_at > watermark:
+                watermark = created_at
+            terms = document_terms(' '.join(filter(None, (title, content, origin_news))))
+            if not terms:
+                continue
+            for term in terms:
+                word_hash = term_hash(term)
+                frequencies[word_hash] = frequencies.get(word_hash, 0) + 1
+            num_docs += 1
+            added_docs += 1
+
+        if seen_rows:
+            # 다음 갱신의 재확인 구간에 들어가는 행만 보관
+            horizon = _to_micros(watermark) - int(CORPUS_INDEX_OVERLAP_SECONDS * 1_000_000)
+            recent_rows = {
+                row_id: created_at for row_id, created_at in recent_rows.items() if created_at >= horizon
+            }
+            write_corpus_index(path, num_docs, frequencies, watermark, recent_rows)
+            if path == Path(CORPUS_INDEX_PATH):
+                reset_corpus_index()
+
+    logger.info("코퍼스 DF 인덱스 갱신: 문서 %d개 추가 (전체 %d개, 단어 %d개)", added_docs, num_docs, len(frequencies))
+    return {'added_docs': added_docs, 'num_docs': num_docs, 'num_terms': len(frequencies)}
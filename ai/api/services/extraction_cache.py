@@ -0,0 +1,266 @@
+"""
+#######################
+# 기사 추출 결과 캐시
+#######################
+# ArticleExtractor.extract 앞단의 캐시 계층입니다.
+#
+# 조회 순서:
+# 1. 프로세스 내 LRU (+ 선택적으로 Django 캐시 백엔드)
+# 2. CrawledNews.origin_news (크롤링 시 이미 추출한 본문)
+# 3. 네트워크 다운로드 + 추출
+#
+# 캐시 키는 normalize_storable_article_url로 정규화한 URL입니다.
+# TTL이 지난 항목은 ETag/Last-Modified가 있으면 조건부 요청으로 재검증하고,
+# 304 응답이면 다시 추출하지 않고 기존 결과를 재사용합니다.
+#######################
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+from .extractor import ArticleExtractor
+from .url_security import NOT_MODIFIED_STATUS, UnsafeUrlError, normalize_storable_article_url
+
+logger = logging.getLogger(__name__)
+
+#######################
+# 캐시 설정
+#######################
+EXTRACTION_CACHE_TTL = int(os.getenv("EXTRACTION_CACHE_TTL", "3600"))              # 재검증 없이 쓰는 기간(초)
+EXTRACTION_CACHE_STALE_TTL = int(os.getenv("EXTRACTION_CACHE_STALE_TTL", "86400"))  # 재검증용 보관 기간(초)
+EXTRACTION_CACHE_MAXSIZE = int(os.getenv("EXTRACTION_CACHE_MAXSIZE", "512"))
+EXTRACTION_CACHE_USE_DJANGO = os.getenv("EXTRACTION_CACHE_USE_DJANGO", "false").lower() == "true"
+EXTRACTION_CACHE_KEY_PREFIX = "fanpulse:extract:v1:"
+
+# CrawledNews 본문을 추출 결과로 인정하는 최소 길이 (추출기 검증 기준과 동일)
+MIN_STORED_TEXT_LENGTH = 50
+
+
+#######################
+# 캐시 저장소
+#######################
+class ExtractionCache:
+    """
+    정규화 URL -> 추출 결과 항목을 보관하는 LRU+TTL 캐시.
+
+    항목 형식:
+        {
+            'result': extract 결과 dict,
+            'etag': ETag 헤더 (str or None),
+            'last_modified': Last-Modified 헤더 (str or None),
+            'fresh_until': 재검증 없이 사용할 수 있는 시각 (epoch 초),
+            'expires_at': 캐시에서 제거되는 시각 (epoch 초),
+        }
+
+    use_django=True면 Django 캐시 백엔드에도 같은 항목을 써서 워커 간에 공유한다.
+    """
+
+    def __init__(self, maxsize=EXTRACTION_CACHE_MAXSIZE, use_django=EXTRACTION_CACHE_USE_DJANGO):
+        self.maxsize = maxsize
+        self.use_django = use_django
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _django_key(key):
+        # memcached 등 키 길이/문자 제한이 있는 백엔드를 위해 해시를 쓴다.
+        return EXTRACTION_CACHE_KEY_PREFIX + hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """만료되지 않은 항목을 반환한다 (없으면 None)."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["expires_at"] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._django_get(key)
+        if entry is not None and entry["expires_at"] > now:
+            self._store_local(key, entry)
+            with self._lock:
+                self.hits += 1
+            return entry
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, entry):
+        self._store_local(key, entry)
+        if self.use_django:
+            try:
+                from django.core.cache import cache
+                cache.set(self._django_key(key), entry, timeout=max(1, int(entry["expires_at"] - time.time())))
+            except Exception:
+                logger.warning("Extraction cache backend write failed", exc_info=True)
+
+    def _store_local(self, key, entry):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _django_get(self, key):
+        if not self.use_django:
+            return None
+        try:
+            from django.core.cache import cache
+            return cache.get(self._django_key(key))
+        except Exception:
+            logger.warning("Extraction cache backend read failed", exc_info=True)
+            return None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "maxsize": self.maxsize,
+                "use_django": self.use_django,
+            }
+
+
+_extraction_cache = ExtractionCache()
+
+
+def get_extraction_cache():
+    """프로세스 공용 추출 캐시를 반환한다."""
+    return _extraction_cache
+
+
+def _new_entry(result, etag=None, last_modified=None):
+    now = time.time()
+    return {
+        "result": result,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fresh_until": now + EXTRACTION_CACHE_TTL,
+        "expires_at": now + max(EXTRACTION_CACHE_TTL, EXTRACTION_CACHE_STALE_TTL),
+    }
+
+
+#######################
+# 캐시 적용 추출기
+#######################
+class CachedArticleExtractor(ArticleExtractor):
+    """
+    추출 캐시를 거치는 ArticleExtractor.
+
+    사용법:
+        extractor = CachedArticleExtractor()
+        result = extractor.extract(url)   # ArticleExtractor.extract와 같은 결과 형식
+        extractor.last_cache_status       # 'hit' | 'stored' | 'revalidated' | 'miss' | 'bypass'
+    """
+
+    def __init__(self, cache=None, single_parse=None):
+        super().__init__(single_parse=single_parse)
+        self.cache = cache or _extraction_cache
+        self.last_cache_status = None
+
+    def extract(self, url):
+        try:
+            key = normalize_storable_article_url(url)
+        except UnsafeUrlError:
+            # 캐시 키를 만들 수 없는 URL은 기존 경로에서 거부된다.
+            self.last_cache_status = "bypass"
+            return super().extract(url)
+
+        #######################
+        # 1. 메모리/Django 캐시
+        #######################
+        entry = self.cache.get(key)
+        if entry is not None and entry["fresh_until"] > time.time():
+            self.last_cache_status = "hit"
+            return dict(entry["result"])
+
+        #######################
+        # 2. CrawledNews.origin_news
+        #######################
+        if entry is None:
+            stored = self._lookup_crawled_news(key)
+            if stored is not None:
+                self.cache.set(key, _new_entry(stored))
+                self.last_cache_status = "stored"
+                return dict(stored)
+
+        #######################
+        # 3. 네트워크 (만료 항목은 조건부 요청으로 재검증)
+        #######################
+        validators = {}
+        if entry is not None:
+            if entry.get("etag"):
+                validators["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                validators["If-Modified-Since"] = entry["last_modified"]
+
+        timings = {}
+        response, failure = self._fetch(url, timings, extra_headers=validators or None)
+        if failure is not None:
+            self.last_cache_status = "miss"
+            return failure
+
+        if response.status == NOT_MODIFIED_STATUS and entry is not None:
+            self.cache.set(key, _new_entry(entry["result"], entry.get("etag"), entry.get("last_modified")))
+            self.last_cache_status = "revalidated"
+            return dict(entry["result"])
+
+        result = self._extract_response(url, response, timings)
+        if result["success"]:
+            self.cache.set(key, _new_entry(
+                result,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            ))
+        self.last_cache_status = "miss"
+        return result
+
+    @staticmethod
+    def _lookup_crawled_news(key):
+        """크롤링 시 저장한 원문(origin_news)이 있으면 추출 결과 형식으로 반환한다."""
+        try:
+            from api.models import CrawledNews
+            row = (
+                CrawledNews.objects
+                .filter(url=key, origin_news__isnull=False)
+                .values("title", "origin_news", "published_at")
+                .first()
+            )
+        except Exception:
+            logger.warning("CrawledNews lookup failed", exc_info=True)
+            return None
+
+        if row is None:
+            return None
+        text = (row["origin_news"] or "").strip()
+        if len(text) < MIN_STORED_TEXT_LENGTH:
+            return None
+        return {
+            "success": True,
+            "text": text,
+            "title": row["title"] or None,
+            "source": urlparse(key).netloc,
+            "published_at": row["published_at"].isoformat() if row["published_at"] else None,
+            "error": None,
+        }
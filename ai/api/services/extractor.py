@@ -15,14 +15,88 @@
 # - 발행일 (가능한 경우)
 #######################
 """
+import codecs
 import logging
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from bs4 import BeautifulSoup
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit
 
 from .url_security import ExternalResponseError, UnsafeUrlError, safe_fetch_url
 
 logger = logging.getLogger(__name__)
 
+#######################
+# 병렬 추출 설정
+#######################
+# extract_many 전체 동시 실행 수 상한과 같은 호스트에 대한 동시 요청 수 상한
+MAX_EXTRACT_CONCURRENCY = 32
+EXTRACT_PER_HOST_LIMIT = int(os.getenv("EXTRACT_PER_HOST_LIMIT", "2"))
+
+# 단일 파싱 모드: 한 번 디코딩/파싱한 lxml 트리를 newspaper와 폴백이 함께 사용
+EXTRACT_SINGLE_PARSE = os.getenv("EXTRACT_SINGLE_PARSE", "true").lower() == "true"
+
+_HEADER_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_XML_DECLARATION_RE = re.compile(r'^<\?.*?\?>', re.DOTALL)
+
+# BeautifulSoup 폴백과 같은 순서의 본문 컨테이너 후보 (CSS 선택자 -> XPath)
+_CONTENT_XPATHS = (
+    '//article',
+    '//main',
+    '//*[contains(concat(" ", normalize-space(@class), " "), " article-content ")]',
+    '//*[contains(concat(" ", normalize-space(@class), " "), " post-content ")]',
+    '//*[@id="content"]',
+)
+_NOISE_TAGS = ('script', 'style', 'nav', 'header', 'footer')
+
+
+def _elapsed_ms(started):
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _known_charset(name):
+    try:
+        return codecs.lookup(name.decode('ascii') if isinstance(name, bytes) else name).name
+    except (LookupError, UnicodeDecodeError):
+        return None
+
+
+def decode_html(body, content_type=None):
+    """
+    응답 바이트를 한 번만 디코딩한다.
+
+    우선순위: Content-Type charset -> BOM -> 문서 앞부분 <meta charset> -> UTF-8.
+    알 수 없는 문자는 치환한다 (EUC-KR 등 한국 언론사 페이지 대응).
+    """
+    charset = None
+    if content_type:
+        match = _HEADER_CHARSET_RE.search(content_type)
+        if match:
+            charset = _known_charset(match.group(1))
+    if charset is None:
+        for bom, name in ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16'),
+                          (codecs.BOM_UTF16_BE, 'utf-16')):
+            if body.startswith(bom):
+                charset = name
+                break
+    if charset is None:
+        match = _META_CHARSET_RE.search(body[:4096])
+        if match:
+            charset = _known_charset(match.group(1))
+    return body.decode(charset or 'utf-8', errors='replace')
+
+
+class _SharedTree:
+    """한 번 파싱한 lxml 트리. newspaper가 변형하면 파싱 직후 사본으로 교체된다."""
+
+    def __init__(self, text, doc):
+        self.text = text
+        self.doc = doc
+
 
 #######################
 # 기사 추출기 클래스
@@ -54,9 +128,16 @@ class ArticleExtractor:
     )
     TIMEOUT = 10  # 요청 타임아웃 (초)
 
-    def __init__(self):
-        """추출기 초기화"""
+    def __init__(self, single_parse=None):
+        """
+        추출기 초기화
+
+        Args:
+            single_parse: True면 HTML을 한 번만 디코딩/파싱해 두 추출 방식이 공유
+                          (기본값: EXTRACT_SINGLE_PARSE 환경 변수)
+        """
         self.headers = {'User-Agent': self.USER_AGENT}
+        self.single_parse = EXTRACT_SINGLE_PARSE if single_parse is None else single_parse
 
     #######################
     # 메인 추출 함수
@@ -82,26 +163,49 @@ class ArticleExtractor:
                 'error': 에러 메시지 (str or None)
             }
         """
+        return self._extract_timed(url, {})
+
+    def _extract_timed(self, url, timings):
+        """extract 본문. 단계별 소요 시간(ms)을 timings에 기록한다."""
+        response, failure = self._fetch(url, timings)
+        if failure is not None:
+            return failure
+        return self._extract_response(url, response, timings)
+
+    def _fetch(self, url, timings, extra_headers=None):
+        """기사를 다운로드해 (응답, None) 또는 (None, 실패 결과)를 반환한다."""
+        started = time.perf_counter()
         try:
             response = safe_fetch_url(
                 url,
                 timeout=self.TIMEOUT,
                 user_agent=self.USER_AGENT,
+                extra_headers=extra_headers,
             )
         except UnsafeUrlError:
             logger.warning("Blocked unsafe article URL")
-            return self._failure("URL is not allowed")
+            return None, self._failure("URL is not allowed")
         except (ExternalResponseError, OSError, TimeoutError):
             logger.warning("Article download failed", exc_info=True)
-            return self._failure("Article download failed")
+            return None, self._failure("Article download failed")
         except Exception:
             logger.exception("Unexpected article download failure")
-            return self._failure("Article download failed")
+            return None, self._failure("Article download failed")
+        finally:
+            timings['fetch_ms'] = _elapsed_ms(started)
+        return response, None
+
+    def _extract_response(self, url, response, timings):
+        """다운로드한 응답에서 기사를 추출한다 (단일 파싱 또는 newspaper -> bs4)."""
+        if self.single_parse:
+            return self._extract_single_parse(url, response, timings)
 
         #######################
         # 1차 시도: newspaper3k (네트워크 요청 없이 검증된 HTML만 파싱)
         #######################
+        started = time.perf_counter()
         result = self._extract_with_newspaper(response.url, response.body)
+        timings['newspaper_ms'] = _elapsed_ms(started)
         if result['success']:
             logger.info(f"Successfully extracted with newspaper3k: {url}")
             return result
@@ -111,7 +215,9 @@ class ArticleExtractor:
         #######################
         # 2차 시도: BeautifulSoup
         #######################
+        started = time.perf_counter()
         result = self._extract_with_bs4(response.url, response.body)
+        timings['bs4_ms'] = _elapsed_ms(started)
         if result['success']:
             logger.info(f"Successfully extracted with BeautifulSoup: {url}")
             return result
@@ -119,6 +225,140 @@ class ArticleExtractor:
         logger.error(f"All extraction methods failed for: {url}")
         return result
 
+    def _extract_single_parse(self, url, response, timings):
+        """
+        단일 파싱 추출: 디코딩과 lxml 파싱을 한 번만 하고 두 휴리스틱이 같은 트리를 쓴다.
+
+        대형 한국어 기사 페이지에서는 HTML 파싱이 CPU 비용의 대부분이라,
+        newspaper 실패 시 BeautifulSoup으로 다시 파싱하던 비용을 없앤다.
+        """
+        started = time.perf_counter()
+        try:
+            import lxml.html
+
+            text = decode_html(response.body, response.headers.get('content-type'))
+            # lxml은 인코딩 선언이 있는 str을 거부하므로 XML 선언을 제거한다.
+            text = _XML_DECLARATION_RE.sub('', text, count=1)
+            tree = _SharedTree(text, lxml.html.document_fromstring(text))
+        except Exception as e:
+            logger.warning(f"HTML parsing failed: {url}, {e}")
+            return self._failure('Could not parse article HTML')
+        finally:
+            timings['parse_ms'] = _elapsed_ms(started)
+
+        started = time.perf_counter()
+        result = self._extract_with_newspaper(response.url, response.body, tree=tree)
+        timings['newspaper_ms'] = _elapsed_ms(started)
+        if result['success']:
+            logger.info(f"Successfully extracted with newspaper3k (single parse): {url}")
+            return result
+
+        logger.warning(f"newspaper3k failed, trying shared-tree fallback: {url}")
+
+        started = time.perf_counter()
+        result = self._extract_from_tree(response.url, tree.doc)
+        timings['bs4_ms'] = _elapsed_ms(started)
+        if result['success']:
+            logger.info(f"Successfully extracted with shared-tree fallback: {url}")
+            return result
+
+        logger.error(f"All extraction methods failed for: {url}")
+        return result
+
+    #######################
+    # 병렬 추출
+    #######################
+    def extract_many(self, urls, concurrency=4, per_host_limit=None):
+        """
+        여러 URL을 스레드 풀에서 동시에 추출하고, 끝나는 순서대로 결과를 내보낸다.
+
+        다운로드는 I/O 대기라 스레드로 겹칠 수 있다. 같은 호스트에는 동시에
+        per_host_limit개까지만 요청하며, 여유가 없는 호스트의 URL은 다른 호스트
+        URL이 먼저 실행되도록 대기열에 남는다.
+
+        Args:
+            urls: 기사 URL 목록
+            concurrency: 전체 동시 추출 수 (1~MAX_EXTRACT_CONCURRENCY)
+            per_host_limit: 호스트별 동시 추출 수 (기본 EXTRACT_PER_HOST_LIMIT)
+
+        Yields:
+            dict: extract 결과에 아래 키를 더한 것
+                'index': 입력 목록에서의 위치
+                'url': 요청한 URL
+                'timings': {'queue_ms', 'fetch_ms', 'parse_ms', 'newspaper_ms',
+                            'bs4_ms', 'total_ms'}
+                           (실행되지 않은 단계는 None, bs4_ms는 폴백 단계 전체)
+        """
+        if not 1 <= concurrency <= MAX_EXTRACT_CONCURRENCY:
+            raise ValueError(f"concurrency must be between 1 and {MAX_EXTRACT_CONCURRENCY}")
+        if per_host_limit is None:
+            per_host_limit = EXTRACT_PER_HOST_LIMIT
+        if per_host_limit < 1:
+            raise ValueError("per_host_limit must be at least 1")
+
+        urls = list(urls)
+        if not urls:
+            return
+
+        submitted_at = time.perf_counter()
+        pending = deque(enumerate(urls))
+        host_active = {}
+        running = {}
+
+        def _host(url):
+            try:
+                return (urlsplit(url).hostname or '').lower()
+            except ValueError:
+                return ''
+
+        def _run(index, url):
+            started = time.perf_counter()
+            timings = {
+                'queue_ms': round((started - submitted_at) * 1000, 2),
+                'fetch_ms': None,
+                'parse_ms': None,
+                'newspaper_ms': None,
+                'bs4_ms': None,
+            }
+            try:
+                result = self._extract_timed(url, timings)
+            except Exception:
+                logger.exception("Unexpected article extraction failure")
+                result = self._failure("Article extraction failed")
+            timings['total_ms'] = _elapsed_ms(started)
+            return {**result, 'index': index, 'url': url, 'timings': timings}
+
+        def _fill(executor):
+            # 입력 순서를 유지하되, 호스트 한도가 찬 URL은 건너뛰고 나중에 다시 본다.
+            skipped = deque()
+            while pending and len(running) < concurrency:
+                index, url = pending.popleft()
+                host = _host(url)
+                if host_active.get(host, 0) >= per_host_limit:
+                    skipped.append((index, url))
+                    continue
+                host_active[host] = host_active.get(host, 0) + 1
+                running[executor.submit(_run, index, url)] = host
+            pending.extendleft(reversed(skipped))
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(concurrency, len(urls)),
+            thread_name_prefix="article-extract",
+        )
+        try:
+            _fill(executor)
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    host_active[running.pop(future)] -= 1
+                # 결과를 넘기기 전에 빈 자리를 먼저 채워 다운로드가 계속 겹치게 한다.
+                _fill(executor)
+                for future in done:
+                    yield future.result()
+        finally:
+            # 소비자가 중간에 멈추면 아직 시작하지 않은 추출은 취소한다.
+            executor.shutdown(wait=False, cancel_futures=True)
+
     @staticmethod
     def _failure(error):
         return {
@@ -133,7 +373,7 @@ class ArticleExtractor:
     #######################
     # newspaper3k 추출
     #######################
-    def _extract_with_newspaper(self, url, html_content):
+    def _extract_with_newspaper(self, url, html_content, tree=None):
         """
         newspaper3k 라이브러리를 사용한 기사 추출
 
@@ -144,6 +384,8 @@ class ArticleExtractor:
 
         Args:
             url: 기사 URL
+            html_content: 응답 HTML 바이트
+            tree: 단일 파싱 모드의 _SharedTree (있으면 재디코딩/재파싱하지 않음)
 
         Returns:
             dict: 추출 결과
@@ -159,8 +401,11 @@ class ArticleExtractor:
             # 기사 객체 생성 및 다운로드
             #######################
             article = Article(url, language='ko')  # 한국어 설정
-            article.set_html(html_content.decode('utf-8', errors='replace'))
-            article.parse()     # 내용 파싱
+            if tree is None:
+                article.set_html(html_content.decode('utf-8', errors='replace'))
+                article.parse()     # 내용 파싱
+            else:
+                self._parse_shared_tree(article, tree)
 
             #######################
             # 메타데이터 추출
@@ -226,6 +471,103 @@ class ArticleExtractor:
                 'error': f'newspaper3k error: {str(e)}'
             }
 
+    @staticmethod
+    def _parse_shared_tree(article, tree):
+        """이미 파싱된 트리로 newspaper Article.parse를 실행한다."""
+        from newspaper.parsers import Parser
+
+        shared_text = tree.text
+        shared_doc = tree.doc
+
+        class _SharedTreeParser(Parser):
+            @classmethod
+            def fromstring(cls, html):
+                # 공유 트리는 페이지 전체 파싱에만 쓴다. 본문 정리(textToPara 등)가
+                # 조각 HTML을 파싱할 때는 원래대로 새 트리를 만들어야 한다.
+                if html is shared_text:
+                    return shared_doc
+                return super().fromstring(html)
+
+        article.config.get_parser = lambda: _SharedTreeParser
+        article.set_html(tree.text)
+        try:
+            article.parse()
+        finally:
+            # newspaper는 본문 계산 전에 doc을 정리(변형)하므로, 폴백은 파싱 직후
+            # 만들어 둔 사본(clean_doc)을 사용한다.
+            if article.clean_doc is not None:
+                tree.doc = article.clean_doc
+
+    #######################
+    # 공유 트리 추출 (단일 파싱 모드의 폴백)
+    #######################
+    def _extract_from_tree(self, url, doc):
+        """
+        _extract_with_bs4와 같은 휴리스틱을 이미 파싱된 lxml 트리에 적용한다.
+
+        Args:
+            url: 기사 URL
+            doc: lxml.html 문서 트리 (본문 정리 과정에서 변경됨)
+
+        Returns:
+            dict: 추출 결과
+        """
+        try:
+            #######################
+            # 제목 추출
+            #######################
+            title = None
+            title_element = doc.find('.//title')
+            if title_element is not None:
+                title = (title_element.text or '').strip() or None
+            else:
+                og_title = doc.xpath('//meta[@property="og:title"]/@content')
+                if og_title:
+                    title = og_title[0].strip()
+
+            #######################
+            # 본문 컨테이너 탐색
+            #######################
+            content = None
+            for xpath in _CONTENT_XPATHS:
+                found = doc.xpath(xpath)
+                if found:
+                    content = found[0]
+                    break
+            if content is None:
+                body = doc.xpath('//body')
+                content = body[0] if body else None
+
+            if content is None:
+                return self._failure('Could not find article content')
+
+            #######################
+            # 불필요한 요소 제거 및 텍스트 추출
+            #######################
+            for element in content.xpath('.//' + ' | .//'.join(_NOISE_TAGS)):
+                element.drop_tree()
+
+            text = '\n'.join(
+                chunk.strip() for chunk in content.itertext() if chunk.strip()
+            )
+            source = urlparse(url).netloc
+
+            if not text or len(text.strip()) < 50:
+                return self._failure('Extracted text too short or empty')
+
+            return {
+                'success': True,
+                'text': text.strip(),
+                'title': title,
+                'source': source,
+                'published_at': None,
+                'error': None
+            }
+
+        except Exception as e:
+            logger.exception("Shared-tree extraction failed")
+            return self._failure(f'Extraction error: {str(e)}')
+
     #######################
     # BeautifulSoup 추출 (폴백)
     #######################
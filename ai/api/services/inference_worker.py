@@ -0,0 +1,440 @@
+"""
+#######################
+# 추론 전용 워커 프로세스
+#######################
+# AI_INFERENCE_MODE=worker 이면 모델은 별도 프로세스(run_inference_worker)가 소유하고,
+# gunicorn HTTP 워커는 로컬 Unix 소켓으로 요청만 넘깁니다.
+# - HTTP 워커는 모델을 로드하지 않아 가볍고, 느린 LLM 생성이 sync 워커를 붙잡지 않음
+# - 추론 워커는 연결마다 스레드로 요청을 받아, 동시에 들어온 단건 요청을
+#   마이크로 배치로 묶어 처리 (댓글 필터: CommentFilterService 내부 배처,
+#   모더레이션: 이 모듈의 배처 -> batch_check)
+#
+# AI_INFERENCE_MODE=inprocess (기본, 테스트) 이면 지금까지처럼 요청 스레드에서 직접 추론합니다.
+# worker 모드에서 소켓에 연결할 수 없으면 AI_INFERENCE_FALLBACK=true일 때 in-process로 처리합니다.
+# (기본값은 DJANGO_DEBUG를 따름: 개발/테스트에서만 켜지고, 운영에서 HTTP 워커가 모델을 로드하지 않도록)
+#
+# 소켓은 요청을 unpickle하므로 AI_INFERENCE_AUTHKEY가 없으면 서버/클라이언트를 만들지 않습니다.
+# scripts/start_django.sh는 지정하지 않으면 컨테이너마다 무작위 키를 만들어 두 프로세스에 넘깁니다.
+#
+# 프로토콜: multiprocessing.connection (authkey 인증, pickle)
+#   요청 (op, kwargs) -> 응답 ('ok', 결과) | ('error', "예외 타입: 메시지")
+#######################
+"""
+import logging
+import os
+import socket
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+from .ai_summarizer import AISummarizer
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_MODE = os.getenv("AI_INFERENCE_MODE", "inprocess").lower()  # inprocess | worker
+INFERENCE_SOCKET = os.getenv("AI_INFERENCE_SOCKET", "/tmp/fanpulse-inference.sock")
+INFERENCE_AUTHKEY = os.getenv("AI_INFERENCE_AUTHKEY", "").encode()
+# 응답 대기 상한 (초): GUNICORN_TIMEOUT(120)보다 짧게
+INFERENCE_TIMEOUT = float(os.getenv("AI_INFERENCE_TIMEOUT", "110"))
+INFERENCE_FALLBACK = os.getenv(
+    "AI_INFERENCE_FALLBACK", os.getenv("DJANGO_DEBUG", "True")
+).lower() == "true"
+# 연결 실패 후 이 시간 동안은 재연결을 시도하지 않고 바로 unavailable 처리
+INFERENCE_RETRY_SECONDS = float(os.getenv("AI_INFERENCE_RETRY_SECONDS", "5"))
+# 추론 워커에서 동시 모더레이션 단건 요청을 모으는 대기 시간(ms), 0이면 비활성화
+INFERENCE_BATCH_WAIT_MS = float(os.getenv("AI_INFERENCE_BATCH_WAIT_MS", "10"))
+
+
+class InferenceUnavailable(ConnectionError):
+    """추론 워커에 연결할 수 없음 (in-process fallback 대상)"""
+
+
+class InferenceError(RuntimeError):
+    """추론 워커에서 요청 처리 중 오류 또는 응답 시간 초과"""
+
+
+def _require_authkey(authkey):
+    if not authkey:
+        from django.core.exceptions import ImproperlyConfigured
+
+        raise ImproperlyConfigured(
+            "AI_INFERENCE_AUTHKEY must be set in worker mode (the inference socket unpickles requests)"
+        )
+    return authkey
+
+
+#######################
+# 서버 (추론 워커 프로세스)
+#######################
+class InferenceServer:
+    """
+    모델을 소유하고 Unix 소켓으로 추론 요청을 처리하는 서버
+
+    사용법:
+        server = InferenceServer()
+        server.serve_forever()      # 또는 server.start() (백그라운드 스레드)
+    """
+
+    def __init__(self, address=None, authkey=None, batch_wait_ms=None):
+        self.address = address or INFERENCE_SOCKET
+        self.authkey = _require_authkey(authkey or INFERENCE_AUTHKEY)
+        self.batch_wait_ms = INFERENCE_BATCH_WAIT_MS if batch_wait_ms is None else batch_wait_ms
+        self._listener = None
+        self._ready = threading.Event()
+        self._closed = threading.Event()
+        self._lock = threading.Lock()
+        self._moderation_batchers = {}  # language -> _MicroBatcher
+        self._summarizers = {}          # language -> AISummarizer
+        self.handlers = {
+            "ping": lambda: "pong",
+            "status": self._status,
+            "summarize": self._summarize,
+            "filter_comment": self._filter_comment,
+            "batch_filter": self._batch_filter,
+            "moderate": self._moderate,
+            "moderate_batch": self._moderate_batch,
+        }
+
+    #######################
+    # 요청 처리
+    #######################
+    def _status(self):
+        from .memory_report import read_process_memory
+        from .model_preload import get_preload_status
+
+        return {"pid": os.getpid(), "preload": get_preload_status(), "memory": read_process_memory()}
+
+    def _summarize(self, text, max_length=200, min_length=50, language="ko"):
+        with self._lock:
+            summarizer = self._summarizers.setdefault(language, AISummarizer(language=language))
+        return summarizer.summarize(text=text, max_length=max_length, min_length=min_length)
+
+    def _filter_comment(self, text):
+        from . import comment_filter
+
+        return comment_filter.get_filter_service().filter_comment(text)
+
+    def _batch_filter(self, texts):
+        from . import comment_filter
+
+        return comment_filter.get_filter_service().batch_filter(texts)
+
+    def _moderation_batcher(self, language):
+        from . import ai_moderation
+        from .comment_filter import _MicroBatcher
+
+        with self._lock:
+            batcher = self._moderation_batchers.get(language)
+            if batcher is None:
+                batcher = _MicroBatcher(
+                    lambda texts: ai_moderation.get_ai_moderator(language=language).batch_check(texts),
+                    ai_moderation.MODERATION_BATCH_SIZE,
+                    self.batch_wait_ms,
+                    name=f"moderation-batcher-{language}",
+                )
+                self._moderation_batchers[language] = batcher
+        return batcher
+
+    def _moderate(self, text, use_cache=True, custom_thresholds=None, language="ko"):
+        from . import ai_moderation
+
+        # 기본 옵션 단건 요청은 다른 연결의 요청과 묶어 batch_check 한 번으로 처리
+        if use_cache and custom_thresholds is None and self.batch_wait_ms > 0:
+            return self._moderation_batcher(language).submit(text)
+        return ai_moderation.get_ai_moderator(language=language).check(
+            text, use_cache=use_cache, custom_thresholds=custom_thresholds
+        )
+
+    def _moderate_batch(self, texts, use_cache=True, language="ko"):
+        from . import ai_moderation
+
+        return ai_moderation.get_ai_moderator(language=language).batch_check(texts, use_cache)
+
+    #######################
+    # 소켓 처리
+    #######################
+    def serve_forever(self):
+        if os.path.exists(self.address):
+            os.unlink(self.address)  # 이전 프로세스가 남긴 소켓 파일
+        self._listener = Listener(self.address, family="AF_UNIX", authkey=self.authkey)
+        self._ready.set()
+        logger.info("Inference worker listening on %s (pid %s)", self.address, os.getpid())
+
+        while not self._closed.is_set():
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                if self._closed.is_set():
+                    break
+                logger.warning("Inference worker accept failed", exc_info=True)
+                continue
+            threading.Thread(
+                target=self._serve_connection, args=(conn,), name="inference-conn", daemon=True
+            ).start()
+
+    def _serve_connection(self, conn):
+        with conn:
+            while True:
+                try:
+                    op, kwargs = conn.recv()
+                except (EOFError, OSError):
+                    return
+
+                try:
+                    handler = self.handlers.get(op)
+                    if handler is None:
+                        raise ValueError(f"Unknown inference op: {op}")
+                    reply = ("ok", handler(**kwargs))
+                except Exception as e:
+                    logger.exception("Inference op failed: %s", op)
+                    reply = ("error", f"{type(e).__name__}: {e}")
+
+                try:
+                    conn.send(reply)
+                except (EOFError, OSError):
+                    return
+                except Exception as e:
+                    # 결과 직렬화 실패 등
+                    conn.send(("error", f"{type(e).__name__}: {e}"))
+
+    def start(self):
+        """백그라운드 스레드에서 serve_forever (리스닝 시작까지 대기)"""
+        thread = threading.Thread(target=self.serve_forever, name="inference-server", daemon=True)
+        thread.start()
+        self._ready.wait(5)
+        return thread
+
+    def close(self):
+        self._closed.set()
+        if self._listener is None:
+            return
+        # accept()에 막혀 있는 루프를 깨운다. 인증 없이 연결만 했다 끊으므로
+        # 루프가 이미 끝나 accept하지 않더라도 여기서 막히지 않는다.
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wake:
+                wake.connect(self.address)
+        except OSError:
+            pass
+        self._listener.close()
+        if os.path.exists(self.address):
+            os.unlink(self.address)
+
+
+#######################
+# 클라이언트 (HTTP 워커)
+#######################
+class InferenceClient:
+    """
+    추론 워커 클라이언트 (스레드마다 연결 하나를 재사용)
+    """
+
+    def __init__(self, address=None, authkey=None, timeout=None):
+        self.address = address or INFERENCE_SOCKET
+        self.authkey = _require_authkey(authkey or INFERENCE_AUTHKEY)
+        self.timeout = INFERENCE_TIMEOUT if timeout is None else timeout
+        self._local = threading.local()
+        self._down_until = 0.0
+
+    def _connect(self):
+        if time.monotonic() < self._down_until:
+            raise InferenceUnavailable(f"inference worker at {self.address} is marked down")
+        try:
+            conn = Client(self.address, family="AF_UNIX", authkey=self.authkey)
+        except (OSError, EOFError, AuthenticationError) as e:
+            self._down_until = time.monotonic() + INFERENCE_RETRY_SECONDS
+            logger.warning("Inference worker unavailable at %s: %s", self.address, e)
+            raise InferenceUnavailable(str(e)) from e
+        self._local.conn = conn
+        return conn
+
+    def _drop(self):
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def call(self, op, timeout=None, **kwargs):
+        """
+        추론 워커에서 op 실행
+
+        Raises:
+            InferenceUnavailable: 연결 실패
+            InferenceError: 워커에서 예외 발생 또는 응답 시간 초과
+        """
+        timeout = self.timeout if timeout is None else timeout
+        reused = getattr(self._local, "conn", None) is not None
+        conn = self._local.conn if reused else self._connect()
+        try:
+            conn.send((op, kwargs))
+            if not conn.poll(timeout):
+                self._drop()
+                raise InferenceError(f"inference worker timed out after {timeout:.0f}s ({op})")
+            status, payload = conn.recv()
+        except (EOFError, OSError) as e:
+            self._drop()
+            if reused:
+                # 워커 재시작 등으로 끊긴 연결이면 새 연결로 한 번 더 시도
+                return self.call(op, timeout=timeout, **kwargs)
+            raise InferenceUnavailable(str(e)) from e
+
+        if status == "error":
+            raise InferenceError(payload)
+        return payload
+
+
+_client = None
+
+
+def get_inference_client():
+    global _client
+    if _client is None:
+        _client = InferenceClient()
+    return _client
+
+
+def _call(op, run_local, **kwargs):
+    """워커로 보내고, 연결할 수 없으면 (허용 시) in-process로 실행"""
+    try:
+        return get_inference_client().call(op, **kwargs)
+    except InferenceUnavailable:
+        if not INFERENCE_FALLBACK:
+            raise
+        logger.debug("Running %s in-process (inference worker unavailable)", op)
+        return run_local()
+
+
+#######################
+# 원격 프록시 (로컬 서비스와 같은 인터페이스)
+#######################
+class RemoteModerator:
+    """AIContentModerator.check / batch_check를 추론 워커로 위임"""
+
+    def __init__(self, language="ko"):
+        self.language = language
+
+    def _local(self):
+        from . import ai_moderation
+
+        return ai_moderation.get_ai_moderator(language=self.language)
+
+    @staticmethod
+    def _error_result(error, started):
+        # 로컬 AIContentModerator.check가 예외 시 돌려주는 것과 같은 degraded 결과 (캐시하지 않음)
+        from .ai_moderation import ModerationResult
+
+        return ModerationResult(
+            is_flagged=False,
+            action='allow',
+            model_used='error',
+            processing_time_ms=int((time.monotonic() - started) * 1000),
+            error=str(error),
+        )
+
+    def check(self, text, use_cache=True, custom_thresholds=None):
+        started = time.monotonic()
+        try:
+            return _call(
+                "moderate",
+                lambda: self._local().check(text, use_cache=use_cache, custom_thresholds=custom_thresholds),
+                text=text, use_cache=use_cache, custom_thresholds=custom_thresholds, language=self.language,
+            )
+        except InferenceError as e:
+            logger.error(f"AI moderation failed: {e}")
+            return self._error_result(e, started)
+
+    def batch_check(self, texts, use_cache=True):
+        started = time.monotonic()
+        try:
+            return _call(
+                "moderate_batch",
+                lambda: self._local().batch_check(texts, use_cache),
+                texts=texts, use_cache=use_cache, language=self.language,
+            )
+        except InferenceError as e:
+            logger.error(f"AI moderation failed: {e}")
+            return [self._error_result(e, started) for _ in texts]
+
+
+class RemoteFilterService:
+    """CommentFilterService.filter_comment / batch_filter를 추론 워커로 위임"""
+
+    @staticmethod
+    def _local():
+        from . import comment_filter
+
+        return comment_filter.get_filter_service()
+
+    def filter_comment(self, text):
+        return _call("filter_comment", lambda: self._local().filter_comment(text), text=text)
+
+    def batch_filter(self, texts):
+        return _call("batch_filter", lambda: self._local().batch_filter(texts), texts=texts)
+
+
+class RemoteSummarizer(AISummarizer):
+    """AISummarizer.summarize를 추론 워커로 위임 (language/model_id는 로컬과 동일)"""
+
+    def summarize(self, text, max_length=200, min_length=50):
+        try:
+            return _call(
+                "summarize",
+                lambda: super(RemoteSummarizer, self).summarize(
+                    text=text, max_length=max_length, min_length=min_length
+                ),
+                text=text, max_length=max_length, min_length=min_length, language=self.language,
+            )
+        except InferenceError as e:
+            # 로컬 AISummarizer와 같은 예외로 바꿔 뷰의 요약 실패 처리를 그대로 탄다.
+            raise RuntimeError(f"AI summarization failed: {e}") from e
+
+
+#######################
+# 진입점 (views에서 사용)
+#######################
+def get_moderator(language="ko"):
+    if INFERENCE_MODE == "worker":
+        return RemoteModerator(language)
+    from . import ai_moderation
+
+    return ai_moderation.get_ai_moderator(language=language)
+
+
+def get_comment_filter():
+    if INFERENCE_MODE == "worker":
+        return RemoteFilterService()
+    from . import comment_filter
+
+    return comment_filter.get_filter_service()
+
+
+def get_ai_summarizer(language="ko"):
+    if INFERENCE_MODE == "worker":
+        return RemoteSummarizer(language=language)
+    return AISummarizer(language=language)
+
+
+def get_model_status():
+    """
+    /api/health용 모델 준비 상태
+
+    Returns:
+        dict: {'state', 'models', 'inference': {'mode', 'reachable'}}
+        worker 모드에서는 추론 워커의 사전 로드 상태, 연결 불가 시
+        fallback 허용이면 degraded, 아니면 warming
+    """
+    from .model_preload import STATE_DEGRADED, STATE_WARMING, get_preload_status
+
+    if INFERENCE_MODE != "worker":
+        return {**get_preload_status(), "inference": {"mode": INFERENCE_MODE, "reachable": None}}
+
+    try:
+        preload = get_inference_client().call("status", timeout=2)["preload"]
+        reachable = True
+    except (InferenceUnavailable, InferenceError):
+        preload = {"state": STATE_DEGRADED if INFERENCE_FALLBACK else STATE_WARMING, "models": {}}
+        reachable = False
+    return {**preload, "inference": {"mode": INFERENCE_MODE, "reachable": reachable}}
@@ -0,0 +1,84 @@
+"""
+#######################
+# 프로세스 메모리 리포트
+#######################
+# gunicorn 워커별 RSS와 PSS를 /proc/<pid>/smaps_rollup에서 읽습니다 (Linux 전용).
+#
+# - rss: 프로세스가 매핑한 물리 메모리 (공유 페이지를 중복해서 셈)
+# - pss: 공유 페이지를 공유한 프로세스 수로 나눈 몫 (합산해도 중복 없음)
+# - shared / private: 다른 프로세스와 공유 중인 페이지 / 이 프로세스만 쓰는 페이지
+#
+# preload-then-fork(AI_PRELOAD_MODE=master)로 모델 가중치를 copy-on-write 공유하면
+# 워커별 shared가 커지고, 모든 워커의 (RSS 합 - PSS 합)이 공유로 절약한 양이 됩니다.
+#######################
+"""
+import os
+
+SMAPS_FIELDS = {
+    "Rss": "rss_kb",
+    "Pss": "pss_kb",
+    "Shared_Clean": "shared_clean_kb",
+    "Shared_Dirty": "shared_dirty_kb",
+    "Private_Clean": "private_clean_kb",
+    "Private_Dirty": "private_dirty_kb",
+    "Swap": "swap_kb",
+}
+
+
+def read_process_memory(pid="self"):
+    """
+    프로세스 메모리 사용량 (kB)
+
+    Returns:
+        dict 또는 None (procfs가 없는 환경)
+    """
+    values = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].rstrip(":") in SMAPS_FIELDS:
+                    values[SMAPS_FIELDS[parts[0].rstrip(":")]] = int(parts[1])
+    except (OSError, ValueError):
+        return None
+
+    report = {"pid": os.getpid() if pid == "self" else int(pid)}
+    report.update({key: values.get(key, 0) for key in SMAPS_FIELDS.values()})
+    report["shared_kb"] = report["shared_clean_kb"] + report["shared_dirty_kb"]
+    report["private_kb"] = report["private_clean_kb"] + report["private_dirty_kb"]
+    return report
+
+
+def child_pids(pid):
+    """직계 자식 프로세스 pid 목록 (gunicorn master -> 워커)"""
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children", encoding="ascii") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        return []
+    return sorted(set(children))
+
+
+def worker_memory_report(master_pid):
+    """
+    gunicorn master와 워커들의 메모리 리포트
+
+    Returns:
+        dict: {'master': {...}, 'workers': [{...}], 'total': {...}}
+        total.shared_savings_kb = 워커+master RSS 합 - PSS 합 (공유로 절약한 양)
+    """
+    master = read_process_memory(master_pid)
+    workers = [
+        report for report in (read_process_memory(pid) for pid in child_pids(master_pid))
+        if report is not None
+    ]
+    processes = ([master] if master else []) + workers
+    rss = sum(p["rss_kb"] for p in processes)
+    pss = sum(p["pss_kb"] for p in processes)
+    return {
+        "master": master,
+        "workers": workers,
+        "total": {"rss_kb": rss, "pss_kb": pss, "shared_savings_kb": rss - pss},
+    }
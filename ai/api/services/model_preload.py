@@ -0,0 +1,227 @@
+"""
+#######################
+# 모델 사전 로드 (warm-up)
+#######################
+# 모델은 기본적으로 첫 요청 때 지연 로딩되는데, 배포/워커 재시작 직후 첫 요청이
+# 모델 다운로드 + 양자화 시간을 그대로 기다리다 GUNICORN_TIMEOUT에 걸리곤 합니다.
+#
+# AI_PRELOAD_MODELS에 지정한 모델을 gunicorn 워커 부팅 직후(post_worker_init)
+# 백그라운드 스레드에서 미리 로드하고, 짧은 입력으로 추론을 한 번 돌려 둡니다.
+# 진행 중에는 /api/health가 503 "warming"을 반환해 compose healthcheck가
+# 모델 준비 전에 통과하지 않습니다.
+#
+# AI_PRELOAD_MODE:
+# - worker (기본): 워커마다 각자 로드 (워커 수만큼 가중치 사본)
+# - master: gunicorn master에서 가중치를 로드한 뒤 fork (preload_app)
+#   워커들은 가중치 페이지를 copy-on-write로 공유하고, 부팅 후 워밍업만 수행
+#
+# 지원 모델 이름:
+# - moderation: 한국어 모더레이션 분류 모델 (ai_moderation)
+# - moderation_en: 다국어 모더레이션 분류 모델 (ai_moderation)
+# - comment_filter: 댓글 필터 LLM (comment_filter)
+# - summarizer: 한국어 뉴스 요약 LLM (ai_summarizer)
+#######################
+"""
+import gc
+import logging
+import os
+import threading
+import time
+
+from .memory_report import read_process_memory
+
+logger = logging.getLogger(__name__)
+
+PRELOAD_MODELS = [
+    name.strip()
+    for name in os.getenv("AI_PRELOAD_MODELS", "").split(",")
+    if name.strip()
+]
+PRELOAD_WARMUP = os.getenv("AI_PRELOAD_WARMUP", "true").lower() == "true"
+PRELOAD_MODE = os.getenv("AI_PRELOAD_MODE", "worker").lower()  # worker | master
+
+WARMUP_TEXT = "오늘 공연 정말 좋았어요. 다음 무대도 기대할게요."
+
+STATE_READY = "ready"
+STATE_WARMING = "warming"
+STATE_DEGRADED = "degraded"  # 일부 모델 로드 실패 (요청 시 지연 로딩/규칙 기반으로 동작)
+
+
+#######################
+# 모델별 로드/워밍업 함수
+#######################
+def _load_moderation(language):
+    from .ai_moderation import get_ai_moderator
+
+    moderator = get_ai_moderator(language=language)
+    model = moderator._ensure_model()
+    if model is None:
+        raise RuntimeError("moderation model not available")
+    return lambda: moderator._run_model(model, WARMUP_TEXT)
+
+
+def _load_comment_filter():
+    from .comment_filter import get_filter_service
+
+    service = get_filter_service()
+    service._ensure_model()
+    # 첫 배치에서 프롬프트 prefix KV 캐시도 함께 계산된다.
+    return lambda: service.batch_filter([WARMUP_TEXT])
+
+
+def _load_summarizer():
+    from .ai_summarizer import AISummarizer
+
+    summarizer = AISummarizer(language="ko")
+    summarizer._ensure_model()
+    return lambda: summarizer.summarize(text=WARMUP_TEXT, max_length=60, min_length=10)
+
+
+# 모델 이름 -> 로더 (로드 후 워밍업 함수 반환)
+PRELOADERS = {
+    "moderation": lambda: _load_moderation("ko"),
+    "moderation_en": lambda: _load_moderation("en"),
+    "comment_filter": _load_comment_filter,
+    "summarizer": _load_summarizer,
+}
+
+
+#######################
+# 진행 상태
+#######################
+_lock = threading.Lock()
+_started = False
+_models = {}  # 모델 이름 -> {'status', 'load_ms', 'warmup_ms', 'error'}
+
+
+def _mark_pending(names):
+    global _started
+    with _lock:
+        _started = True
+        for name in names:
+            _models[name] = {"status": "pending", "load_ms": None, "warmup_ms": None, "error": None}
+
+
+def _update(name, **fields):
+    with _lock:
+        _models[name].update(fields)
+
+
+def preload_models(names=None, warmup=None):
+    """
+    지정한 모델을 순서대로 로드하고 워밍업 추론을 실행한다 (실패해도 다음 모델 진행).
+
+    Args:
+        names: 모델 이름 목록 (기본 AI_PRELOAD_MODELS)
+        warmup: 워밍업 추론 여부 (기본 AI_PRELOAD_WARMUP)
+    """
+    names = PRELOAD_MODELS if names is None else names
+    warmup = PRELOAD_WARMUP if warmup is None else warmup
+    _mark_pending(names)
+
+    for name in names:
+        loader = PRELOADERS.get(name)
+        if loader is None:
+            logger.warning("Unknown preload model '%s' (choices: %s)", name, ", ".join(PRELOADERS))
+            _update(name, status="failed", error="unknown model")
+            continue
+
+        _update(name, status="loading")
+        started = time.monotonic()
+        try:
+            run_warmup = loader()
+            _update(name, load_ms=int((time.monotonic() - started) * 1000))
+            if warmup:
+                started = time.monotonic()
+                run_warmup()
+                _update(name, warmup_ms=int((time.monotonic() - started) * 1000))
+        except Exception as e:
+            logger.exception("Model preload failed: %s", name)
+            _update(name, status="failed", error=str(e))
+            continue
+        _update(name, status="ready")
+        logger.info("Model preloaded: %s", name)
+
+    logger.info("Model preload finished (pid %s): %s", os.getpid(), read_process_memory())
+
+
+def _cuda_available():
+    try:
+        import torch
+        return bool(torch.cuda.is_available())
+    except Exception:
+        return False
+
+
+def preload_in_master(names=None):
+    """
+    gunicorn master에서 fork 전에 가중치만 로드 (AI_PRELOAD_MODE=master, when_ready 훅)
+
+    - 워밍업 추론은 하지 않음: fork 전에 torch/OpenMP 스레드 풀이 생기면 워커에서 교착될 수 있음
+    - CUDA 컨텍스트는 fork로 물려줄 수 없으므로 GPU가 보이면 건너뛰고 워커 모드로 동작
+    - 로드 후 gc.freeze(): 이미 있는 객체를 GC 추적에서 빼서, 워커의 GC가 객체 헤더를
+      건드려 공유 페이지가 복사되는 일을 줄임
+
+    Returns:
+        bool: master에서 로드했는지
+    """
+    names = PRELOAD_MODELS if names is None else names
+    if not names:
+        return False
+    if _cuda_available():
+        logger.warning("CUDA is available; skipping master preload (models load per worker)")
+        return False
+
+    preload_models(names, warmup=False)
+    gc.collect()
+    gc.freeze()
+    return True
+
+
+def start_preload(names=None, warmup=None):
+    """
+    백그라운드 스레드에서 preload_models 실행 (gunicorn post_worker_init 훅에서 호출)
+
+    Returns:
+        threading.Thread 또는 None (사전 로드할 모델이 없을 때)
+    """
+    names = PRELOAD_MODELS if names is None else names
+    if not names:
+        return None
+
+    # 상태를 먼저 warming으로 잡아 스레드 시작 전 헬스체크도 통과하지 않게 한다.
+    _mark_pending(names)
+    thread = threading.Thread(
+        target=preload_models, args=(names, warmup), name="model-preload", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def get_preload_status():
+    """
+    Returns:
+        dict: {'state': ready|warming|degraded, 'models': {이름: 상세}}
+        사전 로드를 시작하지 않았으면(지연 로딩 모드) 항상 ready.
+    """
+    with _lock:
+        models = {name: dict(info) for name, info in _models.items()}
+        started = _started
+
+    if not started:
+        state = STATE_READY
+    elif any(info["status"] in ("pending", "loading") for info in models.values()):
+        state = STATE_WARMING
+    elif any(info["status"] == "failed" for info in models.values()):
+        state = STATE_DEGRADED
+    else:
+        state = STATE_READY
+    return {"state": state, "models": models}
+
+
+def reset_preload_state():
+    """테스트용: 진행 상태 초기화"""
+    global _started
+    with _lock:
+        _started = False
+        _models.clear()
@@ -13,6 +13,7 @@ import re
 import logging
 import urllib.request
 import urllib.parse
+import uuid
 from defusedxml import ElementTree as ET
 import json
 from datetime import datetime
@@ -38,66 +39,199 @@ NEWS_DATA_DIR = Path(__file__).parent.parent.parent / "news_data"
 # summarized_data 폴더 경로 설정
 SUMMARIZED_DATA_DIR = Path(__file__).parent.parent.parent / "summarized_data"
 
+
+def _summarized_jobs_dir():
+    """배치 요약 작업 상태 폴더 (SUMMARIZED_DATA_DIR 하위, 목록 조회 glob에는 포함되지 않음)"""
+    return SUMMARIZED_DATA_DIR / "jobs"
+
+
 # 비동기 저장을 위한 ThreadPoolExecutor
 _executor = ThreadPoolExecutor(max_workers=3)
 
+# 검색 결과 원본 기사를 동시에 추출할 개수 (ArticleExtractor.extract_many)
+NEWS_CONTENT_FETCH_CONCURRENCY = int(os.getenv("NEWS_CONTENT_FETCH_CONCURRENCY", "4"))
+
 #######################
 # Django ORM을 통한 DB 저장
 #######################
+# 한 statement에 담을 뉴스/관계 행 수 (PostgreSQL 파라미터 한도 65535 이내)
+NEWS_UPSERT_CHUNK_SIZE = 500
+NEWS_UPSERT_UPDATE_FIELDS = (
+    'title', 'content', 'origin_news', 'thumbnail_url', 'source', 'published_at',
+)
+
+
+def _chunks(values: list, size: int):
+    for index in range(0, len(values), size):
+        yield values[index:index + size]
+
+
+def _prepare_news_rows(items: list, source: str) -> dict:
+    """
+    저장 대상 아이템을 URL 기준으로 병합한다.
+
+    같은 배치에 같은 URL이 여러 번 있으면 기존 update_or_create 순차 실행과
+    동일하게 마지막 아이템의 필드가 남고 artist_ids는 합쳐진다.
+
+    Returns:
+        dict: {url: {'defaults': dict, 'artist_ids': set}} (입력 순서 유지)
+    """
+    from dateutil import parser as date_parser
+
+    rows = {}
+    for item in items:
+        # 발행일 파싱
+        published_at = None
+        if item.get('pubDate'):
+            try:
+                published_at = date_parser.parse(item['pubDate'])
+            except (TypeError, ValueError, OverflowError):
+                logger.warning("뉴스 발행일 파싱 실패: %s", item.get('pubDate'))
+
+        url = first_safe_article_url(item.get('originallink'), item.get('link'))
+        if not url:
+            logger.warning("허용 가능한 URL 없는 뉴스 스킵: %s", item.get('title', '')[:80])
+            continue
+
+        origin_news = item.get('origainal_news') or item.get('original_news') or ''
+        row = rows.setdefault(url[:500], {'defaults': None, 'artist_ids': set()})
+        row['defaults'] = {
+            'title': (item.get('title') or '제목 없음')[:255],
+            'content': item.get('description') or '',
+            'origin_news': origin_news,
+            'thumbnail_url': item.get('thumbnail_url'),
+            'source': (item.get('source') or source)[:100],
+            'published_at': published_at,
+        }
+        row['artist_ids'].update(
+            artist_id for artist_id in (item.get('artist_ids') or []) if artist_id
+        )
+    return rows
+
+
+def _upsert_news_postgresql(connection, rows: dict) -> tuple:
+    """
+    INSERT ... ON CONFLICT (url) DO UPDATE ... RETURNING으로 chunk 단위 upsert.
+
+    Flyway의 ux_crawled_news_url은 부분 UNIQUE 인덱스이므로 conflict target에
+    같은 WHERE 조건을 붙인다. xmax = 0이면 이번 statement에서 새로 INSERT된 행이다.
+
+    Returns:
+        tuple: ({url: news_id}, inserted_count)
+    """
+    from django.utils import timezone
+    from api.models import CrawledNews
+
+    meta = CrawledNews._meta
+    columns = ('id', 'created_at', 'url') + NEWS_UPSERT_UPDATE_FIELDS
+    fields = [meta.get_field(column) for column in columns]
+    quote = connection.ops.quote_name
+    column_sql = ', '.join(quote(field.column) for field in fields)
+    url_column = quote(meta.get_field('url').column)
+    update_sql = ', '.join(
+        f'{quote(meta.get_field(name).column)} = EXCLUDED.{quote(meta.get_field(name).column)}'
+        for name in NEWS_UPSERT_UPDATE_FIELDS
+    )
+    row_placeholder = '(' + ', '.join(['%s'] * len(fields)) + ')'
+
+    now = timezone.now()
+    ids_by_url = {}
+    inserted = 0
+    with connection.cursor() as cursor:
+        for chunk in _chunks(list(rows.items()), NEWS_UPSERT_CHUNK_SIZE):
+            params = []
+            for url, row in chunk:
+                values = {'id': uuid.uuid4(), 'created_at': now, 'url': url, **row['defaults']}
+                params.extend(
+                    field.get_db_prep_save(values[field.name], connection) for field in fields
+                )
+            cursor.execute(
+                f'INSERT INTO {quote(meta.db_table)} ({column_sql}) '
+                f'VALUES {", ".join([row_placeholder] * len(chunk))} '
+                f'ON CONFLICT ({url_column}) '
+                f"WHERE {url_column} IS NOT NULL AND BTRIM({url_column}) <> '' "
+                f'DO UPDATE SET {update_sql} '
+                f'RETURNING {quote(meta.pk.column)}, {url_column}, (xmax = 0)',
+                params,
+            )
+            for news_id, url, created in cursor.fetchall():
+                ids_by_url[url] = news_id
+                if created:
+                    inserted += 1
+    return ids_by_url, inserted
+
+
+def _upsert_news_fallback(rows: dict) -> tuple:
+    """
+    SQLite 등 ON CONFLICT/xmax를 쓸 수 없는 DB용 집합 기반 upsert.
+
+    Django 테스트 DB의 crawled_news에는 url 물리 UNIQUE 제약이 없으므로(Flyway 소유)
+    기존 URL을 한 번에 조회한 뒤 신규는 bulk_create, 기존은 bulk_update로 나눈다.
+    """
+    from api.models import CrawledNews
+
+    urls = list(rows)
+    ids_by_url = {}
+    for chunk in _chunks(urls, NEWS_UPSERT_CHUNK_SIZE):
+        ids_by_url.update(CrawledNews.objects.filter(url__in=chunk).values_list('url', 'id'))
+
+    new_news = []
+    existing_news = []
+    for url, row in rows.items():
+        if url in ids_by_url:
+            existing_news.append(CrawledNews(id=ids_by_url[url], url=url, **row['defaults']))
+        else:
+            news = CrawledNews(url=url, **row['defaults'])
+            ids_by_url[url] = news.id
+            new_news.append(news)
+
+    if new_news:
+        CrawledNews.objects.bulk_create(new_news, batch_size=NEWS_UPSERT_CHUNK_SIZE)
+    if existing_news:
+        CrawledNews.objects.bulk_update(
+            existing_news,
+            list(NEWS_UPSERT_UPDATE_FIELDS),
+            batch_size=NEWS_UPSERT_CHUNK_SIZE,
+        )
+    return ids_by_url, len(new_news)
+
+
 def save_news_to_db(items: list, source: str = 'naver') -> dict:
     """
     뉴스 데이터를 PostgreSQL DB에 저장 (Django ORM 사용)
 
+    아이템마다 update_or_create를 하지 않고 배치 전체를 chunk 단위 upsert와
+    관계 bulk insert 몇 개의 statement로 처리한다. 한 트랜잭션으로 묶어
+    중간 실패 시 배치 전체가 롤백된다.
+
     Args:
         items: 뉴스 아이템 리스트
         source: 뉴스 출처 (기본값: 'naver')
 
     Returns:
         dict: {'success': bool, 'count': int, 'error': str}
+            count는 이번 호출로 새로 INSERT된 뉴스 수
     """
     try:
-        from api.models import CrawledNews, CrawledNewsArtist
-        from dateutil import parser as date_parser
-        from django.db import transaction
+        from api.models import CrawledNewsArtist
+        from django.db import connection, transaction
 
+        rows = _prepare_news_rows(items, source)
         saved_count = 0
-        with transaction.atomic():
-            for item in items:
-                # 발행일 파싱
-                published_at = None
-                if item.get('pubDate'):
-                    try:
-                        published_at = date_parser.parse(item['pubDate'])
-                    except (TypeError, ValueError, OverflowError):
-                        logger.warning("뉴스 발행일 파싱 실패: %s", item.get('pubDate'))
-
-                url = first_safe_article_url(item.get('originallink'), item.get('link'))
-                if not url:
-                    logger.warning("허용 가능한 URL 없는 뉴스 스킵: %s", item.get('title', '')[:80])
-                    continue
-
-                origin_news = item.get('origainal_news') or item.get('original_news') or ''
-                news, created = CrawledNews.objects.update_or_create(
-                    url=url[:500],
-                    defaults={
-                        'title': (item.get('title') or '제목 없음')[:255],
-                        'content': item.get('description') or '',
-                        'origin_news': origin_news,
-                        'thumbnail_url': item.get('thumbnail_url'),
-                        'source': (item.get('source') or source)[:100],
-                        'published_at': published_at,
-                    },
-                )
-                artist_ids = {
-                    artist_id for artist_id in (item.get('artist_ids') or []) if artist_id
-                }
-                if artist_ids:
-                    CrawledNewsArtist.objects.bulk_create(
-                        [CrawledNewsArtist(news=news, artist_id=artist_id) for artist_id in artist_ids],
-                        ignore_conflicts=True,
-                    )
-                if created:
-                    saved_count += 1
+        if rows:
+            with transaction.atomic():
+                if connection.vendor == 'postgresql':
+                    ids_by_url, saved_count = _upsert_news_postgresql(connection, rows)
+                else:
+                    ids_by_url, saved_count = _upsert_news_fallback(rows)
+
+                relations = [
+                    CrawledNewsArtist(news_id=ids_by_url[url], artist_id=artist_id)
+                    for url, row in rows.items()
+                    for artist_id in sorted(row['artist_ids'])
+                ]
+                for chunk in _chunks(relations, NEWS_UPSERT_CHUNK_SIZE):
+                    CrawledNewsArtist.objects.bulk_create(chunk, ignore_conflicts=True)
 
         logger.info(f"DB 저장 완료: {saved_count}개")
         return {
@@ -379,18 +513,21 @@ class NaverNewsCrawler:
         except Exception:
             return pub_date
 
-    def _fetch_original_content(self, url: str) -> str:
-        """원본 기사 내용 추출"""
+    def _fetch_original_contents(self, urls: list) -> list:
+        """원본 기사 내용을 병렬로 추출해 입력 순서대로 반환 (실패는 빈 문자열)"""
+        contents = [""] * len(urls)
         try:
             from .extractor import ArticleExtractor
-            extractor = ArticleExtractor()
-            result = extractor.extract(url)
-            if result['success']:
-                return result['text']
-            return ""
+            for result in ArticleExtractor().extract_many(
+                urls, concurrency=NEWS_CONTENT_FETCH_CONCURRENCY
+            ):
+                if result['success']:
+                    contents[result['index']] = result['text']
+                else:
+                    logger.warning(f"원본 기사 추출 실패: {result['url']}, {result['error']}")
         except Exception as e:
-            logger.warning(f"원본 기사 추출 실패: {url}, {e}")
-            return ""
+            logger.warning(f"원본 기사 병렬 추출 실패: {e}")
+        return contents
 
     def _prepare_save_items(self, items: list, query: str, fetch_content: bool = True) -> list:
         """저장할 아이템 데이터 준비"""
@@ -407,13 +544,18 @@ class NaverNewsCrawler:
                 "saved_at": datetime.now().isoformat()
             }
 
-            # 원본 기사 내용 추출
-            if fetch_content:
-                url = item.get('originallink') or item.get('link')
-                if url:
-                    save_item["origainal_news"] = self._fetch_original_content(url)
-
             save_items.append(save_item)
+
+        # 원본 기사 내용 추출 (다운로드를 겹쳐서 병렬 처리)
+        if fetch_content:
+            targets = [
+                (save_item, item.get('originallink') or item.get('link'))
+                for save_item, item in zip(save_items, items)
+            ]
+            targets = [(save_item, url) for save_item, url in targets if url]
+            contents = self._fetch_original_contents([url for _, url in targets])
+            for (save_item, _), content in zip(targets, contents):
+                save_item["origainal_news"] = content
         return save_items
 
     def _save_to_json_sync(self, save_items: list, query: str) -> dict:
@@ -890,6 +1032,88 @@ class SummarizedNewsManager:
             logger.exception(f"요약 파일 삭제 오류: {filename}")
             return {'success': False, 'error': str(e)}
 
+    #######################
+    # 배치 요약 작업 상태 (summarized_data/jobs/<job_id>.json)
+    #######################
+    # 작업은 요청을 받은 gunicorn 워커에서 실행되지만, 상태 조회는 다른 워커로 갈 수 있으므로
+    # 진행 상태를 파일로 남겨 어느 워커에서든 읽을 수 있게 합니다.
+    @staticmethod
+    def _job_state_path(job_id: str):
+        if not re.fullmatch(r'[0-9a-f]{32}', job_id or ''):
+            return None
+        return _summarized_jobs_dir() / f"{job_id}.json"
+
+    @staticmethod
+    def save_job_state(job_id: str, state: dict) -> bool:
+        """작업 상태 스냅샷 저장 (임시 파일에 쓴 뒤 교체해 부분 쓰기를 읽지 않게 함)"""
+        file_path = SummarizedNewsManager._job_state_path(job_id)
+        if file_path is None:
+            return False
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = file_path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, file_path)
+            return True
+        except Exception:
+            logger.exception(f"요약 작업 상태 저장 오류: {job_id}")
+            return False
+
+    @staticmethod
+    def touch_job_state(job_id: str) -> bool:
+        """내용은 그대로 두고 상태 파일 수정 시각만 갱신 (실행 중인 작업의 heartbeat)"""
+        file_path = SummarizedNewsManager._job_state_path(job_id)
+        if file_path is None:
+            return False
+        try:
+            os.utime(file_path)
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def job_state_updated_at(job_id: str):
+        """상태 파일 마지막 갱신 시각 (epoch 초, 없으면 None)"""
+        file_path = SummarizedNewsManager._job_state_path(job_id)
+        if file_path is None:
+            return None
+        try:
+            return file_path.stat().st_mtime
+        except OSError:
+            return None
+
+    @staticmethod
+    def read_job_state(job_id: str):
+        """작업 상태 스냅샷 읽기 (없으면 None)"""
+        file_path = SummarizedNewsManager._job_state_path(job_id)
+        if file_path is None or not file_path.exists():
+            return None
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"요약 작업 상태 읽기 실패: {job_id}, {e}")
+            return None
+
+    @staticmethod
+    def delete_expired_job_states(max_age_seconds: float) -> int:
+        """마지막 갱신 후 max_age_seconds가 지난 작업 상태 파일 삭제"""
+        jobs_dir = _summarized_jobs_dir()
+        if not jobs_dir.exists():
+            return 0
+
+        deadline = datetime.now().timestamp() - max_age_seconds
+        deleted = 0
+        for file_path in jobs_dir.glob("*.json"):
+            try:
+                if file_path.stat().st_mtime < deadline:
+                    file_path.unlink()
+                    deleted += 1
+            except OSError:
+                pass
+        return deleted
+
     #######################
     # PostgreSQL 저장 (주석 처리)
     #######################
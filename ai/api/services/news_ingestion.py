@@ -2,7 +2,9 @@
 
 import logging
 import os
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Callable, Iterable, Mapping, Optional, Protocol
 
 from .news_crawler import GoogleNewsRssCrawler, NaverNewsCrawler, save_news_to_db
@@ -11,6 +13,8 @@ from .url_security import first_safe_article_url
 
 logger = logging.getLogger(__name__)
 
+MAX_COLLECTION_CONCURRENCY = 32
+
 
 def _safe_error_text(error: Exception) -> str:
     message = " ".join(str(error).split()) or "unknown error"
@@ -87,41 +91,92 @@ def load_active_artist_targets(connection, max_artists: int) -> list[ArtistNewsT
     return targets
 
 
+@dataclass
+class _QueryOutcome:
+    """검색어 하나의 조회 결과. 병합은 target 순서대로 호출자가 수행한다."""
+    target: ArtistNewsTarget
+    items: list = field(default_factory=list)
+    fetched: int = 0
+    error: Optional[str] = None
+    latency_ms: int = 0
+
+
+def _run_query(crawler: NewsCrawler, target: ArtistNewsTarget, display: int, source: str) -> _QueryOutcome:
+    """공급원 조회와 URL 안전성 검증(DNS 포함)을 worker 안에서 함께 끝낸다."""
+    outcome = _QueryOutcome(target=target)
+    started = time.perf_counter()
+    try:
+        result = crawler.search(target.query, display=display)
+    except Exception as error:
+        logger.exception(
+            "News provider query failed for artist_id=%s source=%s",
+            target.artist_id,
+            source,
+        )
+        outcome.error = _safe_error_text(error)
+        result = None
+
+    if result is not None:
+        if not result.get("success"):
+            outcome.error = result.get("error") or "unknown error"
+        else:
+            items = result.get("items") or []
+            outcome.fetched = len(items)
+            for item in items:
+                url = first_safe_article_url(item.get("originallink"), item.get("link"))
+                if url:
+                    outcome.items.append((url, item))
+
+    outcome.latency_ms = int((time.perf_counter() - started) * 1000)
+    return outcome
+
+
 def collect_news(
     crawler: NewsCrawler,
     targets: Iterable[ArtistNewsTarget],
     display: int,
     source: str,
     save_fn: Callable[[list, str], dict] = save_news_to_db,
+    concurrency: int = 1,
 ) -> dict:
-    """검색어별 실제 기사 메타데이터를 수집하고 URL 기준으로 한 번만 저장한다."""
+    """검색어별 실제 기사 메타데이터를 수집하고 URL 기준으로 한 번만 저장한다.
+
+    concurrency > 1이면 검색어를 thread pool로 동시에 조회한다. 결과 병합은 항상
+    target 순서대로 하므로 URL 중복 제거와 artist_ids 순서는 순차 실행과 같다.
+    """
     target_list = list(targets)
+    if not 1 <= concurrency <= MAX_COLLECTION_CONCURRENCY:
+        raise ValueError(f"concurrency must be between 1 and {MAX_COLLECTION_CONCURRENCY}")
+
+    started = time.perf_counter()
+    workers = min(concurrency, len(target_list))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="collect-news") as executor:
+            outcomes = list(executor.map(
+                lambda target: _run_query(crawler, target, display, source),
+                target_list,
+            ))
+    else:
+        outcomes = [_run_query(crawler, target, display, source) for target in target_list]
+
     items_by_url: dict[str, dict] = {}
     fetched = 0
     errors = []
-
-    for target in target_list:
-        query = target.query
-        try:
-            result = crawler.search(query, display=display)
-        except Exception as error:
-            logger.exception(
-                "News provider query failed for artist_id=%s source=%s",
-                target.artist_id,
-                source,
-            )
-            errors.append(f"query={target.name}: {_safe_error_text(error)}")
-            continue
-        if not result.get("success"):
-            errors.append(f"query={target.name}: {result.get('error') or 'unknown error'}")
+    query_latency_ms = []
+
+    for outcome in outcomes:
+        target = outcome.target
+        query_latency_ms.append({
+            "artist_id": target.artist_id,
+            "latency_ms": outcome.latency_ms,
+            "success": outcome.error is None,
+        })
+        if outcome.error is not None:
+            errors.append(f"query={target.name}: {outcome.error}")
             continue
 
-        items = result.get("items") or []
-        fetched += len(items)
-        for item in items:
-            url = first_safe_article_url(item.get("originallink"), item.get("link"))
-            if not url:
-                continue
+        fetched += outcome.fetched
+        for url, item in outcome.items:
             stored = items_by_url.get(url)
             if stored is None:
                 stored = dict(item)
@@ -133,6 +188,7 @@ def collect_news(
                 stored["artist_ids"].append(target.artist_id)
 
     unique_items = list(items_by_url.values())
+    fetch_elapsed_ms = int((time.perf_counter() - started) * 1000)
 
     save_result = save_fn(unique_items, source) if unique_items else {
         "success": True,
@@ -149,4 +205,7 @@ def collect_news(
         "inserted": save_result.get("count", 0),
         "failed_queries": len(errors),
         "errors": errors,
+        "concurrency": max(workers, 1),
+        "fetch_elapsed_ms": fetch_elapsed_ms,
+        "query_latency_ms": query_latency_ms,
     }
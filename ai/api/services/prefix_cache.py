@@ -0,0 +1,127 @@
+"""
+#######################
+# 프롬프트 prefix KV 캐시
+#######################
+# 댓글 필터/뉴스 요약 프롬프트는 긴 고정 지시문 뒤에 가변 텍스트가 붙는 구조입니다.
+# 고정 지시문(prefix)의 past_key_values를 모델 로드당 한 번만 계산해 두고,
+# 요청마다 가변 부분만 prefill 하도록 generate/forward에 넘겨줍니다.
+#
+# 안전장치:
+# - 전체 프롬프트를 토큰화한 결과가 prefix 토큰으로 시작할 때만 재사용합니다.
+#   (경계에서 토큰이 합쳐지는 토크나이저라면 자동으로 전체 prefill로 폴백)
+# - 요청마다 캐시 사본을 넘기므로 generate가 캐시를 확장해도 원본은 그대로입니다.
+#######################
+"""
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+PROMPT_PREFIX_CACHE_ENABLED = os.getenv("PROMPT_PREFIX_CACHE_ENABLED", "true").lower() == "true"
+
+# 이름별 prefix 캐시 (metrics 노출용)
+_prefix_caches = {}
+_registry_lock = threading.Lock()
+
+
+class PromptPrefixCache:
+    """
+    로드된 모델 하나와 고정 prefix 하나에 대한 KV 캐시.
+
+    사용법:
+        cache = PromptPrefixCache('comment_filter', tokenizer, model, FILTER_PROMPT_PREFIX)
+        if cache.matches(input_ids):
+            past = cache.past_key_values(batch_size)
+    """
+
+    def __init__(self, name, tokenizer, model, prefix_text):
+        self.name = name
+        self.model = model
+        self.prefix_ids = list(tokenizer(prefix_text)["input_ids"])
+        self._legacy = None
+        self._lock = threading.Lock()
+        self.reused_prompts = 0
+        self.fallback_prompts = 0
+        with _registry_lock:
+            _prefix_caches[name] = self
+
+    @property
+    def prefix_length(self):
+        return len(self.prefix_ids)
+
+    def matches(self, input_ids):
+        """프롬프트 토큰이 prefix 토큰으로 시작하고 뒤에 가변 토큰이 남는지 확인한다."""
+        length = self.prefix_length
+        return len(input_ids) > length and list(input_ids[:length]) == self.prefix_ids
+
+    def record(self, reused, fallback=0):
+        with self._lock:
+            self.reused_prompts += reused
+            self.fallback_prompts += fallback
+
+    def past_key_values(self, batch_size):
+        """배치 크기에 맞게 복제한 prefix 캐시 사본을 반환한다."""
+        legacy = self._ensure_prefix()
+        layers = tuple(
+            tuple(tensor.expand(batch_size, *tensor.shape[1:]).clone() for tensor in layer)
+            for layer in legacy
+        )
+        try:
+            from transformers import DynamicCache
+            return DynamicCache.from_legacy_cache(layers)
+        except (ImportError, AttributeError):
+            return layers
+
+    def _ensure_prefix(self):
+        with self._lock:
+            if self._legacy is None:
+                input_ids = torch.tensor([self.prefix_ids], device=self.model.device)
+                with torch.no_grad():
+                    outputs = self.model(input_ids=input_ids, use_cache=True)
+                past = outputs.past_key_values
+                self._legacy = past.to_legacy_cache() if hasattr(past, "to_legacy_cache") else past
+                logger.info("Prompt prefix cache ready: %s (%d tokens)", self.name, self.prefix_length)
+            return self._legacy
+
+    def stats(self):
+        with self._lock:
+            return {
+                "prefix_tokens": self.prefix_length,
+                "ready": self._legacy is not None,
+                "reused_prompts": self.reused_prompts,
+                "fallback_prompts": self.fallback_prompts,
+                "saved_prefill_tokens": self.reused_prompts * self.prefix_length,
+            }
+
+
+def pad_after_prefix(tokenizer, rows, prefix_length):
+    """
+    공유 prefix 뒤, 가변 부분 앞에 패딩을 넣는다.
+
+    prefix KV 캐시는 패딩 없이 계산되므로 왼쪽 패딩 대신 prefix와 가변 부분 사이를
+    채운다. 모든 행의 마지막 위치는 여전히 프롬프트의 마지막 토큰이다.
+    """
+    width = max(len(row) for row in rows)
+    input_ids, attention_mask = [], []
+    for row in rows:
+        padding = width - len(row)
+        input_ids.append(row[:prefix_length] + [tokenizer.pad_token_id] * padding + row[prefix_length:])
+        attention_mask.append([1] * prefix_length + [0] * padding + [1] * (len(row) - prefix_length))
+    return tokenizer.pad(
+        {"input_ids": input_ids, "attention_mask": attention_mask},
+        padding=True,
+        return_tensors="pt",
+    )
+
+
+def get_prefix_cache_stats():
+    """prefix 캐시별 재사용 횟수와 절약한 prefill 토큰 수를 반환한다."""
+    with _registry_lock:
+        caches = dict(_prefix_caches)
+    return {name: cache.stats() for name, cache in caches.items()}
@@ -0,0 +1,141 @@
+"""
+#######################
+# 결과 캐시 (LRU + TTL)
+#######################
+# 요약/모더레이션처럼 계산 비용이 큰 결과를 재사용하기 위한 공용 캐시입니다.
+#
+# 구조:
+# - 1차: 프로세스 내 OrderedDict LRU (조회/저장/제거 모두 O(1), 스레드 안전)
+# - 2차(선택): Django 캐시 백엔드 (settings.CACHES, Redis 등으로 워커 간 공유)
+#
+# 2차 백엔드 오류는 경고만 남기고 캐시 miss로 처리합니다.
+#######################
+"""
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# 2차 백엔드 저장 형식이 바뀌면 버전을 올려 이전 형식의 항목을 읽지 않게 한다.
+# (v2: 값 대신 (TTL, 값) 튜플 저장)
+CACHE_KEY_PREFIX = "fanpulse:v2:"
+
+
+class ResultCache:
+    """
+    네임스페이스별 LRU+TTL 결과 캐시.
+
+    사용법:
+        cache = ResultCache('summary', maxsize=256, ttl=3600)
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.set(key, value)
+    """
+
+    def __init__(self, namespace, maxsize, ttl, use_django=False):
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.use_django = use_django
+        self._entries = OrderedDict()   # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0    # 용량 초과로 밀려난 항목 수
+        self.expirations = 0  # TTL 만료로 제거된 항목 수
+
+    @property
+    def enabled(self):
+        return self.ttl > 0 and (self.maxsize > 0 or self.use_django)
+
+    def _backend_key(self, key):
+        # memcached 등 키 길이/문자 제한이 있는 백엔드를 위해 해시를 쓴다.
+        # (키는 문자열 또는 이미 해시된 bytes digest)
+        raw = key if isinstance(key, bytes) else key.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        return f"{CACHE_KEY_PREFIX}{self.namespace}:{digest}"
+
+    def get(self, key):
+        """만료되지 않은 값을 반환한다 (없으면 None)."""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.expirations += 1
+
+        stored = self._backend_get(key)
+        with self._lock:
+            if stored is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        ttl, value = stored
+        self._store_local(key, value, ttl)
+        return value
+
+    def set(self, key, value, ttl=None):
+        """값을 저장한다. ttl을 주면 이 항목에만 기본 TTL 대신 적용 (0 이하면 저장 안 함)."""
+        ttl = self.ttl if ttl is None else ttl
+        if not self.enabled or ttl <= 0:
+            return
+        self._store_local(key, value, ttl)
+        if self.use_django:
+            try:
+                from django.core.cache import cache
+                # 다른 워커가 로컬에 채울 때도 같은 TTL을 쓰도록 함께 저장
+                cache.set(self._backend_key(key), (ttl, value), timeout=ttl)
+            except Exception:
+                logger.warning("Result cache backend write failed (%s)", self.namespace, exc_info=True)
+
+    def _store_local(self, key, value, ttl=None):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _backend_get(self, key):
+        if not self.use_django:
+            return None
+        try:
+            from django.core.cache import cache
+            return cache.get(self._backend_key(key))
+        except Exception:
+            logger.warning("Result cache backend read failed (%s)", self.namespace, exc_info=True)
+            return None
+
+    def clear(self):
+        """프로세스 내 항목과 통계를 비운다 (공유 백엔드는 TTL로 만료)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            self.evictions = self.expirations = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "backend": "django" if self.use_django else "local",
+            }
@@ -13,15 +13,76 @@
 # 2. 단어 빈도수 계산 (자주 나오는 단어 = 중요한 단어)
 # 3. 각 문장의 점수 계산 (중요 단어가 많은 문장 = 높은 점수)
 # 4. 점수가 높은 문장들을 선택하여 요약 구성
-# 5. 키워드와 핵심 포인트 추출
+# 5. 키워드와 핵심 포인트 추출 (키워드는 corpus_index의 crawled_news 문서 빈도로 흔한 단어를 낮춤)
+#
+# 토큰화는 기사당 한 번: 문장별로 잘라 소문자화한 단어 토큰을 하나의 배열에 이어 붙이고
+# 문장마다 (시작, 끝) 토큰 범위를 기록해 빈도 계산/문장 점수/키워드가 모두 이 배열을 공유합니다.
+#
+# 여러 기사를 한 번에 요약할 때는 summarize_many()가 CPU 코어 수만큼의
+# 프로세스 풀에 기사 묶음(chunk)을 나눠 보냅니다 (순수 Python이라 스레드로는 GIL에 막힘).
 #######################
 """
+import heapq
 import logging
+import math
+import multiprocessing
+import os
 import re
+import threading
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple
 
 logger = logging.getLogger(__name__)
 
+# 배치 요약 프로세스 수 (0이면 CPU 코어 수 / GUNICORN_WORKERS)
+# gunicorn 워커마다 풀을 따로 만들므로 코어를 워커 수로 나눠 과다 구독을 막는다.
+SUMMARY_RULE_WORKERS = int(os.getenv("SUMMARY_RULE_WORKERS", "0")) or max(
+    1, (os.cpu_count() or 1) // max(1, int(os.getenv("GUNICORN_WORKERS", "1")))
+)
+# 기사 수가 이보다 적으면 프로세스 간 전송 비용이 더 커서 현재 프로세스에서 처리
+SUMMARY_RULE_POOL_MIN_ITEMS = int(os.getenv("SUMMARY_RULE_POOL_MIN_ITEMS", "16"))
+# 프로세스당 chunk 수 (클수록 기사 길이 편차에 따른 부하 불균형이 줄고 전송 횟수는 늘어남)
+SUMMARY_RULE_CHUNKS_PER_WORKER = 4
+
+#######################
+# 정규식 / 불용어 (모듈 로드 시 한 번만 생성)
+#######################
+WORD_PATTERN = re.compile(r'\b\w+\b')
+SENTENCE_SPLIT_PATTERNS = {
+    # 한국어: 문장 부호 + 공백으로 분리
+    'ko': re.compile(r'[.!?]\s+'),
+    # 영어: 문장 부호 뒤 공백으로 분리 (부호 유지)
+    'en': re.compile(r'(?<=[.!?])\s+'),
+}
+# 이 길이 이하(공백 제거 후)의 문장은 요약 후보에서 제외
+MIN_SENTENCE_LENGTH = 10
+
+# 불용어: 의미 없이 자주 등장하는 단어 (조사, 관사 등)
+FREQUENCY_STOP_WORDS = frozenset([
+    # 영어 불용어
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    # 한국어 불용어 (조사)
+    '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도'
+])
+# 키워드 추출용 확장 불용어 목록
+KEYWORD_STOP_WORDS = FREQUENCY_STOP_WORDS | frozenset([
+    # 영어 불용어
+    'this', 'that', 'with', 'from', 'by', 'as', 'be', 'have', 'has',
+    # 한국어 불용어
+    '있다', '없다', '하다', '되다', '이다'
+])
+
+
+class TextAnalysis(NamedTuple):
+    """문장 분리 + 토큰화 결과 (기사 한 건)"""
+    text: str            # 정제된 원문
+    sentences: list      # 요약 후보 문장
+    tokens: list         # 전체 소문자 단어 토큰
+    spans: list          # 문장별 (시작, 끝) tokens 범위
+    word_counts: Counter  # 불용어/1글자 단어를 제외한 단어별 등장 횟수
+
 
 #######################
 # 규칙 기반 요약기 클래스
@@ -40,6 +101,9 @@ class ArticleSummarizer:
         result = summarizer.summarize(text, max_length=200, min_length=50)
     """
 
+    # 요약 캐시 키에 들어가는 알고리즘 버전 (결과가 달라지는 변경 시 올릴 것)
+    model_id = 'rule-v3'
+
     def __init__(self, language='ko'):
         """
         요약기 초기화
@@ -79,7 +143,7 @@ class ArticleSummarizer:
 
         처리 과정:
         1. 텍스트 정제 (공백 정리 등)
-        2. 문장 분리
+        2. 문장 분리 + 토큰화 (한 번)
         3. 단어 빈도 계산
         4. 문장 점수 계산
         5. 상위 점수 문장 선택
@@ -87,49 +151,85 @@ class ArticleSummarizer:
         """
 
         #######################
-        # 1단계: 텍스트 정제
+        # 1~3단계: 정제, 문장 분리 + 토큰화, 단어 빈도
         #######################
-        text = self._clean_text(text)
+        analysis = self._analyze(text)
+
+        # 문장이 없으면 원문 일부 반환
+        if not analysis.sentences:
+            return self._empty_result(analysis.text, max_length)
 
         #######################
-        # 2단계: 문장 분리
+        # 4단계: 문장 점수 계산
         #######################
-        sentences = self._split_sentences(text)
+        word_freq = self._calculate_word_frequency(analysis.word_counts)
+        sentence_scores = self._score_sentences(analysis.tokens, analysis.spans, word_freq)
 
-        # 문장이 없으면 원문 일부 반환
-        if not sentences:
-            return {
-                'summary': text[:max_length],
-                'bullets': ['내용 분석 실패'],
-                'keywords': []
-            }
+        #######################
+        # 5~7단계: 문장 선택, 핵심 포인트, 키워드
+        #######################
+        return self._compose(analysis, sentence_scores, max_length, min_length)
+
+    def _analyze(self, text):
+        """
+        점수 계산 전 단계 (정제 → 문장 분리 + 토큰화 → 단어 수 집계)
+
+        점수 방식만 다른 요약기(vector_summarizer)도 이 결과를 공유합니다.
+
+        Returns:
+            TextAnalysis
+        """
+        #######################
+        # 1단계: 텍스트 정제
+        #######################
+        text = self._clean_text(text)
 
         #######################
-        # 3단계: 단어 빈도 계산
+        # 2단계: 문장 분리 + 토큰화
         #######################
-        word_freq = self._calculate_word_frequency(text)
+        sentences, tokens, spans = self._tokenize(text)
 
         #######################
-        # 4단계: 문장 점수 계산
+        # 3단계: 단어 빈도 계산
         #######################
-        sentence_scores = self._score_sentences(sentences, word_freq)
+        word_counts = self._count_words(tokens) if sentences else Counter()
+        return TextAnalysis(text, sentences, tokens, spans, word_counts)
+
+    def _empty_result(self, text, max_length):
+        return {
+            'summary': text[:max_length],
+            'bullets': ['내용 분석 실패'],
+            'keywords': []
+        }
+
+    def _compose(self, analysis, sentence_scores, max_length, min_length):
+        """
+        문장 점수로 요약/핵심 포인트/키워드 구성
+
+        Returns:
+            dict: {'summary', 'bullets', 'keywords'}
+        """
+        sentences = analysis.sentences
 
         #######################
         # 5단계: 상위 문장 선택
         #######################
-        summary_sentences = self._select_top_sentences(
+        # 문장 내용이 아닌 인덱스로 관리 (같은 문장이 여러 번 나와도 각각 한 번씩만 선택)
+        selected = self._select_top_indices(
             sentences,
             sentence_scores,
             max_length
         )
 
         # 선택된 문장들을 연결하여 요약 생성
-        summary = ' '.join(summary_sentences)
-
-        # 최소 길이 보장: 요약이 너무 짧으면 문장 추가
-        if len(summary) < min_length and len(sentences) > len(summary_sentences):
-            remaining = [s for s in sentences if s not in summary_sentences]
-            for sent in remaining:
+        summary = ' '.join(sentences[i] for i in selected)
+
+        # 최소 길이 보장: 요약이 너무 짧으면 선택되지 않은 문장을 원문 순서로 추가
+        if len(summary) < min_length and len(sentences) > len(selected):
+            chosen = set(selected)
+            for index, sent in enumerate(sentences):
+                if index in chosen:
+                    continue
                 if len(summary) + len(sent) <= max_length:
                     summary += ' ' + sent
                 if len(summary) >= min_length:
@@ -143,7 +243,7 @@ class ArticleSummarizer:
         #######################
         # 7단계: 키워드 추출
         #######################
-        keywords = self._extract_keywords(text)
+        keywords = self._extract_keywords(analysis.word_counts)
 
         return {
             'summary': summary.strip(),
@@ -162,78 +262,73 @@ class ArticleSummarizer:
         - 연속된 공백을 하나로 통합
         - 앞뒤 공백 제거
         """
-        text = re.sub(r'\s+', ' ', text)  # 연속 공백 → 단일 공백
-        return text.strip()
+        # 연속 공백 → 단일 공백 (str.split()은 정규식 \s와 같은 유니코드 공백 기준)
+        return ' '.join(text.split())
 
     #######################
-    # 문장 분리
+    # 문장 분리 + 토큰화
     #######################
-    def _split_sentences(self, text):
+    def _tokenize(self, text):
         """
-        텍스트를 문장 단위로 분리
+        텍스트를 문장 단위로 분리하면서 단어 토큰을 한 번에 추출
 
-        언어별 처리:
-        - 한국어: 마침표, 느낌표, 물음표 기준 분리
-        - 영어: 문장 부호 뒤 공백 기준 분리
-        """
-        if self.language == 'ko':
-            # 한국어: 문장 부호 + 공백으로 분리
-            sentences = re.split(r'[.!?]\s+', text)
-        else:
-            # 영어: 문장 부호 뒤 공백으로 분리 (부호 유지)
-            sentences = re.split(r'(?<=[.!?])\s+', text)
+        언어별 문장 분리:
+        - 한국어: 마침표, 느낌표, 물음표 + 공백 기준 분리
+        - 영어: 문장 부호 뒤 공백 기준 분리 (부호 유지)
 
-        # 너무 짧은 문장 제거 (10자 미만)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
-        return sentences
+        문장 구분자에는 단어 문자가 없으므로, 문장별 토큰을 이어 붙인 배열은
+        전체 텍스트를 토큰화한 결과와 같습니다. 너무 짧은 문장(10자 이하)은
+        요약 후보에서 빠지지만 토큰은 빈도 계산에 포함됩니다.
+
+        Returns:
+            tuple: (sentences, tokens, spans)
+                sentences: 요약 후보 문장 리스트
+                tokens: 전체 텍스트의 소문자 단어 토큰 리스트
+                spans: 문장별 (시작, 끝) tokens 인덱스 범위
+        """
+        splitter = SENTENCE_SPLIT_PATTERNS['ko' if self.language == 'ko' else 'en']
+        find_words = WORD_PATTERN.findall
+
+        sentences = []
+        tokens = []
+        spans = []
+        for segment in splitter.split(text):
+            segment = segment.strip()
+            start = len(tokens)
+            tokens.extend(find_words(segment.lower()))
+            if len(segment) > MIN_SENTENCE_LENGTH:
+                sentences.append(segment)
+                spans.append((start, len(tokens)))
+        return sentences, tokens, spans
 
     #######################
     # 단어 빈도 계산
     #######################
-    def _calculate_word_frequency(self, text):
+    def _count_words(self, tokens):
         """
-        단어 빈도수 계산
+        불용어와 1글자 단어를 제외한 단어별 등장 횟수 (첫 등장 순서 유지)
 
-        처리 과정:
-        1. 텍스트에서 단어 추출
-        2. 불용어(stop words) 제거
-        3. 빈도수 계산
-        4. 최대 빈도 기준 정규화 (0~1 범위)
+        토큰 전체를 한 번에 센 뒤(C 구현) 서로 다른 단어 단위로만 거릅니다.
+        """
+        return Counter({
+            word: count for word, count in Counter(tokens).items()
+            if len(word) > 1 and word not in FREQUENCY_STOP_WORDS
+        })
+
+    def _calculate_word_frequency(self, word_counts):
+        """
+        단어 빈도 점수 계산 (최대 빈도 기준 정규화, 0~1 범위)
 
         Returns:
             dict: {단어: 정규화된_빈도} 형태의 딕셔너리
         """
-        # 단어 추출 (영문자, 한글 등)
-        words = re.findall(r'\b\w+\b', text.lower())
-
-        #######################
-        # 불용어 정의
-        #######################
-        # 불용어: 의미 없이 자주 등장하는 단어 (조사, 관사 등)
-        stop_words = set([
-            # 영어 불용어
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            # 한국어 불용어 (조사)
-            '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도'
-        ])
-
-        # 불용어 및 1글자 단어 제거
-        words = [w for w in words if w not in stop_words and len(w) > 1]
-
-        # 빈도수 계산
-        freq = Counter(words)
-
-        # 정규화 (최대 빈도 = 1.0)
-        max_freq = max(freq.values()) if freq else 1
-        for word in freq:
-            freq[word] = freq[word] / max_freq
-
-        return freq
+        max_freq = max(word_counts.values()) if word_counts else 1
+        return {word: count / max_freq for word, count in word_counts.items()}
 
     #######################
     # 문장 점수 계산
     #######################
-    def _score_sentences(self, sentences, word_freq):
+    def _score_sentences(self, tokens, spans, word_freq):
         """
         각 문장의 중요도 점수 계산
 
@@ -242,22 +337,26 @@ class ArticleSummarizer:
         - 문장 길이로 정규화 (긴 문장에 불이익 방지)
 
         Args:
-            sentences: 문장 리스트
+            tokens: 전체 토큰 리스트
+            spans: 문장별 (시작, 끝) 토큰 범위
             word_freq: 단어별 빈도 점수 딕셔너리
 
         Returns:
             list: 각 문장의 점수 리스트
         """
-        scores = []
+        # 불용어/1글자 단어도 0점으로 넣어 두면 문장 루프에서 기본값 처리가 필요 없음
+        weights = dict.fromkeys(tokens, 0)
+        weights.update(word_freq)
+        weight = weights.__getitem__
 
-        for sentence in sentences:
-            words = re.findall(r'\b\w+\b', sentence.lower())
+        scores = []
+        for start, end in spans:
             # 문장 내 단어들의 빈도 점수 합산
-            score = sum(word_freq.get(word, 0) for word in words)
+            score = sum(map(weight, tokens[start:end]))
 
             # 문장 길이로 정규화
-            if len(words) > 0:
-                score = score / len(words)
+            if end > start:
+                score = score / (end - start)
 
             scores.append(score)
 
@@ -266,46 +365,52 @@ class ArticleSummarizer:
     #######################
     # 상위 문장 선택
     #######################
-    def _select_top_sentences(self, sentences, scores, max_length):
+    def _select_top_indices(self, sentences, scores, max_length):
         """
         점수가 높은 문장들을 선택하여 요약 구성
 
         선택 기준:
-        1. 점수가 높은 순서로 정렬
+        1. 점수가 높은 순서로 (같은 점수면 앞 문장 먼저)
         2. max_length를 초과하지 않는 범위에서 선택
         3. 원문에서의 순서대로 재정렬 (자연스러운 흐름 유지)
 
+        전체 정렬 대신 힙에서 필요한 만큼만 꺼내므로, 요약에 들어가는 문장 수 k에 대해
+        O(n + k log n)입니다 (수천~수만 문장 입력 대비).
+
         Args:
             sentences: 전체 문장 리스트
             scores: 문장별 점수 리스트
             max_length: 요약 최대 길이
 
         Returns:
-            list: 선택된 문장 리스트 (원문 순서)
+            list: 선택된 문장 인덱스 리스트 (원문 순서)
         """
-        # 점수 기준 내림차순 정렬
-        ranked = sorted(zip(sentences, scores), key=lambda x: x[1], reverse=True)
+        # 혼자서도 max_length를 넘는 문장은 선택될 수 없으므로 후보에서 제외
+        heap = [
+            (-score, index)
+            for index, (sentence, score) in enumerate(zip(sentences, scores))
+            if len(sentence) <= max_length
+        ]
+        heapq.heapify(heap)
 
         selected = []
         total_length = 0
 
         # 점수 높은 순서로 문장 선택
-        for sentence, score in ranked:
-            if total_length + len(sentence) <= max_length:
-                selected.append(sentence)
-                total_length += len(sentence) + 1  # +1은 공백
+        while heap:
+            _, index = heapq.heappop(heap)
+            length = len(sentences[index])
+            if total_length + length <= max_length:
+                selected.append(index)
+                total_length += length + 1  # +1은 공백
 
             # 최대 길이의 90% 도달 시 중단
             if total_length >= max_length * 0.9:
                 break
 
         # 원문 순서대로 재정렬
-        result = []
-        for sent in sentences:
-            if sent in selected:
-                result.append(sent)
-
-        return result
+        selected.sort()
+        return selected
 
     #######################
     # 핵심 포인트 추출
@@ -326,9 +431,9 @@ class ArticleSummarizer:
             list: 핵심 포인트 문장 리스트 (최대 6개)
         """
         if scores:
-            # 점수 기준 상위 5개 선택
-            ranked = sorted(zip(sentences, scores), key=lambda x: x[1], reverse=True)
-            bullets = [sent for sent, score in ranked[:5]]
+            # 점수 기준 상위 5개 선택 (같은 점수면 앞 문장 먼저)
+            top = heapq.nlargest(5, range(len(sentences)), key=scores.__getitem__)
+            bullets = [sentences[i] for i in top]
         else:
             # 처음 5개 문장 선택
             bullets = sentences[:5]
@@ -341,40 +446,136 @@ class ArticleSummarizer:
     #######################
     # 키워드 추출
     #######################
-    def _extract_keywords(self, text):
+    def _extract_keywords(self, word_counts):
         """
-        텍스트에서 주요 키워드 추출
+        주요 키워드 추출
 
         추출 방식:
-        - 단어 빈도수 기반
-        - 불용어 제거
-        - 상위 10개 단어 반환
+        - 단어 빈도수 기반 (_count_words 결과 재사용)
+        - 확장 불용어 및 2글자 이하 단어 제거
+        - 빈도 x 코퍼스 IDF 상위 10개 단어 반환 (여러 기사에 흔한 단어는 뒤로)
 
         Args:
-            text: 원문 텍스트
+            word_counts: 단어별 등장 횟수 (불용어/1글자 단어 제외, 첫 등장 순서)
 
         Returns:
             list: 키워드 리스트 (최대 10개)
         """
-        words = re.findall(r'\b\w+\b', text.lower())
+        from .corpus_index import rank_keywords
 
-        #######################
-        # 확장된 불용어 목록
-        #######################
-        stop_words = set([
-            # 영어 불용어
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'this', 'that', 'with', 'from', 'by', 'as', 'be', 'have', 'has',
-            # 한국어 불용어
-            '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도',
-            '있다', '없다', '하다', '되다', '이다'
-        ])
-
-        # 불용어 및 2글자 이하 단어 제거
-        words = [w for w in words if w not in stop_words and len(w) > 2]
-
-        # 빈도수 기준 상위 10개 추출
-        freq = Counter(words)
-        keywords = [word for word, count in freq.most_common(10)]
-
-        return keywords
+        candidates = {
+            word: count for word, count in word_counts.items()
+            if len(word) > 2 and word not in KEYWORD_STOP_WORDS
+        }
+        return rank_keywords(candidates, limit=10)
+
+
+#######################
+# 배치 요약 (프로세스 풀)
+#######################
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _summarize_chunk(texts, max_length, min_length, language):
+    """
+    기사 묶음 요약 (풀 워커 프로세스 또는 현재 프로세스에서 실행)
+
+    Returns:
+        list: 기사별 요약 dict, 실패한 기사는 None (다른 기사에 영향 없음)
+    """
+    summarizer = ArticleSummarizer(language=language)
+    results = []
+    for text in texts:
+        try:
+            results.append(summarizer.summarize(text, max_length=max_length, min_length=min_length))
+        except Exception:
+            logger.exception("규칙 기반 요약 실패 (%d자)", len(text))
+            results.append(None)
+    return results
+
+
+def _get_pool(workers):
+    """
+    프로세스 공용 요약 풀 (지연 생성)
+
+    gunicorn 워커는 스레드(모델 사전 로드, 요약 작업 등)를 갖고 있어 fork로 자식을 만들면
+    잠긴 lock을 물려받을 수 있으므로, 깨끗한 프로세스에서 fork하는 forkserver를 사용합니다.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(method)
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_pool():
+    """요약 풀 종료 (테스트/벤치마크용)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def summarize_many(texts, max_length=200, min_length=50, language='ko', workers=None):
+    """
+    여러 기사를 규칙 기반으로 요약 (입력 순서 유지)
+
+    기사가 SUMMARY_RULE_POOL_MIN_ITEMS개 이상이고 workers > 1이면 프로세스 풀에
+    chunk 단위로 나눠 보내고, 아니면 현재 프로세스에서 순서대로 요약합니다.
+    풀이 깨지면(워커 비정상 종료) 남은 chunk는 현재 프로세스에서 처리합니다.
+
+    Args:
+        texts: 원문 리스트
+        workers: 프로세스 수 (기본 SUMMARY_RULE_WORKERS)
+
+    Returns:
+        list: 기사별 요약 dict 또는 None (요약 실패)
+    """
+    texts = list(texts)
+    workers = SUMMARY_RULE_WORKERS if workers is None else workers
+    if workers <= 1 or len(texts) < max(2, SUMMARY_RULE_POOL_MIN_ITEMS):
+        return _summarize_chunk(texts, max_length, min_length, language)
+
+    chunk_size = max(1, math.ceil(len(texts) / (workers * SUMMARY_RULE_CHUNKS_PER_WORKER)))
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    pool = _get_pool(workers)
+    try:
+        futures = [
+            pool.submit(_summarize_chunk, chunk, max_length, min_length, language)
+            for chunk in chunks
+        ]
+    except (BrokenProcessPool, RuntimeError):
+        logger.warning("요약 프로세스 풀 사용 불가, 현재 프로세스에서 요약", exc_info=True)
+        _discard_pool(pool)
+        return _summarize_chunk(texts, max_length, min_length, language)
+
+    results = []
+    for chunk, future in zip(chunks, futures):
+        try:
+            results.extend(future.result())
+        except BrokenProcessPool:
+            logger.warning("요약 프로세스 풀 워커 종료, 남은 기사는 현재 프로세스에서 요약")
+            _discard_pool(pool)
+            results.extend(_summarize_chunk(chunk, max_length, min_length, language))
+        except Exception:
+            logger.exception("요약 chunk 처리 실패, 현재 프로세스에서 다시 요약")
+            results.extend(_summarize_chunk(chunk, max_length, min_length, language))
+    return results
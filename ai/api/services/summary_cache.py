@@ -0,0 +1,60 @@
+"""
+#######################
+# 요약 결과 캐시
+#######################
+# 같은 기사를 같은 조건으로 다시 요약하지 않도록 결과를 캐시합니다.
+# (AI 요약은 요청마다 Mistral-7B generate 한 번이라 GPU 시간 낭비가 가장 큼)
+#
+# 캐시 키: (본문 해시, 요약 방식, 언어, max_length, min_length, 모델 ID)
+# - 모델 ID가 바뀌면(모델 교체, 규칙 알고리즘 버전 변경) 자동으로 새 키가 됩니다.
+#######################
+"""
+import copy
+import hashlib
+import os
+
+from .result_cache import ResultCache
+
+SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", "86400"))
+SUMMARY_CACHE_MAXSIZE = int(os.getenv("SUMMARY_CACHE_MAXSIZE", "256"))
+SUMMARY_CACHE_USE_DJANGO = os.getenv("SUMMARY_CACHE_USE_DJANGO", "false").lower() == "true"
+
+_summary_cache = ResultCache(
+    "summary",
+    maxsize=SUMMARY_CACHE_MAXSIZE,
+    ttl=SUMMARY_CACHE_TTL,
+    use_django=SUMMARY_CACHE_USE_DJANGO,
+)
+
+
+def get_summary_cache():
+    """프로세스 공용 요약 캐시를 반환한다."""
+    return _summary_cache
+
+
+def summary_cache_key(text, method, language, max_length, min_length, model_id):
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{text_hash}:{method}:{language}:{max_length}:{min_length}:{model_id}"
+
+
+def summarize_with_cache(summarizer, method, text, max_length, min_length):
+    """
+    캐시를 거쳐 요약한다. 요약 실패(예외)는 캐시하지 않고 그대로 전파한다.
+
+    Args:
+        summarizer: ArticleSummarizer 또는 AISummarizer (language, model_id 속성 사용)
+        method: 요약 방식 ('rule' / 'ai')
+
+    Returns:
+        tuple: (요약 결과 dict, 캐시 hit 여부)
+    """
+    key = summary_cache_key(
+        text, method, summarizer.language, max_length, min_length, summarizer.model_id
+    )
+    cached = _summary_cache.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached), True
+
+    result = summarizer.summarize(text=text, max_length=max_length, min_length=min_length)
+    _summary_cache.set(key, copy.deepcopy(result))
+    return result, False
@@ -0,0 +1,469 @@
+"""
+#######################
+# 배치 요약 비동기 작업
+#######################
+# POST /api/news/batch-summarize 는 모든 아이템을 요청 스레드에서 순서대로 요약한 뒤 응답하므로
+# method='ai'로 수십 건을 보내면 GUNICORN_TIMEOUT을 넘깁니다.
+#
+# 작업 API (POST /api/news/batch-summarize/jobs):
+# - 요청 즉시 job_id를 반환하고, 아이템은 프로세스 공용 스레드 풀
+#   (SUMMARY_JOB_CONCURRENCY개)에서 병렬로 요약
+# - 완료된 아이템부터 결과에 추가되며, GET .../jobs/<job_id>?since=N 으로
+#   N번째 이후 결과만 받아 갈 수 있음 (응답의 next를 다음 since로 사용)
+# - 모든 아이템이 끝나면 입력 순서대로 SummarizedNewsManager.save_summarized_news로 저장
+# - 진행 상태는 summarized_data/jobs/<job_id>.json에도 남겨 다른 gunicorn 워커에서 조회 가능
+#   (아이템마다 쓰지 않고 SUMMARY_JOB_PERSIST_INTERVAL마다 묶어서 쓰며, 상태 전이/완료는 즉시 씀)
+# - 실행 중인 워커는 같은 간격으로 상태 파일 수정 시각을 갱신(heartbeat)하고,
+#   SUMMARY_JOB_STALE_SECONDS 넘게 갱신되지 않은 미완료 작업은 워커가 죽은 것으로 보고 failed로 응답
+#
+# 동기 API의 method='rule'은 summarize_rule_items로 여러 CPU 코어에 나눠 요약하고,
+# 'tfidf'/'textrank'는 summarize_vector_items로 배치 전체를 한 번에 점수 계산합니다.
+#######################
+"""
+import copy
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from .summary_cache import get_summary_cache, summarize_with_cache, summary_cache_key
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 전체에서 동시에 요약하는 아이템 수 (작업 여러 개가 풀을 나눠 씀)
+SUMMARY_JOB_CONCURRENCY = int(os.getenv("SUMMARY_JOB_CONCURRENCY", "2"))
+# 끝난 작업을 메모리/상태 파일에 유지하는 시간 (초)
+SUMMARY_JOB_RETENTION = int(os.getenv("SUMMARY_JOB_RETENTION", "3600"))
+# 상태 파일 갱신/heartbeat 간격 (초)
+SUMMARY_JOB_PERSIST_INTERVAL = float(os.getenv("SUMMARY_JOB_PERSIST_INTERVAL", "2"))
+# 미완료 작업의 상태 파일이 이 시간 넘게 갱신되지 않으면 실패로 응답 (초)
+SUMMARY_JOB_STALE_SECONDS = float(os.getenv("SUMMARY_JOB_STALE_SECONDS", "30"))
+# 이보다 짧은 본문은 요약하지 않음 (BatchSummarizeView와 동일)
+MIN_SUMMARY_TEXT_LENGTH = 50
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"  # 결과 저장 실패 또는 실행 워커 중단 (아이템별 요약 실패는 progress.failed로 집계)
+
+
+#######################
+# 아이템 단위 요약 (동기/작업 API 공용)
+#######################
+def _item_text(item):
+    """요약 대상 본문 (짧으면 None)"""
+    text = item.get('origainal_news', '')
+    if not text or len(text.strip()) < MIN_SUMMARY_TEXT_LENGTH:
+        return None
+    return text
+
+
+def _unsummarized_item(item, error):
+    return {
+        **item,
+        'summary': '',
+        'bullets': [],
+        'keywords': [],
+        'summarized': False,
+        'error': error
+    }
+
+
+def _summarized_item(item, text, result, cached):
+    return {
+        'title': item.get('title', ''),
+        'originallink': item.get('originallink', ''),
+        'pubDate': item.get('pubDate', ''),
+        'original_text': text[:500] + '...' if len(text) > 500 else text,
+        'summary': result['summary'],
+        'bullets': result['bullets'],
+        'keywords': result['keywords'],
+        'summarized': True,
+        'cached': cached,
+        'error': None
+    }
+
+
+def summarize_news_item(summarizer, method, item, max_length, min_length):
+    """
+    뉴스 아이템 하나를 요약해 저장용 dict로 변환 (예외는 실패 아이템으로 변환)
+
+    Returns:
+        dict: 요약 결과 아이템 ('summarized', 'error' 포함)
+    """
+    text = _item_text(item)
+    if text is None:
+        # 텍스트가 짧으면 건너뛰기
+        return _unsummarized_item(item, '텍스트가 너무 짧습니다.')
+
+    try:
+        result, cached = summarize_with_cache(
+            summarizer,
+            method,
+            text=text,
+            max_length=max_length,
+            min_length=min_length
+        )
+    except Exception:
+        logger.exception(f"요약 실패: {item.get('title', '')}")
+        return _unsummarized_item(item, 'Summarization failed')
+
+    return _summarized_item(item, text, result, cached)
+
+
+def _summarize_items_batched(items, method, summarizer, summarize_texts, max_length, min_length):
+    """
+    캐시에 없는 본문만 모아 summarize_texts(본문 리스트 -> 결과 또는 None 리스트)로 한 번에 요약
+
+    결과는 summarize_news_item을 순서대로 호출한 것과 같습니다.
+    - 같은 본문이 여러 번 있으면 한 번만 요약하고 뒤의 아이템은 cached=True
+    - 요약에 실패한 아이템만 'Summarization failed' (다른 아이템에 영향 없음)
+
+    Returns:
+        list: 요약 결과 아이템 (입력 순서)
+    """
+    cache = get_summary_cache()
+    results = [None] * len(items)
+    pending = {}  # 캐시 키 -> (본문, [아이템 index])
+    for index, item in enumerate(items):
+        text = _item_text(item)
+        if text is None:
+            results[index] = _unsummarized_item(item, '텍스트가 너무 짧습니다.')
+            continue
+
+        key = summary_cache_key(
+            text, method, summarizer.language, max_length, min_length, summarizer.model_id
+        )
+        if key in pending:
+            pending[key][1].append(index)
+            continue
+        cached = cache.get(key)
+        if cached is not None:
+            results[index] = _summarized_item(item, text, copy.deepcopy(cached), True)
+        else:
+            pending[key] = (text, [index])
+
+    summaries = summarize_texts([text for text, _ in pending.values()]) if pending else []
+    for (key, (text, indexes)), result in zip(pending.items(), summaries):
+        if result is None:
+            for index in indexes:
+                logger.error(f"요약 실패: {items[index].get('title', '')}")
+                results[index] = _unsummarized_item(items[index], 'Summarization failed')
+            continue
+
+        cache.set(key, copy.deepcopy(result))
+        for position, index in enumerate(indexes):
+            results[index] = _summarized_item(
+                items[index], text, copy.deepcopy(result) if position else result, position > 0
+            )
+    return results
+
+
+def summarize_rule_items(items, max_length, min_length, language='ko', workers=None):
+    """
+    method='rule' 배치 요약: 캐시에 없는 본문을 summarize_many(프로세스 풀)로 요약
+
+    Returns:
+        list: 요약 결과 아이템 (입력 순서)
+    """
+    from .summarizer import ArticleSummarizer, summarize_many
+
+    return _summarize_items_batched(
+        items,
+        'rule',
+        ArticleSummarizer(language=language),
+        lambda texts: summarize_many(
+            texts, max_length=max_length, min_length=min_length, language=language, workers=workers
+        ),
+        max_length,
+        min_length,
+    )
+
+
+def summarize_vector_items(items, method, max_length, min_length, language='ko'):
+    """
+    method='tfidf'/'textrank' 배치 요약: 캐시에 없는 본문 전체를 한 번의 행렬 연산으로 점수 계산
+
+    Returns:
+        list: 요약 결과 아이템 (입력 순서)
+    """
+    from .vector_summarizer import VectorArticleSummarizer
+
+    summarizer = VectorArticleSummarizer(method=method, language=language)
+    return _summarize_items_batched(
+        items,
+        method,
+        summarizer,
+        lambda texts: summarizer.summarize_many(texts, max_length=max_length, min_length=min_length),
+        max_length,
+        min_length,
+    )
+
+
+#######################
+# 작업
+#######################
+class SummaryJob:
+    """
+    배치 요약 작업 하나의 진행 상태
+
+    results는 완료 순서대로 쌓이며 각 결과에 입력 순서 index가 붙습니다.
+    """
+
+    def __init__(self, items, method, summarizer, max_length, min_length):
+        self.job_id = uuid.uuid4().hex
+        self.method = method
+        self.items = list(items)
+        self.summarizer = summarizer
+        self.max_length = max_length
+        self.min_length = min_length
+
+        self.status = JOB_QUEUED
+        self.results = []          # [{'index': int, **아이템 결과}] (완료 순서)
+        self.succeeded = 0
+        self.failed = 0
+        self.filename = None
+        self.error = None
+        self.created_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+        self.finished_monotonic = None
+        self.worker_pid = os.getpid()
+
+        self._persisted_at = 0.0   # 마지막 상태 파일 저장 (monotonic)
+        self._dirty = False        # 저장하지 않은 결과가 있음
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    @property
+    def total(self):
+        return len(self.items)
+
+    def wait(self, timeout=None):
+        """작업이 끝날 때까지 대기 (테스트/관리 명령용)"""
+        return self._done.wait(timeout)
+
+    def _run_item(self, index):
+        with self._lock:
+            if self.status == JOB_QUEUED:
+                self.status = JOB_RUNNING
+                self.started_at = datetime.now().isoformat()
+                self._persist()
+
+        result = summarize_news_item(
+            self.summarizer, self.method, self.items[index], self.max_length, self.min_length
+        )
+
+        with self._lock:
+            self.results.append({'index': index, **result})
+            if result['summarized']:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+            finished = len(self.results) == self.total
+            if not finished:
+                self._persist_throttled()
+        if finished:
+            self._finish()
+
+    def _finish(self):
+        from .news_crawler import SummarizedNewsManager
+
+        ordered = [
+            {key: value for key, value in result.items() if key != 'index'}
+            for result in sorted(self.results, key=lambda r: r['index'])
+        ]
+        save_result = SummarizedNewsManager.save_summarized_news(ordered, self.method)
+
+        with self._lock:
+            if save_result['success']:
+                self.status = JOB_COMPLETED
+                self.filename = save_result['filename']
+            else:
+                self.status = JOB_FAILED
+                self.error = save_result['error']
+            self.finished_at = datetime.now().isoformat()
+            self.finished_monotonic = time.monotonic()
+            self._persist()
+        self._done.set()
+        logger.info(
+            "Summary job %s %s: %d/%d summarized (%s)",
+            self.job_id, self.status, self.succeeded, self.total, self.filename,
+        )
+
+    def _persist(self):
+        """상태 파일 갱신 (lock 보유 중 호출: 스냅샷 순서가 뒤바뀌지 않게)"""
+        from .news_crawler import SummarizedNewsManager
+
+        SummarizedNewsManager.save_job_state(self.job_id, self._snapshot())
+        self._persisted_at = time.monotonic()
+        self._dirty = False
+
+    def _persist_throttled(self):
+        """마지막 저장 후 SUMMARY_JOB_PERSIST_INTERVAL이 지났을 때만 저장 (lock 보유 중 호출)"""
+        if time.monotonic() - self._persisted_at >= SUMMARY_JOB_PERSIST_INTERVAL:
+            self._persist()
+        else:
+            self._dirty = True  # 다음 heartbeat 또는 완료 때 저장
+
+    def _heartbeat(self):
+        """미뤄 둔 결과를 저장하거나, 없으면 상태 파일 수정 시각만 갱신"""
+        from .news_crawler import SummarizedNewsManager
+
+        with self._lock:
+            if self.finished_at is not None:
+                return
+            if self._dirty:
+                self._persist()
+            else:
+                SummarizedNewsManager.touch_job_state(self.job_id)
+
+    def _snapshot(self):
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'method': self.method,
+            'progress': {
+                'total': self.total,
+                'completed': len(self.results),
+                'succeeded': self.succeeded,
+                'failed': self.failed,
+                'pending': self.total - len(self.results),
+            },
+            'filename': self.filename,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'worker_pid': self.worker_pid,
+            'results': list(self.results),
+        }
+
+    def to_dict(self, since=0):
+        with self._lock:
+            return job_state_view(self._snapshot(), since)
+
+
+def job_state_view(state, since=0):
+    """
+    작업 상태 스냅샷에서 since번째 이후 결과만 잘라낸 응답 dict
+
+    Returns:
+        dict: {'job_id', 'status', 'method', 'progress', 'filename', 'error',
+               'created_at', 'started_at', 'finished_at', 'items', 'next'}
+    """
+    results = state.get('results', [])
+    since = max(0, min(int(since), len(results)))
+    view = {key: value for key, value in state.items() if key != 'results'}
+    view['items'] = results[since:]
+    view['next'] = len(results)
+    return view
+
+
+#######################
+# 작업 관리
+#######################
+_executor = ThreadPoolExecutor(
+    max_workers=max(1, SUMMARY_JOB_CONCURRENCY), thread_name_prefix="summary-job"
+)
+_jobs = {}
+_jobs_lock = threading.Lock()
+_heartbeat_thread = None
+
+
+def _heartbeat_loop():
+    while True:
+        time.sleep(SUMMARY_JOB_PERSIST_INTERVAL)
+        with _jobs_lock:
+            active = [job for job in _jobs.values() if not job._done.is_set()]
+        for job in active:
+            try:
+                job._heartbeat()
+            except Exception:
+                logger.exception("Summary job heartbeat failed: %s", job.job_id)
+
+
+def _ensure_heartbeat():
+    """프로세스당 heartbeat 스레드 하나 (fork된 워커에서는 새로 시작)"""
+    global _heartbeat_thread
+    with _jobs_lock:
+        if _heartbeat_thread is None or not _heartbeat_thread.is_alive():
+            _heartbeat_thread = threading.Thread(
+                target=_heartbeat_loop, name="summary-job-heartbeat", daemon=True
+            )
+            _heartbeat_thread.start()
+
+
+def _prune_jobs():
+    """보존 시간이 지난 끝난 작업을 메모리와 상태 파일에서 제거"""
+    from .news_crawler import SummarizedNewsManager
+
+    deadline = time.monotonic() - SUMMARY_JOB_RETENTION
+    with _jobs_lock:
+        for job_id in [
+            job_id for job_id, job in _jobs.items()
+            if job.finished_monotonic is not None and job.finished_monotonic < deadline
+        ]:
+            del _jobs[job_id]
+    SummarizedNewsManager.delete_expired_job_states(SUMMARY_JOB_RETENTION)
+
+
+def submit_summary_job(items, method, summarizer, max_length=300, min_length=50):
+    """
+    배치 요약 작업 등록 후 즉시 반환 (아이템은 백그라운드 스레드 풀에서 요약)
+
+    Returns:
+        SummaryJob
+    """
+    _prune_jobs()
+
+    job = SummaryJob(items, method, summarizer, max_length, min_length)
+    with _jobs_lock:
+        _jobs[job.job_id] = job
+    with job._lock:
+        job._persist()
+    _ensure_heartbeat()
+
+    for index in range(job.total):
+        _executor.submit(job._run_item, index)
+    return job
+
+
+def get_summary_job_state(job_id, since=0):
+    """
+    작업 상태 조회 (이 워커의 메모리 -> 상태 파일 순)
+
+    상태 파일의 미완료 작업이 SUMMARY_JOB_STALE_SECONDS 넘게 갱신되지 않았으면
+    실행하던 워커가 중단된 것이므로 failed로 응답합니다.
+
+    Returns:
+        dict 또는 None (없는 작업)
+    """
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    if job is not None:
+        return job.to_dict(since)
+
+    from .news_crawler import SummarizedNewsManager
+
+    state = SummarizedNewsManager.read_job_state(job_id)
+    if state is None:
+        return None
+    if state.get('status') in (JOB_QUEUED, JOB_RUNNING):
+        updated_at = SummarizedNewsManager.job_state_updated_at(job_id)
+        if updated_at is not None and time.time() - updated_at > SUMMARY_JOB_STALE_SECONDS:
+            state = {
+                **state,
+                'status': JOB_FAILED,
+                'error': f"Summary job worker stopped (pid {state.get('worker_pid')})",
+            }
+    return job_state_view(state, since)
+
+
+def reset_summary_jobs():
+    """메모리의 작업 목록 초기화 (테스트용)"""
+    with _jobs_lock:
+        _jobs.clear()
@@ -1,10 +1,14 @@
 """외부 기사 URL 저장 및 다운로드를 위한 공통 보안 경계."""
 
+from collections import OrderedDict
 from dataclasses import dataclass
 import http.client
 import ipaddress
+import os
 import socket
 import ssl
+import threading
+import time
 from typing import Mapping, Optional
 from urllib.parse import urljoin, urlsplit, urlunsplit
 
@@ -19,10 +23,23 @@ class ExternalResponseError(RuntimeError):
 
 ALLOWED_PORTS = {"http": 80, "https": 443}
 REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+NOT_MODIFIED_STATUS = 304
+CONDITIONAL_REQUEST_HEADERS = {"if-none-match", "if-modified-since"}
 MAX_ARTICLE_URL_LENGTH = 500
 MAX_REDIRECTS = 5
 MAX_ARTICLE_RESPONSE_BYTES = 5 * 1024 * 1024
 
+# keep-alive 연결 풀 설정. 키별 최대 유휴 연결 수가 0이면 매 요청마다 연결을 닫는다.
+CONNECTION_POOL_MAXSIZE = int(os.getenv("SAFE_FETCH_POOL_MAXSIZE", "4"))
+CONNECTION_POOL_MAX_TOTAL = int(os.getenv("SAFE_FETCH_POOL_MAX_TOTAL", "64"))
+CONNECTION_POOL_IDLE_TIMEOUT = float(os.getenv("SAFE_FETCH_POOL_IDLE_TIMEOUT", "30"))
+MAX_TLS_SESSIONS = 256
+
+# getaddrinfo 결과 캐시. TTL이 0이면 캐시하지 않는다.
+DNS_CACHE_TTL = float(os.getenv("DNS_CACHE_TTL", "60"))
+DNS_CACHE_NEGATIVE_TTL = float(os.getenv("DNS_CACHE_NEGATIVE_TTL", "10"))
+DNS_CACHE_MAXSIZE = int(os.getenv("DNS_CACHE_MAXSIZE", "1024"))
+
 
 @dataclass(frozen=True)
 class ResolvedPublicUrl:
@@ -101,6 +118,96 @@ def normalize_storable_article_url(url: str) -> str:
     return urlunsplit((scheme, parsed.netloc, parsed.path or "/", parsed.query, ""))
 
 
+class DnsResolutionCache:
+    """
+    (host, port)별 getaddrinfo 응답을 보관하는 LRU+TTL 캐시.
+
+    getaddrinfo는 레코드 TTL을 알려주지 않으므로 설정된 TTL 상한을 쓰고, 조회
+    실패는 더 짧은 TTL로 음성 캐시한다. 캐시는 원본 주소 목록만 담으며 공개 IP
+    검증은 캐시 hit에서도 매번 다시 수행된다.
+    """
+
+    def __init__(self, ttl: float, negative_ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def resolve(self, host: str, port: int) -> tuple:
+        """주소 목록을 반환한다. 조회 실패(음성 캐시 포함)는 UnsafeUrlError."""
+        key = (host.lower(), port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                if entry[1] is None:
+                    self.negative_hits += 1
+                    raise UnsafeUrlError("URL is not allowed")
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        try:
+            addresses = tuple(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+        except OSError as exc:
+            self._store(key, None, self.negative_ttl)
+            raise UnsafeUrlError("URL is not allowed") from exc
+        if not addresses:
+            self._store(key, None, self.negative_ttl)
+            raise UnsafeUrlError("URL is not allowed")
+        self._store(key, addresses, self.ttl)
+        return addresses
+
+    def _store(self, key: tuple, addresses: Optional[tuple], ttl: float) -> None:
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, addresses)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.negative_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_rate": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+                "ttl": self.ttl,
+                "negative_ttl": self.negative_ttl,
+                "maxsize": self.maxsize,
+            }
+
+
+_dns_cache = DnsResolutionCache(
+    ttl=DNS_CACHE_TTL,
+    negative_ttl=DNS_CACHE_NEGATIVE_TTL,
+    maxsize=DNS_CACHE_MAXSIZE,
+)
+
+
+def get_dns_cache_stats() -> dict:
+    """resolve_public_url DNS 캐시의 hit-rate 통계를 반환한다."""
+    return _dns_cache.stats()
+
+
+def clear_dns_cache() -> None:
+    _dns_cache.clear()
+
+
 def first_safe_article_url(*candidates: Optional[str]) -> Optional[str]:
     """문법과 현재 DNS 결과가 모두 안전한 첫 저장 후보를 반환한다."""
     for candidate in candidates:
@@ -121,13 +228,9 @@ def resolve_public_url(url: str) -> ResolvedPublicUrl:
         raise UnsafeUrlError("URL is not allowed")
     port = ALLOWED_PORTS[scheme] if parsed.port is None else parsed.port
 
-    try:
-        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
-    except OSError as exc:
-        raise UnsafeUrlError("URL is not allowed") from exc
-    if not addresses:
-        raise UnsafeUrlError("URL is not allowed")
+    addresses = _dns_cache.resolve(host, port)
 
+    # 캐시된 응답이어도 모든 주소의 공개 IP 여부를 매번 다시 확인한다.
     public_addresses = []
     for family, socktype, proto, _canonical_name, sockaddr in addresses:
         try:
@@ -161,72 +264,294 @@ def resolve_public_url(url: str) -> ResolvedPublicUrl:
     )
 
 
-def _request_once(
-    target: ResolvedPublicUrl,
-    timeout: float,
-    max_bytes: int,
-    user_agent: str,
-) -> SafeHttpResponse:
+class _PooledConnection:
+    """검증된 sockaddr에 이미 연결된 HTTP(S) 연결과 원본 socket 묶음."""
+
+    __slots__ = ("connection", "raw_socket", "last_used")
+
+    def __init__(self, connection, raw_socket):
+        self.connection = connection
+        self.raw_socket = raw_socket
+        self.last_used = time.monotonic()
+
+    def close(self):
+        self.connection.close()
+        try:
+            self.raw_socket.close()
+        except OSError:
+            pass
+
+
+class SafeConnectionPool:
+    """
+    (검증된 sockaddr, host, scheme) 단위의 프로세스 내 keep-alive 연결 풀.
+
+    키에 DNS 검증 때 고정한 sockaddr이 포함되므로 재사용 연결은 항상 방금 검증한
+    공개 IP에 붙어 있다. TLS는 공유 SSLContext와 host별 세션 재개로 handshake
+    비용을 줄인다.
+    """
+
+    def __init__(self, maxsize: int, max_total: int, idle_timeout: float):
+        self.maxsize = maxsize
+        self.max_total = max_total
+        self.idle_timeout = idle_timeout
+        self._idle: "OrderedDict[tuple, list]" = OrderedDict()
+        self._tls_sessions: "OrderedDict[tuple, ssl.SSLSession]" = OrderedDict()
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.max_total > 0
+
+    def ssl_context(self) -> ssl.SSLContext:
+        with self._lock:
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return self._ssl_context
+
+    def tls_session(self, key: tuple) -> Optional["ssl.SSLSession"]:
+        with self._lock:
+            return self._tls_sessions.get(key)
+
+    def remember_tls_session(self, key: tuple, session) -> None:
+        if session is None:
+            return
+        with self._lock:
+            self._tls_sessions[key] = session
+            self._tls_sessions.move_to_end(key)
+            while len(self._tls_sessions) > MAX_TLS_SESSIONS:
+                self._tls_sessions.popitem(last=False)
+
+    def acquire(self, key: tuple) -> Optional[_PooledConnection]:
+        expired = []
+        pooled = None
+        with self._lock:
+            connections = self._idle.get(key) or []
+            now = time.monotonic()
+            while connections:
+                candidate = connections.pop()
+                if now - candidate.last_used <= self.idle_timeout:
+                    pooled = candidate
+                    break
+                expired.append(candidate)
+            if not connections:
+                self._idle.pop(key, None)
+            self.discarded += len(expired)
+            if pooled is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        for candidate in expired:
+            candidate.close()
+        return pooled
+
+    def release(self, key: tuple, pooled: _PooledConnection) -> None:
+        if not self.enabled:
+            pooled.close()
+            return
+        evicted = []
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            if len(connections) >= self.maxsize:
+                evicted.append(pooled)
+            else:
+                pooled.last_used = time.monotonic()
+                connections.append(pooled)
+            total = sum(len(values) for values in self._idle.values())
+            while total > self.max_total:
+                # 가장 오래 쓰지 않은 키의 가장 오래된 연결부터 정리한다.
+                oldest_key = next(iter(self._idle))
+                oldest = self._idle[oldest_key]
+                evicted.append(oldest.pop(0))
+                if not oldest:
+                    del self._idle[oldest_key]
+                total -= 1
+            self.discarded += len(evicted)
+        for candidate in evicted:
+            candidate.close()
+
+    def discard(self, pooled: _PooledConnection) -> None:
+        with self._lock:
+            self.discarded += 1
+        pooled.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            connections = [pooled for values in self._idle.values() for pooled in values]
+            self._idle.clear()
+            self._tls_sessions.clear()
+        for pooled in connections:
+            pooled.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "discarded": self.discarded,
+                "idle": sum(len(values) for values in self._idle.values()),
+                "hit_rate": round(self.hits / requests, 4) if requests else 0.0,
+                "maxsize": self.maxsize,
+                "max_total": self.max_total,
+                "idle_timeout": self.idle_timeout,
+            }
+
+
+_connection_pool = SafeConnectionPool(
+    maxsize=CONNECTION_POOL_MAXSIZE,
+    max_total=CONNECTION_POOL_MAX_TOTAL,
+    idle_timeout=CONNECTION_POOL_IDLE_TIMEOUT,
+)
+
+
+def get_connection_pool_stats() -> dict:
+    """safe_fetch_url keep-alive 풀의 hit/miss 카운터를 반환한다."""
+    return _connection_pool.stats()
+
+
+def _verify_connected_peer(connected_socket, target: ResolvedPublicUrl) -> None:
+    try:
+        peer = connected_socket.getpeername()
+        peer_address = ipaddress.ip_address(peer[0])
+        expected_address = ipaddress.ip_address(target.sockaddr[0])
+        peer_port = int(peer[1])
+    except (OSError, ValueError, TypeError, IndexError) as exc:
+        raise UnsafeUrlError("Connected peer is not allowed") from exc
+    if (
+        not peer_address.is_global
+        or peer_address != expected_address
+        or peer_port != target.port
+    ):
+        raise UnsafeUrlError("Connected peer is not allowed")
+
+
+def _open_connection(target: ResolvedPublicUrl, timeout: float) -> _PooledConnection:
     """검증 시 선택한 sockaddr에 직접 연결해 DNS 재해석을 피한다."""
     raw_socket = socket.socket(target.family, target.socktype, target.proto)
     connection = http.client.HTTPConnection(target.host, target.port, timeout=timeout)
+    pooled = _PooledConnection(connection, raw_socket)
     try:
         raw_socket.settimeout(timeout)
         raw_socket.connect(target.sockaddr)
-        try:
-            peer = raw_socket.getpeername()
-            peer_address = ipaddress.ip_address(peer[0])
-            expected_address = ipaddress.ip_address(target.sockaddr[0])
-            peer_port = int(peer[1])
-        except (OSError, ValueError, TypeError, IndexError) as exc:
-            raise UnsafeUrlError("Connected peer is not allowed") from exc
-        if (
-            not peer_address.is_global
-            or peer_address != expected_address
-            or peer_port != target.port
-        ):
-            raise UnsafeUrlError("Connected peer is not allowed")
+        _verify_connected_peer(raw_socket, target)
         if target.scheme == "https":
-            context = ssl.create_default_context()
-            connected_socket = context.wrap_socket(raw_socket, server_hostname=target.host)
+            session_key = (target.host, target.sockaddr)
+            connected_socket = _connection_pool.ssl_context().wrap_socket(
+                raw_socket,
+                server_hostname=target.host,
+                session=_connection_pool.tls_session(session_key),
+            )
         else:
             connected_socket = raw_socket
         connection.sock = connected_socket
-        connection.request(
-            "GET",
-            target.request_target,
-            headers={
-                "Host": target.host_header,
-                "User-Agent": user_agent,
-                "Accept": "text/html,application/xhtml+xml",
-                "Accept-Encoding": "identity",
-                "Connection": "close",
-            },
-        )
-        response = connection.getresponse()
-        content_length = response.getheader("Content-Length")
-        if content_length:
-            try:
-                if int(content_length) > max_bytes:
-                    raise ExternalResponseError("External response is too large")
-            except ValueError:
-                pass
-        body = response.read(max_bytes + 1)
-        if len(body) > max_bytes:
-            raise ExternalResponseError("External response is too large")
-        headers = {name.lower(): value for name, value in response.getheaders()}
-        return SafeHttpResponse(
-            url=target.url,
-            status=response.status,
-            headers=headers,
-            body=body,
-        )
-    finally:
-        connection.close()
+        return pooled
+    except BaseException:
+        pooled.close()
+        raise
+
+
+def _send_request(
+    pooled: _PooledConnection,
+    target: ResolvedPublicUrl,
+    timeout: float,
+    max_bytes: int,
+    user_agent: str,
+    extra_headers: Optional[Mapping[str, str]] = None,
+) -> tuple:
+    """요청 하나를 보내고 (응답, 연결 재사용 가능 여부)를 반환한다."""
+    connection = pooled.connection
+    connection.sock.settimeout(timeout)
+    headers = dict(extra_headers or {})
+    headers.update({
+        "Host": target.host_header,
+        "User-Agent": user_agent,
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Encoding": "identity",
+        "Connection": "keep-alive" if _connection_pool.enabled else "close",
+    })
+    connection.request("GET", target.request_target, headers=headers)
+    response = connection.getresponse()
+    content_length = response.getheader("Content-Length")
+    if content_length:
         try:
-            raw_socket.close()
-        except OSError:
+            if int(content_length) > max_bytes:
+                raise ExternalResponseError("External response is too large")
+        except ValueError:
             pass
+    body = response.read(max_bytes + 1)
+    if len(body) > max_bytes:
+        raise ExternalResponseError("External response is too large")
+    headers = {name.lower(): value for name, value in response.getheaders()}
+    # 본문을 끝까지 읽었고 서버가 close를 요구하지 않았을 때만 풀에 돌려준다.
+    reusable = not response.will_close and response.isclosed()
+    return SafeHttpResponse(
+        url=target.url,
+        status=response.status,
+        headers=headers,
+        body=body,
+    ), reusable
+
+
+def _finish_request(
+    pool_key: tuple,
+    pooled: _PooledConnection,
+    target: ResolvedPublicUrl,
+    reusable: bool,
+) -> None:
+    if target.scheme == "https":
+        _connection_pool.remember_tls_session(
+            (target.host, target.sockaddr),
+            getattr(pooled.connection.sock, "session", None),
+        )
+    if reusable:
+        _connection_pool.release(pool_key, pooled)
+    else:
+        pooled.close()
+
+
+def _request_once(
+    target: ResolvedPublicUrl,
+    timeout: float,
+    max_bytes: int,
+    user_agent: str,
+    extra_headers: Optional[Mapping[str, str]] = None,
+) -> SafeHttpResponse:
+    """고정 sockaddr 연결을 풀에서 재사용하거나 새로 열어 요청 하나를 처리한다."""
+    pool_key = (target.sockaddr, target.host, target.scheme)
+    pooled = _connection_pool.acquire(pool_key) if _connection_pool.enabled else None
+    if pooled is not None:
+        try:
+            # 재사용 연결도 요청 전에 peer가 검증된 주소인지 다시 확인한다.
+            _verify_connected_peer(pooled.connection.sock, target)
+            response, reusable = _send_request(
+                pooled, target, timeout, max_bytes, user_agent, extra_headers
+            )
+        except (ConnectionError, http.client.BadStatusLine, UnsafeUrlError):
+            # 서버가 유휴 연결을 이미 닫은 경우: 새 연결로 한 번만 재시도한다 (GET은 멱등).
+            _connection_pool.discard(pooled)
+        except BaseException:
+            _connection_pool.discard(pooled)
+            raise
+        else:
+            _finish_request(pool_key, pooled, target, reusable)
+            return response
+
+    pooled = _open_connection(target, timeout)
+    try:
+        response, reusable = _send_request(
+            pooled, target, timeout, max_bytes, user_agent, extra_headers
+        )
+    except BaseException:
+        pooled.close()
+        raise
+    _finish_request(pool_key, pooled, target, reusable)
+    return response
 
 
 def safe_fetch_url(
@@ -236,12 +561,22 @@ def safe_fetch_url(
     max_bytes: int = MAX_ARTICLE_RESPONSE_BYTES,
     max_redirects: int = MAX_REDIRECTS,
     user_agent: str = "FanPulse/1.0",
+    extra_headers: Optional[Mapping[str, str]] = None,
 ) -> SafeHttpResponse:
-    """공개 URL만 고정 IP로 다운로드하고 redirect마다 같은 검증을 반복한다."""
+    """
+    공개 URL만 고정 IP로 다운로드하고 redirect마다 같은 검증을 반복한다.
+
+    extra_headers에 If-None-Match/If-Modified-Since를 넘기면 304 응답도 그대로 반환한다.
+    """
     current_url = normalize_storable_article_url(url)
+    conditional = any(
+        name.lower() in CONDITIONAL_REQUEST_HEADERS for name in (extra_headers or {})
+    )
     for redirect_count in range(max_redirects + 1):
         target = resolve_public_url(current_url)
-        response = _request_once(target, timeout, max_bytes, user_agent)
+        response = _request_once(target, timeout, max_bytes, user_agent, extra_headers)
+        if conditional and response.status == NOT_MODIFIED_STATUS:
+            return response
         if response.status not in REDIRECT_STATUSES:
             if response.status < 200 or response.status >= 300:
                 raise ExternalResponseError(f"External server returned HTTP {response.status}")
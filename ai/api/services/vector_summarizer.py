@@ -0,0 +1,319 @@
+"""
+#######################
+# TF-IDF / TextRank 추출형 요약
+#######################
+# ArticleSummarizer와 같은 정제/문장 분리/토큰화/문장 선택을 쓰고 문장 점수만 바꿉니다.
+#
+# summarize_method:
+# - tfidf: 문장 점수 = 문장 토큰의 (기사 내 정규화 빈도 x 코퍼스 IDF) 평균
+#   (흔한 단어가 많은 문장보다 이 기사에 특징적인 단어가 많은 문장이 위로)
+# - textrank: 문장 TF-IDF 벡터의 코사인 유사도 그래프에서 PageRank
+#   (다른 문장들과 내용이 많이 겹치는 "중심" 문장이 위로)
+#
+# IDF는 corpus_index의 crawled_news 문서 빈도(DF) 스냅샷에서 읽습니다 (요청마다 DB 조회 없음).
+#
+# 점수 엔진:
+# - NumPy/SciPy가 있으면 여러 기사의 문장 전체를 하나의 희소 행렬로 만들어 한 번에 계산
+#   (TextRank는 단어 열을 기사별로 나눠 유사도 행렬이 기사별 블록 대각이 되게 함)
+# - 없으면 같은 식을 순수 Python으로 기사마다 계산
+#######################
+"""
+import logging
+import math
+from collections import Counter
+
+from .corpus_index import document_terms, get_corpus_index, smoothed_idf
+from .summarizer import ArticleSummarizer
+
+logger = logging.getLogger(__name__)
+
+VECTOR_METHODS = ('tfidf', 'textrank')
+
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_MAX_ITER = 50
+TEXTRANK_TOLERANCE = 1e-6
+
+
+def check_vector_engine_available():
+    """NumPy/SciPy 희소 행렬 엔진 사용 가능 여부 (없으면 순수 Python으로 계산)"""
+    try:
+        import numpy  # noqa: F401
+        import scipy.sparse  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+#######################
+# 코퍼스 문서 빈도
+#######################
+class CorpusStats:
+    """문서 수와 단어별 문서 빈도를 메모리에 든 코퍼스 통계 (CorpusIndex와 같은 idf 인터페이스)"""
+
+    def __init__(self, num_docs=0, document_frequency=None):
+        self.num_docs = num_docs
+        self.document_frequency = document_frequency or {}
+
+    def idf(self, word):
+        """평활화한 IDF (코퍼스에 없는 단어가 가장 큼)"""
+        return smoothed_idf(self.num_docs, self.document_frequency.get(word, 0))
+
+
+def build_corpus_stats(texts):
+    """본문 목록으로 메모리 CorpusStats 생성 (문서마다 서로 다른 소문자 토큰 집합을 셈)"""
+    document_frequency = Counter()
+    num_docs = 0
+    for text in texts:
+        terms = document_terms(text)
+        if not terms:
+            continue
+        document_frequency.update(terms)
+        num_docs += 1
+    return CorpusStats(num_docs, dict(document_frequency))
+
+
+_corpus_stats = None
+
+
+def get_corpus_stats():
+    """
+    IDF 계산에 쓰는 코퍼스 통계
+
+    reset_corpus_stats로 넣은 CorpusStats가 있으면 그것을, 없으면 collect_news가 갱신하는
+    crawled_news 문서 빈도 인덱스(프로세스당 한 번 mmap)를 사용합니다.
+    """
+    return _corpus_stats if _corpus_stats is not None else get_corpus_index()
+
+
+def reset_corpus_stats(stats=None):
+    """CorpusStats 교체/초기화 (테스트용, None이면 문서 빈도 인덱스 사용)"""
+    global _corpus_stats
+    _corpus_stats = stats
+
+
+#######################
+# 요약기
+#######################
+class VectorArticleSummarizer(ArticleSummarizer):
+    """
+    TF-IDF / TextRank 점수로 문장을 고르는 추출형 요약기
+
+    사용법:
+        summarizer = VectorArticleSummarizer(method='textrank', language='ko')
+        result = summarizer.summarize(text, max_length=200, min_length=50)
+        results = summarizer.summarize_many(texts)   # 여러 기사를 한 번의 행렬 연산으로
+    """
+
+    def __init__(self, method='tfidf', language='ko', corpus=None):
+        if method not in VECTOR_METHODS:
+            raise ValueError(f"Unknown vector summarize method: {method}")
+        super().__init__(language=language)
+        self.method = method
+        self._corpus = corpus
+
+    @property
+    def model_id(self):
+        # 요약 캐시 키 (점수 방식/알고리즘 버전)
+        return f'{self.method}-v1'
+
+    @property
+    def corpus(self):
+        return self._corpus if self._corpus is not None else get_corpus_stats()
+
+    def summarize(self, text, max_length=200, min_length=50):
+        return self._summarize_batch([text], max_length, min_length)[0]
+
+    def summarize_many(self, texts, max_length=200, min_length=50):
+        """
+        여러 기사 요약 (입력 순서 유지)
+
+        배치 계산이 실패하면 기사마다 다시 요약하고, 그래도 실패한 기사는 None
+        (summarizer.summarize_many와 같은 규약)
+        """
+        texts = list(texts)
+        try:
+            return self._summarize_batch(texts, max_length, min_length)
+        except Exception:
+            logger.exception("%s 배치 요약 실패, 기사별로 다시 요약", self.method)
+
+        results = []
+        for text in texts:
+            try:
+                results.append(self.summarize(text, max_length=max_length, min_length=min_length))
+            except Exception:
+                logger.exception("%s 요약 실패 (%d자)", self.method, len(text))
+                results.append(None)
+        return results
+
+    def _summarize_batch(self, texts, max_length, min_length):
+        analyses = [self._analyze(text) for text in texts]
+        scored = [analysis for analysis in analyses if analysis.sentences]
+        if check_vector_engine_available():
+            scores = self._score_sparse(scored)
+        else:
+            scores = [self._score_python(analysis) for analysis in scored]
+
+        results = []
+        batch_scores = iter(scores)
+        for analysis in analyses:
+            if not analysis.sentences:
+                results.append(self._empty_result(analysis.text, max_length))
+            else:
+                results.append(self._compose(analysis, next(batch_scores), max_length, min_length))
+        return results
+
+    #######################
+    # 순수 Python 점수 계산 (기사 한 건)
+    #######################
+    def _score_python(self, analysis):
+        corpus = self.corpus
+        idf = {word: corpus.idf(word) for word in analysis.word_counts}
+
+        if self.method == 'tfidf':
+            weights = {
+                word: frequency * idf[word]
+                for word, frequency in self._calculate_word_frequency(analysis.word_counts).items()
+            }
+            scores = []
+            for start, end in analysis.spans:
+                tokens = analysis.tokens[start:end]
+                score = sum(weights.get(token, 0) for token in tokens)
+                scores.append(score / len(tokens) if tokens else 0.0)
+            return scores
+
+        # textrank: 문장 TF-IDF 벡터 (L2 정규화)
+        vectors = []
+        for start, end in analysis.spans:
+            counts = Counter(token for token in analysis.tokens[start:end] if token in idf)
+            vector = {word: count * idf[word] for word, count in counts.items()}
+            norm = math.sqrt(sum(value * value for value in vector.values()))
+            vectors.append({word: value / norm for word, value in vector.items()} if norm else {})
+
+        n = len(vectors)
+        # 행 정규화한 코사인 유사도 (자기 자신 제외)
+        transitions = []
+        for i, vector in enumerate(vectors):
+            row = {}
+            for j, other in enumerate(vectors):
+                if i == j:
+                    continue
+                if len(other) < len(vector):
+                    similarity = sum(value * vector.get(word, 0) for word, value in other.items())
+                else:
+                    similarity = sum(value * other.get(word, 0) for word, value in vector.items())
+                if similarity > 0:
+                    row[j] = similarity
+            total = sum(row.values())
+            transitions.append({j: value / total for j, value in row.items()} if total else {})
+        return self._pagerank_python(transitions, n)
+
+    @staticmethod
+    def _pagerank_python(transitions, n):
+        teleport = (1 - TEXTRANK_DAMPING) / n
+        ranks = [1.0 / n] * n
+        for _ in range(TEXTRANK_MAX_ITER):
+            updated = [teleport] * n
+            for i, row in enumerate(transitions):
+                for j, probability in row.items():
+                    updated[j] += TEXTRANK_DAMPING * ranks[i] * probability
+            delta = max(abs(a - b) for a, b in zip(updated, ranks))
+            ranks = updated
+            if delta < TEXTRANK_TOLERANCE:
+                break
+        return ranks
+
+    #######################
+    # 희소 행렬 점수 계산 (여러 기사 한 번에)
+    #######################
+    def _score_sparse(self, analyses):
+        """
+        배치 전체 문장을 (문장 x 단어) 희소 행렬 하나로 만들어 점수 계산
+
+        Returns:
+            list: 기사별 문장 점수 리스트
+        """
+        import numpy as np
+        from scipy import sparse
+
+        if not analyses:
+            return []
+
+        corpus = self.corpus
+        vocabulary = {}
+        rows, cols = [], []          # 문장-단어 출현 (중복은 tocsr에서 합산)
+        lengths = []                 # 문장별 전체 토큰 수 (불용어 포함)
+        sentence_article = []        # 문장 -> 기사 번호
+        tf_rows, tf_cols, tf_values = [], [], []  # 기사별 정규화 빈도
+        sentence_index = 0
+        for article, analysis in enumerate(analyses):
+            word_counts = analysis.word_counts
+            max_count = max(word_counts.values()) if word_counts else 1
+            for word, count in word_counts.items():
+                tf_rows.append(article)
+                tf_cols.append(vocabulary.setdefault(word, len(vocabulary)))
+                tf_values.append(count / max_count)
+
+            for start, end in analysis.spans:
+                for token in analysis.tokens[start:end]:
+                    column = vocabulary.get(token) if token in word_counts else None
+                    if column is not None:
+                        rows.append(sentence_index)
+                        cols.append(column)
+                lengths.append(end - start)
+                sentence_article.append(article)
+                sentence_index += 1
+
+        num_sentences = sentence_index
+        num_words = len(vocabulary)
+        idf = np.fromiter(
+            (corpus.idf(word) for word in vocabulary), dtype=np.float64, count=num_words
+        )
+        sentence_article = np.asarray(sentence_article, dtype=np.int64)
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        ones = np.ones(len(rows), dtype=np.float64)
+
+        if self.method == 'tfidf':
+            counts = sparse.csr_matrix((ones, (rows, cols)), shape=(num_sentences, num_words))
+            tf = sparse.csr_matrix(
+                (tf_values, (tf_rows, tf_cols)), shape=(len(analyses), num_words)
+            )
+            # 문장 행마다 그 기사의 정규화 빈도를 곱한 뒤 IDF와 내적
+            totals = counts.multiply(tf[sentence_article]).tocsr() @ idf
+            lengths = np.asarray(lengths, dtype=np.float64)
+            scores = np.divide(totals, lengths, out=np.zeros(num_sentences), where=lengths > 0)
+        else:
+            # 단어 열을 기사별로 분리 -> X @ X.T 가 기사별 블록 대각 유사도 행렬
+            block_cols = sentence_article[rows] * num_words + cols
+            vectors = sparse.csr_matrix(
+                (idf[cols], (rows, block_cols)), shape=(num_sentences, len(analyses) * num_words)
+            )
+            norms = np.sqrt(np.asarray(vectors.multiply(vectors).sum(axis=1)).ravel())
+            inverse_norms = np.divide(1.0, norms, out=np.zeros(num_sentences), where=norms > 0)
+            vectors = sparse.diags(inverse_norms) @ vectors
+            similarity = (vectors @ vectors.T).tocsr()
+            similarity = (similarity - sparse.diags(similarity.diagonal())).tocsr()  # 자기 자신 제외
+            similarity.eliminate_zeros()
+
+            row_sums = np.asarray(similarity.sum(axis=1)).ravel()
+            inverse_sums = np.divide(1.0, row_sums, out=np.zeros(num_sentences), where=row_sums > 0)
+            transitions_t = (sparse.diags(inverse_sums) @ similarity).T.tocsr()
+
+            article_sizes = np.bincount(sentence_article, minlength=len(analyses))
+            teleport = (1 - TEXTRANK_DAMPING) / article_sizes[sentence_article]
+            scores = 1.0 / article_sizes[sentence_article]
+            # 기사마다 따로 수렴 판정 (_pagerank_python과 같은 반복에서 멈추도록, 배치 구성과 무관)
+            # 블록 대각 행렬이라 수렴한 기사의 점수를 고정해도 다른 기사에 영향이 없음
+            active = np.ones(num_sentences, dtype=bool)
+            for _ in range(TEXTRANK_MAX_ITER):
+                updated = teleport + TEXTRANK_DAMPING * (transitions_t @ scores)
+                updated = np.where(active, updated, scores)
+                deltas = np.zeros(len(analyses))
+                np.maximum.at(deltas, sentence_article, np.abs(updated - scores))
+                scores = updated
+                active &= deltas[sentence_article] >= TEXTRANK_TOLERANCE
+                if not active.any():
+                    break
+
+        offsets = np.cumsum([0] + [len(analysis.sentences) for analysis in analyses])
+        return [scores[offsets[i]:offsets[i + 1]].tolist() for i in range(len(analyses))]
@@ -73,6 +73,72 @@ def pytest_configure(config):
 # django_db_setup 제거 - pytest-django 기본 동작(migrate 실행)을 사용
 
 
+@pytest.fixture(autouse=True)
+def _isolate_dns_cache():
+    """테스트마다 getaddrinfo monkeypatch가 이전 테스트의 DNS 캐시에 가려지지 않게 한다."""
+    from api.services.url_security import clear_dns_cache
+
+    clear_dns_cache()
+    yield
+    clear_dns_cache()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_extraction_cache():
+    """프로세스 공용 추출 캐시가 테스트 사이에 결과를 넘기지 않게 비운다."""
+    from api.services.extraction_cache import get_extraction_cache
+
+    get_extraction_cache().clear()
+    yield
+    get_extraction_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_summary_cache():
+    """요약 캐시가 테스트 사이에 결과를 넘기지 않게 비운다."""
+    from api.services.summary_cache import get_summary_cache
+
+    get_summary_cache().clear()
+    yield
+    get_summary_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_preload_state():
+    """모델 사전 로드 상태가 다른 테스트의 /api/health 결과를 바꾸지 않게 한다."""
+    from api.services.model_preload import reset_preload_state
+
+    reset_preload_state()
+    yield
+    reset_preload_state()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_moderation_cache():
+    """모더레이션 캐시/모델 재시도 상태가 테스트 사이에 넘어가지 않게 비운다."""
+    from api.services.ai_moderation import get_model_retry_schedule, get_moderation_cache
+
+    get_moderation_cache().clear()
+    get_model_retry_schedule().clear()
+    yield
+    get_moderation_cache().clear()
+    get_model_retry_schedule().clear()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_corpus_index(tmp_path, monkeypatch):
+    """코퍼스 문서 빈도(IDF) 인덱스를 테스트마다 빈 임시 경로로 돌린다."""
+    from api.services import corpus_index
+    from api.services.vector_summarizer import reset_corpus_stats
+
+    monkeypatch.setattr(corpus_index, "CORPUS_INDEX_PATH", tmp_path / "corpus_data" / "df_index.bin")
+    corpus_index.reset_corpus_index()
+    reset_corpus_stats()
+    yield
+    corpus_index.reset_corpus_index()
+    reset_corpus_stats()
+
+
 # ---------------------------------------------------------------------------
 # FilterResult mock helper
 # ---------------------------------------------------------------------------
@@ -87,6 +153,7 @@ class FakeFilterResult:
         self.filter_type = "LLM" if is_filtered else None
         self.matched_pattern = None
         self.reason = "LLM 판단: 부적절한 표현" if is_filtered else None
+        self.score = None
 
 
 class FakeModerationResult:
@@ -103,6 +170,7 @@ class FakeModerationResult:
         self.processing_time_ms = 10
         self.cached = False
         self.error = None
+        self.matched_rules = ["profanity.sibal"] if is_flagged else []
 
     def to_dict(self):
         return {
@@ -116,6 +184,7 @@ class FakeModerationResult:
             "processing_time_ms": self.processing_time_ms,
             "cached": self.cached,
             "error": self.error,
+            "matched_rules": self.matched_rules,
         }
 
 
@@ -15,6 +15,7 @@ AI 라이브러리(transformers, torch)는 conftest.py에서 stub으로 대체
 실제 LLM/모델 호출이 없어야 테스트가 빠르게 통과합니다.
 """
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -63,6 +64,31 @@ class TestHealthCheckEndpoint:
         # Cache-Control 헤더 확인 (never_cache 데코레이터)
         assert response.status_code == 200
 
+    def test_health_check_warming_returns_503(self, client, monkeypatch):
+        """GET /api/health - 모델 사전 로드 중이면 503 warming, 완료되면 200 ready"""
+        from api.services import model_preload
+
+        gate = threading.Event()
+
+        def slow_loader():
+            gate.wait(5)
+            return lambda: None
+
+        monkeypatch.setitem(model_preload.PRELOADERS, "slow", slow_loader)
+        thread = model_preload.start_preload(["slow"], warmup=False)
+
+        warming = client.get("/api/health")
+        gate.set()
+        thread.join(5)
+        ready = client.get("/api/health")
+
+        assert warming.status_code == 503
+        assert warming.json()["status"] == "warming"
+        assert warming.json()["preload"]["slow"]["status"] in ("pending", "loading")
+        assert ready.status_code == 200
+        assert ready.json()["status"] == "ok"
+        assert ready.json()["models"] == "ready"
+
 
 # ---------------------------------------------------------------------------
 # 2. POST /api/summarize -> 200 (rule 방식)
@@ -182,6 +208,40 @@ class TestSummarizeEndpoint:
         # AI 불가 시 rule로 폴백하므로 summarize_method는 'rule'이어야 함
         assert data.get("summarize_method") == "rule"
 
+    def test_summarize_repeated_text_uses_summary_cache(self, client):
+        """POST /api/summarize - 같은 본문/조건 재요청 시 cached: true, 요약기 1회 호출"""
+        payload = {
+            "input_type": "text",
+            "summarize_method": "rule",
+            "text": (
+                "인공지능 기술의 발전으로 우리 생활에 많은 변화가 일어나고 있습니다. "
+                "자연어 처리 기술이 번역, 요약, 대화 등 다양한 분야에서 활용되고 있습니다."
+            ),
+            "language": "ko",
+            "max_length": 200,
+            "min_length": 30,
+        }
+
+        from api.services.summarizer import ArticleSummarizer
+
+        with patch.object(
+            ArticleSummarizer, "summarize", autospec=True,
+            side_effect=lambda self, text, max_length, min_length: {
+                "summary": "요약", "bullets": ["요약"], "keywords": ["인공지능"],
+            },
+        ) as summarize:
+            responses = [
+                client.post("/api/ai/summarize", data=json.dumps(payload), content_type="application/json")
+                for _ in range(2)
+            ]
+            payload["max_length"] = 150
+            changed = client.post("/api/ai/summarize", data=json.dumps(payload), content_type="application/json")
+
+        assert [r.json()["cached"] for r in responses] == [False, True]
+        assert responses[1].json()["summary"] == "요약"
+        assert changed.json()["cached"] is False
+        assert summarize.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # 3. POST /api/news/batch-summarize -> 200
@@ -280,6 +340,30 @@ class TestBatchSummarizeEndpoint:
         data = response.json()
         assert "success" in data
 
+    def test_batch_summarize_reuses_cached_summaries(self, client):
+        """POST /api/news/batch-summarize - 같은 기사 재요약 시 항목별 cached: true"""
+        text = (
+            "인공지능 기술의 발전으로 우리 생활에 많은 변화가 일어나고 있습니다. "
+            "자연어 처리 기술이 번역, 요약, 대화 등 다양한 분야에서 활용되고 있습니다."
+        )
+        payload = {
+            "items": [{"title": "A", "origainal_news": text}, {"title": "B", "origainal_news": text}],
+            "method": "rule",
+        }
+
+        with patch(
+            "api.services.news_crawler.SummarizedNewsManager.save_summarized_news",
+            return_value={"success": True, "filename": "f.json", "count": 2},
+        ):
+            response = client.post(
+                "/api/news/batch-summarize",
+                data=json.dumps(payload),
+                content_type="application/json",
+            )
+
+        assert response.status_code == 200
+        assert [item["cached"] for item in response.json()["items"]] == [False, True]
+
 
 # ---------------------------------------------------------------------------
 # 4. POST /api/comments/filter/test -> 200
@@ -297,6 +381,7 @@ class TestCommentFilterTestEndpoint:
         fake_result.filter_type = None
         fake_result.matched_pattern = None
         fake_result.reason = None
+        fake_result.score = None
 
         fake_service = MagicMock()
         fake_service.filter_comment = MagicMock(return_value=fake_result)
@@ -340,6 +425,7 @@ class TestCommentFilterTestEndpoint:
         fake_result.filter_type = None
         fake_result.matched_pattern = None
         fake_result.reason = None
+        fake_result.score = None
 
         fake_service = MagicMock()
         fake_service.filter_comment = MagicMock(return_value=fake_result)
@@ -382,6 +468,7 @@ class TestCommentFilterBatchEndpoint:
         fake_result.filter_type = None
         fake_result.matched_pattern = None
         fake_result.reason = None
+        fake_result.score = None
 
         fake_service = MagicMock()
         fake_service.batch_filter = MagicMock(return_value=[fake_result, fake_result])
@@ -409,6 +496,7 @@ class TestCommentFilterBatchEndpoint:
         """POST /api/comments/filter/batch 응답 구조 확인"""
         fake_result = MagicMock()
         fake_result.is_filtered = False
+        fake_result.score = None
 
         fake_service = MagicMock()
         fake_service.batch_filter = MagicMock(return_value=[fake_result])
@@ -723,3 +811,46 @@ class TestAIModerationStatusEndpoint:
         data = response.json()
         assert data["available"] is True
         assert data["transformers_installed"] is True
+
+    def test_moderation_status_reports_cache_stats(self, client):
+        """GET /api/moderation/status - 결과 캐시 hits/misses/evictions 포함"""
+        from api.services.ai_moderation import get_moderation_cache
+
+        cache = get_moderation_cache()
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("missing")
+
+        response = client.get("/api/ai/moderate/status")
+
+        stats = response.json()["cache"]
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 1, 0)
+
+
+# ---------------------------------------------------------------------------
+# GET /api/ai/metrics -> 200
+# ---------------------------------------------------------------------------
+class TestAIMetricsEndpoint:
+    """AIMetricsView 테스트"""
+
+    def test_metrics_reports_cache_sections(self, client):
+        """GET /api/ai/metrics - 캐시별 지표 섹션 포함"""
+        response = client.get("/api/ai/metrics")
+
+        assert response.status_code == 200
+        data = response.json()
+        for section in ("prefix_cache", "summary_cache", "extraction_cache", "dns_cache"):
+            assert section in data
+        assert "hit_rate" in data["summary_cache"]
+
+    def test_metrics_reports_worker_memory(self, client):
+        """GET /api/ai/metrics - 응답한 워커의 메모리 리포트 (gunicorn 밖에서는 gunicorn=None)"""
+        import os
+
+        response = client.get("/api/ai/metrics")
+
+        memory = response.json()["memory"]
+        assert memory["preload_mode"] in ("worker", "master")
+        assert memory["gunicorn"] is None
+        if memory["process"] is not None:
+            assert memory["process"]["pid"] == os.getpid()
@@ -0,0 +1,323 @@
+"""
+AIContentModerator.batch_check 배치 추론 테스트
+
+실제 HF pipeline 대신 호출 인자를 기록하는 가짜 pipeline을 주입합니다.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.services import ai_moderation
+from api.services.ai_moderation import AIContentModerator
+
+
+class FakePipeline:
+    """text-classification pipeline stub: 'nasty'가 포함되면 toxic"""
+
+    def __init__(self):
+        self.calls = []
+
+    def _classify(self, text):
+        if 'nasty' in text:
+            return {'label': 'toxic', 'score': 0.9}
+        return {'label': 'clean', 'score': 0.2}
+
+    def __call__(self, inputs, **kwargs):
+        self.calls.append((inputs, kwargs))
+        if isinstance(inputs, str):
+            return [self._classify(inputs)]
+        return [self._classify(text) for text in inputs]
+
+
+@pytest.fixture
+def moderator():
+    moderator = AIContentModerator(language='ko')
+    moderator._model = FakePipeline()
+    return moderator
+
+
+class TestBatchCheck:
+
+    def test_only_misses_go_through_single_pipeline_call(self, moderator):
+        moderator.check('cached nasty text')
+        moderator._model.calls.clear()
+
+        texts = ['hello', '', 'cached nasty text', 'ㅅㅂ 뭐야', 'nasty words', 'hello']
+        results = moderator.batch_check(texts, batch_size=8, max_length=128)
+
+        assert len(moderator._model.calls) == 1
+        inputs, kwargs = moderator._model.calls[0]
+        assert inputs == ['hello', 'nasty words']
+        assert kwargs == {'batch_size': 8, 'truncation': True, 'max_length': 128}
+
+        assert [r.model_used for r in results] == ['ko', 'none', 'ko', 'rule_based', 'ko', 'ko']
+        assert results[2].cached is True
+        assert results[3].highest_category == 'profanity'
+        assert results[4].is_flagged and results[4].highest_category == 'harassment'
+        assert not results[0].is_flagged
+
+    def test_results_match_single_check_format(self, moderator):
+        texts = ['good morning', 'nasty reply', '광고 클릭 무료 당첨']
+        batch = [r.to_dict() for r in moderator.batch_check(texts, use_cache=False)]
+        single = [moderator.check(t, use_cache=False).to_dict() for t in texts]
+
+        for b, s in zip(batch, single):
+            b.pop('processing_time_ms')
+            s.pop('processing_time_ms')
+            assert b == s
+
+    def test_batch_results_are_cached(self, moderator):
+        moderator.batch_check(['first', 'second'])
+        moderator._model.calls.clear()
+
+        results = moderator.batch_check(['second', 'first'])
+
+        assert moderator._model.calls == []
+        assert all(r.cached for r in results)
+
+    def test_long_text_is_truncated_before_pipeline(self, moderator, monkeypatch):
+        monkeypatch.setattr(ai_moderation, 'MODERATION_MAX_CHARS', 10)
+
+        moderator.batch_check(['a' * 50])
+
+        inputs, _ = moderator._model.calls[0]
+        assert inputs == ['a' * 10]
+
+    def test_model_unavailable_returns_rule_based_only(self, moderator, monkeypatch):
+        moderator._model = None
+        monkeypatch.setattr(ai_moderation, '_get_korean_model', lambda: None)
+
+        results = moderator.batch_check(['hello', 'ㅂㅅ'])
+
+        assert results[0].model_used == 'rule_based_only'
+        assert results[0].error
+        assert results[1].model_used == 'rule_based'
+
+    def test_pipeline_error_marks_only_misses(self, moderator):
+        def broken(inputs, **kwargs):
+            raise RuntimeError('CUDA out of memory')
+
+        moderator._model = broken
+        results = moderator.batch_check(['hello', 'ㅂㅅ', 'world'])
+
+        assert [r.model_used for r in results] == ['error', 'rule_based', 'error']
+        assert results[0].error == 'CUDA out of memory'
+        assert not ai_moderation.get_model_retry_schedule().ready('korean')
+
+
+class TestRuleEngine:
+
+    @pytest.mark.parametrize('text, rule', [
+        ('아 시발ㅋㅋ', 'profanity.sibal'),
+        ('씨팔 진짜', 'profanity.ssibal'),
+        ('ㅅㅂ', 'profanity.sb_initials'),
+        ('이런 병싄', 'profanity.byungsin'),
+        ('ㅄ', 'profanity.bs_ligature'),
+    ])
+    def test_profanity_reports_matched_rule(self, moderator, text, rule):
+        result = moderator._rule_based_check(text)
+
+        assert result.is_flagged
+        assert result.highest_category == 'profanity'
+        assert result.matched_rules == [rule]
+        assert result.to_dict()['matched_rules'] == [rule]
+
+    @pytest.mark.parametrize('text, expected', [
+        ('http://a.kr ' * 4, ['spam.excessive_urls']),
+        ('http://a.kr ' * 3, []),
+        (''.join(chr(0x1F600 + i) for i in range(11)), ['spam.excessive_emoji']),
+        (''.join(chr(0x1F600 + i) for i in range(10)), []),
+        ('ㅋ' * 11, ['spam.repeated_chars']),
+        ('ㅋ' * 10, []),
+        ('무료 이벤트', ['spam.keywords']),
+    ])
+    def test_spam_indicator_boundaries(self, text, expected):
+        _, spam_rules = ai_moderation.get_rule_engine().scan(text)
+
+        assert spam_rules == expected
+
+    def test_spam_score_and_flagging(self, moderator):
+        partial = moderator._rule_based_check('무료 당첨 ' + 'ㅋ' * 12)
+        full = moderator._rule_based_check(
+            '광고 ' + 'http://a.kr ' * 4 + '😀' * 11 + '!' * 11
+        )
+
+        assert not partial.is_flagged
+        assert partial.categories[0].score == 0.5
+        assert partial.matched_rules == ['spam.repeated_chars', 'spam.keywords']
+        assert full.is_flagged and full.highest_category == 'spam'
+        assert full.matched_rules == [
+            'spam.excessive_urls', 'spam.excessive_emoji',
+            'spam.repeated_chars', 'spam.keywords',
+        ]
+
+    def test_profanity_and_spam_in_one_scan(self, moderator):
+        result = moderator._rule_based_check('광고 보고 와라 ㅂㅅ아 ' + 'http://a.kr ' * 4)
+
+        assert result.highest_category == 'profanity'
+        assert result.matched_rules == [
+            'profanity.bs_initials', 'spam.excessive_urls', 'spam.keywords',
+        ]
+
+    def test_clean_text_has_no_rules(self, moderator):
+        result = moderator._rule_based_check('오늘 무대 정말 좋았어요')
+
+        assert not result.is_flagged
+        assert result.matched_rules == []
+        assert result.categories == []
+
+
+class TestModerationCache:
+
+    def test_cached_copy_does_not_mutate_stored_result(self, moderator):
+        first = moderator.check('hello there')
+        second = moderator.check('hello there')
+
+        assert first.cached is False
+        assert second.cached is True
+        assert second.to_dict()['categories'] == first.to_dict()['categories']
+
+    def test_stats_count_hits_misses_and_evictions(self, moderator, monkeypatch):
+        cache = ai_moderation.ResultCache('moderation-test', maxsize=2, ttl=60)
+        monkeypatch.setattr(ai_moderation, '_cache', cache)
+
+        for text in ['one', 'two', 'three', 'three']:
+            moderator.check(text)
+
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 3, 1)
+        assert stats['size'] == 2
+
+    def test_shared_backend_serves_other_workers(self, moderator, monkeypatch):
+        monkeypatch.setattr(
+            ai_moderation, '_cache',
+            ai_moderation.ResultCache('moderation-shared-test', maxsize=8, ttl=60, use_django=True),
+        )
+        moderator.check('shared text')
+
+        other_worker = ai_moderation.ResultCache(
+            'moderation-shared-test', maxsize=8, ttl=60, use_django=True
+        )
+        monkeypatch.setattr(ai_moderation, '_cache', other_worker)
+        moderator._model.calls.clear()
+        result = moderator.check('shared text')
+
+        assert result.cached is True
+        assert result.model_used == 'ko'
+        assert moderator._model.calls == []
+
+
+class TestCompactEntries:
+
+    @pytest.mark.parametrize('result', [
+        ai_moderation.ModerationResult(
+            is_flagged=True, action='block',
+            categories=[
+                ai_moderation.ModerationCategory('profanity', 0.95, True, 0.7),
+                ai_moderation.ModerationCategory('spam', 0.5, False, 0.8),
+            ],
+            highest_category='profanity', highest_score=0.95, confidence=0.95,
+            model_used='rule_based', processing_time_ms=3,
+            matched_rules=['profanity.sibal', 'spam.repeated_chars', 'spam.keywords'],
+        ),
+        ai_moderation.ModerationResult(
+            categories=[ai_moderation.ModerationCategory('clean', 0.123456, False, 0.65)],
+            highest_category='clean', highest_score=0.123456, confidence=0.876544,
+            model_used='ja', processing_time_ms=41,
+        ),
+        ai_moderation.ModerationResult(model_used='error', error=''),
+        ai_moderation.ModerationResult(model_used='rule_based_only', error='AI model not available'),
+    ])
+    def test_round_trip_preserves_response(self, result):
+        entry = ai_moderation._pack_result(result)
+
+        assert isinstance(entry, bytes)
+        assert ai_moderation._unpack_result(entry).to_dict() == result.to_dict()
+
+    def test_unknown_category_is_stored_as_object(self):
+        result = ai_moderation.ModerationResult(
+            categories=[ai_moderation.ModerationCategory('custom', 0.4, False, 0.7)]
+        )
+
+        entry = ai_moderation._pack_result(result)
+
+        assert entry is result
+        assert ai_moderation._unpack_result(entry) is not result
+
+    def test_cache_key_is_binary_digest(self):
+        key = ai_moderation._get_cache_key('text', ai_moderation.DEFAULT_THRESHOLDS)
+
+        assert isinstance(key, bytes) and len(key) == 16
+
+
+class TestDegradedResults:
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        from api.services import result_cache
+
+        now = [1000.0]
+        monkeypatch.setattr(result_cache.time, 'monotonic', lambda: now[0])
+        monkeypatch.setattr(ai_moderation.time, 'monotonic', lambda: now[0])
+        return now
+
+    @pytest.fixture
+    def failing_loader(self, monkeypatch):
+        calls = []
+
+        def pipeline_fn(**kwargs):
+            calls.append(kwargs)
+            raise OSError('model download failed')
+
+        monkeypatch.setattr(ai_moderation, '_get_pipeline', lambda: pipeline_fn)
+        monkeypatch.setattr(ai_moderation, '_models', {})
+        return calls
+
+    def test_rule_based_only_result_is_negatively_cached(self, clock, failing_loader, monkeypatch):
+        monkeypatch.setattr(ai_moderation, 'MODERATION_NEGATIVE_CACHE_TTL', 30)
+        moderator = AIContentModerator(language='ko')
+
+        first = moderator.check('hello')
+        second = moderator.check('hello')
+        clock[0] += 31
+        moderator.check('hello')
+
+        assert first.model_used == 'rule_based_only'
+        assert second.cached is True and second.error == first.error
+        stats = ai_moderation.get_moderation_cache().stats()
+        assert stats['hits'] == 1 and stats['expirations'] == 1
+
+    def test_model_load_follows_retry_schedule(self, clock, failing_loader):
+        schedule = ai_moderation.get_model_retry_schedule()
+        moderator = AIContentModerator(language='ko')
+
+        moderator.check('one', use_cache=False)
+        moderator.check('two', use_cache=False)
+        assert len(failing_loader) == 1
+
+        clock[0] += schedule.base
+        moderator.check('three', use_cache=False)
+        assert len(failing_loader) == 2
+        assert schedule.status()['korean']['retry_in_s'] == schedule.base * 2
+
+    def test_retry_delay_is_capped(self):
+        schedule = ai_moderation.ModelRetrySchedule(base=30, max_delay=100)
+
+        delays = [schedule.record_failure('korean', 'boom') for _ in range(4)]
+
+        assert delays == [30, 60, 100, 100]
+
+    def test_inference_failure_pauses_model_until_retry(self, clock, moderator):
+        healthy = moderator._model
+        moderator._model = MagicMock(side_effect=RuntimeError('CUDA error'))
+
+        failed = moderator.check('first')
+        skipped = moderator.check('second')
+        moderator._model = healthy
+        clock[0] += ai_moderation.get_model_retry_schedule().base
+        recovered = moderator.check('third')
+
+        assert failed.model_used == 'error'
+        assert skipped.model_used == 'rule_based_only'
+        assert recovered.model_used == 'ko'
+        assert ai_moderation.get_model_retry_schedule().status() == {}
@@ -0,0 +1,197 @@
+"""
+AISummarizer 긴 기사 map-reduce 테스트
+
+공백 단위 가짜 토크나이저/모델로 chunk 분할, 배치 generate, reduce 입력과
+단계별 토큰 수를 확인한다 (실제 모델 로드 없음).
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from api.services import ai_summarizer
+from api.services.ai_summarizer import AISummarizer, plan_chunks
+
+
+class FakeRows(list):
+    def __getitem__(self, index):
+        value = super().__getitem__(index)
+        return FakeRows(value) if isinstance(index, slice) else value
+
+    def tolist(self):
+        return list(self)
+
+
+class FakeTensor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.shape = (len(rows), len(rows[0]) if rows else 0)
+
+
+class FakeBatch(dict):
+    def to(self, device):
+        return self
+
+
+class WordTokenizer:
+    """공백으로 나눈 단어 하나 = 토큰 하나 (0은 패딩)"""
+
+    eos_token = "</s>"
+
+    def __init__(self):
+        self.padding_side = "right"
+        self.pad_token = None
+        self.pad_token_id = 0
+        self.vocab = {}
+        self.words = {}
+
+    def _ids(self, text):
+        ids = []
+        for word in text.split():
+            if word not in self.vocab:
+                self.vocab[word] = len(self.vocab) + 1
+                self.words[self.vocab[word]] = word
+            ids.append(self.vocab[word])
+        return ids
+
+    def __call__(self, texts, add_special_tokens=True):
+        return {"input_ids": [self._ids(text) for text in texts]}
+
+    def pad(self, features, padding, return_tensors):
+        assert self.padding_side == "left"
+        rows = features["input_ids"]
+        width = max(len(row) for row in rows)
+        return FakeBatch(input_ids=FakeTensor([[0] * (width - len(row)) + row for row in rows]))
+
+    def decode(self, ids, skip_special_tokens=True):
+        return " ".join(self.words[i] for i in ids if i)
+
+
+class FakeModel:
+    """행마다 '[요약] <기사 첫 단어>'를 생성하고, 짧은 행은 뒤를 패딩으로 채움"""
+
+    device = "cpu"
+
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+        self.calls = []
+
+    def generate(self, input_ids, max_new_tokens, max_time, **kwargs):
+        self.calls.append({"rows": input_ids.rows, "max_new_tokens": max_new_tokens, "max_time": max_time})
+        quote = self.tokenizer.vocab['"""']
+        outputs = []
+        for index, row in enumerate(input_ids.rows):
+            first_word = row[row.index(quote) + 1]  # 프롬프트의 기사 첫 단어
+            generated = self.tokenizer._ids(f"[요약] {self.tokenizer.words[first_word]}")
+            outputs.append(FakeRows(row + generated + [0] * index))
+        return outputs
+
+
+@pytest.fixture
+def summarizer(monkeypatch):
+    tokenizer = WordTokenizer()
+    model = FakeModel(tokenizer)
+    monkeypatch.setitem(ai_summarizer._models, "ko", {"type": "llm", "tokenizer": tokenizer, "model": model})
+    monkeypatch.setattr(ai_summarizer, "AI_SUMMARY_CHUNK_TOKENS", 12)
+    monkeypatch.setattr(ai_summarizer, "AI_SUMMARY_MAX_CHUNKS", 3)
+    monkeypatch.setattr(ai_summarizer, "AI_SUMMARY_TIME_BUDGET", 10.0)
+    return AISummarizer(language="ko"), model
+
+
+def _sentence(index, words=5):
+    return " ".join(f"s{index}w{i}" for i in range(words)) + "."
+
+
+def test_plan_chunks_packs_sentences_to_budget():
+    assert plan_chunks([4, 4, 4, 10, 1], budget=10, max_chunks=5) == ([[0, 1], [2], [3], [4]], False)
+    assert plan_chunks([6, 6, 6], budget=10, max_chunks=2) == ([[0], [1]], True)
+
+
+def test_model_id_includes_algorithm_version():
+    # 요약 캐시 키에 들어가므로, 알고리즘이 바뀌면 이전 캐시 결과를 쓰지 않음
+    assert AISummarizer(language="ko").model_id == f"{ai_summarizer.KO_LLM_MODEL_NAME}:v2"
+    assert AISummarizer(language="en").model_id == f"{ai_summarizer.DEFAULT_SUMMARY_MODEL_NAME}:v2"
+
+
+def test_short_article_uses_single_generate(summarizer):
+    ai, model = summarizer
+    text = f"{_sentence(1)} {_sentence(2)}"
+
+    result = ai.summarize(text, max_length=50, min_length=10)
+
+    assert len(model.calls) == 1
+    assert model.calls[0]["max_new_tokens"] == 50
+    assert model.calls[0]["max_time"] == 10.0
+    assert result["summary"] == "[요약] s1w0"
+    assert result["chunks"] == 1 and result["truncated"] is False
+    assert [stage["stage"] for stage in result["stages"]] == ["single"]
+
+
+def test_long_article_maps_chunks_in_one_batch_then_reduces(summarizer):
+    ai, model = summarizer
+    text = " ".join(_sentence(i) for i in range(5))  # 5단어 문장 5개 -> 12토큰 chunk 3개
+
+    result = ai.summarize(text, max_length=40, min_length=10)
+
+    map_call, reduce_call = model.calls
+    assert len(map_call["rows"]) == 3
+    assert map_call["max_new_tokens"] == ai_summarizer.AI_SUMMARY_CHUNK_NEW_TOKENS
+    assert map_call["max_time"] == pytest.approx(10.0 * ai_summarizer.AI_SUMMARY_MAP_TIME_SHARE)
+    assert reduce_call["max_new_tokens"] == 40
+    # reduce 입력은 "[요약]" 표식을 뗀 부분 요약들
+    reduce_words = model.tokenizer.decode(reduce_call["rows"][0]).split()
+    assert reduce_words[-5:] == ["s0w0", "s2w0", "s4w0", '"""', "요약:"]
+
+    assert result["summary"].startswith("[요약]")
+    assert result["chunks"] == 3 and result["truncated"] is False
+    stages = {stage["stage"]: stage for stage in result["stages"]}
+    assert stages["map"]["inputs"] == 3
+    assert stages["map"]["generated_tokens"] == 6  # 행마다 2토큰, 패딩 제외
+    assert stages["reduce"]["inputs"] == 1
+    assert stages["reduce"]["generated_tokens"] == 2
+    assert result["limits"]["max_input_tokens"] == 36
+
+
+def test_reduce_gets_only_the_remaining_time_budget(summarizer, monkeypatch):
+    ai, model = summarizer
+    # 요약 시작 시각 이후의 모든 측정은 7.5초 뒤 (map 단계가 예산 10초 중 7.5초 사용)
+    clock = iter([100.0])
+    monkeypatch.setattr(ai_summarizer, "time", SimpleNamespace(perf_counter=lambda: next(clock, 107.5)))
+    text = " ".join(_sentence(i) for i in range(5))
+
+    ai.summarize(text, max_length=40, min_length=10)
+
+    assert model.calls[1]["max_time"] == pytest.approx(2.5)
+
+
+def test_reduce_is_skipped_when_time_budget_is_spent(summarizer, monkeypatch):
+    ai, model = summarizer
+    # map 단계가 예산 10초를 넘김
+    clock = iter([100.0])
+    monkeypatch.setattr(ai_summarizer, "time", SimpleNamespace(perf_counter=lambda: next(clock, 111.0)))
+    text = " ".join(_sentence(i) for i in range(5))
+
+    result = ai.summarize(text, max_length=40, min_length=10)
+
+    assert len(model.calls) == 1
+    assert result["summary"] == "s0w0 s2w0 s4w0"
+    assert result["stages"][-1]["stage"] == "reduce"
+    assert result["stages"][-1]["skipped"] is True
+
+
+def test_article_beyond_max_chunks_is_truncated(summarizer):
+    ai, model = summarizer
+    text = " ".join(_sentence(i, words=10) for i in range(6))
+
+    result = ai.summarize(text, max_length=40, min_length=10)
+
+    assert result["chunks"] == 3
+    assert result["truncated"] is True
+    assert len(model.calls[0]["rows"]) == 3
+
+
+def test_sentence_longer_than_budget_is_split_by_tokens(summarizer):
+    ai, model = summarizer
+    chunks, truncated = ai._split_chunks(ai._ensure_model(), _sentence(0, words=30))
+
+    assert [len(chunk.split()) for chunk in chunks] == [12, 12, 6]
+    assert truncated is False
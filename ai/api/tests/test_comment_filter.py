@@ -0,0 +1,262 @@
+import threading
+
+import pytest
+
+BLOCK_MARKER = "[toxic]"
+
+
+class FakeTensor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.shape = (len(rows), len(rows[0]) if rows else 0)
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):  # [:, start:]
+            _, columns = index
+            return FakeTensor([row[columns] for row in self.rows])
+        return self.rows[index]
+
+
+class FakeBatch(dict):
+    def to(self, device):
+        return self
+
+
+class FakeTokenizer:
+    eos_token = "</s>"
+    eos_token_id = 0
+
+    def __init__(self):
+        self.padding_side = "right"
+        self.pad_token = None
+        self.pad_token_id = 0
+        self.encode_calls = 0
+
+    def __call__(self, prompts):
+        if isinstance(prompts, str):
+            return {"input_ids": [ord(ch) for ch in prompts]}
+        self.encode_calls += 1
+        return {"input_ids": [[ord(ch) for ch in prompt] for prompt in prompts]}
+
+    def pad(self, features, padding, return_tensors):
+        rows = features["input_ids"]
+        if "attention_mask" in features:
+            return FakeBatch(
+                input_ids=FakeTensor(rows), attention_mask=FakeTensor(features["attention_mask"])
+            )
+        width = max(len(row) for row in rows)
+        assert self.padding_side == "left"
+        padded = [[self.pad_token_id] * (width - len(row)) + row for row in rows]
+        mask = [[0] * (width - len(row)) + [1] * len(row) for row in rows]
+        return FakeBatch(input_ids=FakeTensor(padded), attention_mask=FakeTensor(mask))
+
+    def encode(self, text, add_special_tokens=False):
+        # 앞 공백이 있는 변형은 다른 토큰 ID를 갖는 토크나이저처럼 흉내낸다.
+        return [ord(text.strip()[0]) + (1000 if text.startswith(" ") else 0)]
+
+    def decode(self, ids, skip_special_tokens=True):
+        return "".join(chr(i) for i in ids if i)
+
+
+class FakeLogits:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __getitem__(self, key):
+        if len(key) == 3:  # [:, -1, :]
+            return self
+        _, token_ids = key
+        return FakeLogits([[row.get(token_id, -20.0) for token_id in token_ids] for row in self.rows])
+
+    def float(self):
+        return self
+
+    def tolist(self):
+        return self.rows
+
+
+class FakeModel:
+    device = "cpu"
+
+    def __init__(self):
+        self.batch_sizes = []
+        self.forward_calls = 0
+        self.past_seen = []
+        self.lock = threading.Lock()
+
+    def __call__(self, input_ids, attention_mask, position_ids, past_key_values=None):
+        self.forward_calls += 1
+        self.past_seen.append(past_key_values)
+        rows = []
+        for row in input_ids.rows:
+            prompt = "".join(chr(i) for i in row if i)
+            toxic = BLOCK_MARKER in prompt
+            rows.append({ord("B"): 3.0 if toxic else -2.0, ord("A"): -1.0 if toxic else 2.0})
+        return type("Output", (), {"logits": FakeLogits(rows)})()
+
+    def generate(self, input_ids, attention_mask, max_new_tokens, do_sample, pad_token_id,
+                 past_key_values=None):
+        with self.lock:
+            self.batch_sizes.append(len(input_ids.rows))
+            self.past_seen.append(past_key_values)
+        outputs = []
+        for row in input_ids.rows:
+            prompt = "".join(chr(i) for i in row if i)
+            answer = "BLOCK" if BLOCK_MARKER in prompt else "ALLOW"
+            outputs.append(row + [ord(ch) for ch in answer])
+        return outputs
+
+
+@pytest.fixture
+def fake_bundle(monkeypatch):
+    from api.services import comment_filter
+    from api.services.prefix_cache import PromptPrefixCache
+
+    bundle = {"tokenizer": FakeTokenizer(), "model": FakeModel()}
+    monkeypatch.setattr(comment_filter, "_get_model", lambda: bundle)
+    # 실제 KV 텐서 대신 배치 크기를 담은 표식을 넘긴다.
+    monkeypatch.setattr(
+        PromptPrefixCache, "past_key_values", lambda self, batch_size: ("prefix-kv", batch_size)
+    )
+    return bundle
+
+
+def test_batch_filter_runs_one_generate_per_micro_batch(monkeypatch, fake_bundle):
+    from api.services import comment_filter
+
+    monkeypatch.setattr(comment_filter, "FILTER_MAX_BATCH_SIZE", 4)
+    monkeypatch.setattr(comment_filter, "FILTER_BATCH_WAIT_MS", 0)
+    texts = [f"댓글 {i}" + (f" {BLOCK_MARKER}" if i % 3 == 0 else "") for i in range(10)]
+
+    results = comment_filter.CommentFilterService().batch_filter(texts)
+
+    assert [result.is_filtered for result in results] == [i % 3 == 0 for i in range(10)]
+    assert results[0].rule_id == "LLM_001"
+    assert fake_bundle["model"].batch_sizes == [4, 4, 2]
+    assert fake_bundle["tokenizer"].encode_calls == 1
+    assert fake_bundle["model"].past_seen == [("prefix-kv", 4), ("prefix-kv", 4), ("prefix-kv", 2)]
+
+
+def test_prefix_cache_pads_between_prefix_and_comment(monkeypatch, fake_bundle):
+    from api.services import comment_filter
+    from api.services.prefix_cache import get_prefix_cache_stats
+
+    monkeypatch.setattr(comment_filter, "FILTER_BATCH_WAIT_MS", 0)
+    service = comment_filter.CommentFilterService()
+    service.batch_filter(["짧음", "조금 더 긴 댓글"])
+
+    prefix = service._bundle["prefix_cache"]
+    tokenizer = fake_bundle["tokenizer"]
+    inputs = service._pad_after_prefix(
+        tokenizer, [tokenizer(comment_filter.build_filter_prompt(t))["input_ids"] for t in ("a", "abc")],
+        prefix.prefix_length,
+    )
+    short_row, long_row = inputs["input_ids"].rows
+    assert short_row[:prefix.prefix_length] == prefix.prefix_ids
+    assert short_row[prefix.prefix_length:prefix.prefix_length + 2] == [0, 0]
+    assert short_row[-1] == long_row[-1]
+    assert inputs["attention_mask"].rows[0].count(0) == 2
+
+    stats = get_prefix_cache_stats()["comment_filter"]
+    assert stats["reused_prompts"] == 2
+    assert stats["saved_prefill_tokens"] == 2 * prefix.prefix_length
+
+
+def test_prefix_cache_falls_back_when_tokens_do_not_match(monkeypatch, fake_bundle):
+    from api.services import comment_filter
+
+    monkeypatch.setattr(comment_filter, "FILTER_BATCH_WAIT_MS", 0)
+    service = comment_filter.CommentFilterService()
+    service._ensure_model()["prefix_cache"].prefix_ids = [1, 2, 3]
+
+    results = service.batch_filter(["댓글"])
+
+    assert results[0].is_filtered is False
+    assert fake_bundle["model"].past_seen == [None]
+    assert service._bundle["prefix_cache"].stats()["fallback_prompts"] == 1
+
+
+def test_plan_micro_batches_respects_token_budget():
+    from api.services.comment_filter import plan_micro_batches
+
+    batches = plan_micro_batches([10, 50, 12, 48, 200], max_batch_size=8, max_batch_tokens=100)
+
+    assert batches == [[0, 2], [3, 1], [4]]
+    assert sorted(i for batch in batches for i in batch) == [0, 1, 2, 3, 4]
+
+
+def test_concurrent_single_requests_are_coalesced(monkeypatch, fake_bundle):
+    from api.services import comment_filter
+
+    monkeypatch.setattr(comment_filter, "FILTER_BATCH_WAIT_MS", 200)
+    service = comment_filter.CommentFilterService()
+    texts = [f"댓글 {i}" + (f" {BLOCK_MARKER}" if i == 2 else "") for i in range(5)]
+    results = [None] * len(texts)
+    start = threading.Barrier(len(texts))
+
+    def call(index):
+        start.wait()
+        results[index] = service.filter_comment(texts[index])
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(texts))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert [result.is_filtered for result in results] == [False, False, True, False, False]
+    assert sum(fake_bundle["model"].batch_sizes) == 5
+    assert len(fake_bundle["model"].batch_sizes) < 5
+
+
+def test_coalesced_request_propagates_inference_errors(monkeypatch, fake_bundle):
+    from api.services import comment_filter
+
+    monkeypatch.setattr(comment_filter, "FILTER_BATCH_WAIT_MS", 1)
+
+    def broken_generate(**kwargs):
+        raise RuntimeError("CUDA out of memory")
+
+    monkeypatch.setattr(fake_bundle["model"], "generate", broken_generate)
+
+    with pytest.raises(RuntimeError, match="out of memory"):
+        comment_filter.CommentFilterService().filter_comment("댓글")
+
+
+def test_score_mode_uses_single_forward_pass(monkeypatch, fake_bundle):
+    from api.services import comment_filter
+
+    monkeypatch.setattr(comment_filter, "FILTER_BATCH_WAIT_MS", 0)
+    monkeypatch.setattr(comment_filter, "_position_ids", lambda attention_mask, start=0: None)
+    monkeypatch.setattr(
+        fake_bundle["model"], "generate",
+        lambda **kwargs: pytest.fail("score mode must not decode"),
+    )
+
+    results = comment_filter.CommentFilterService(mode="score").batch_filter(
+        ["좋은 댓글", f"나쁜 댓글 {BLOCK_MARKER}"]
+    )
+
+    assert [result.is_filtered for result in results] == [False, True]
+    assert results[0].score == pytest.approx(comment_filter.block_probability([-2.0], [2.0]), abs=1e-4)
+    assert results[1].score > 0.95
+    assert fake_bundle["model"].forward_calls == 1
+    assert fake_bundle["model"].past_seen == [("prefix-kv", 2)]
+
+
+def test_block_probability_applies_calibration():
+    from api.services.comment_filter import block_probability
+
+    assert block_probability([0.0], [0.0]) == pytest.approx(0.5)
+    assert block_probability([2.0], [0.0], temperature=2.0) == pytest.approx(0.7311, abs=1e-4)
+    assert block_probability([0.0], [0.0], bias=-1.0) == pytest.approx(0.2689, abs=1e-4)
+    # 라벨 후보 토큰이 여러 개면 확률 질량을 합친다.
+    assert block_probability([0.0, 0.0], [0.0]) == pytest.approx(2 / 3)
+    assert block_probability([-1000.0], [1000.0]) == 0.0
+
+
+def test_unknown_filter_mode_is_rejected():
+    from api.services.comment_filter import CommentFilterService
+
+    with pytest.raises(ValueError):
+        CommentFilterService(mode="beam")
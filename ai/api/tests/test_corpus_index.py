@@ -0,0 +1,160 @@
+"""
+코퍼스 문서 빈도(DF) 인덱스 테스트
+
+- 스냅샷 쓰기/mmap 조회
+- CrawledNews 증분 갱신 (마지막 created_at 이후 행 + 재확인 구간의 늦게 커밋된 행)
+- 요약기 키워드 순위에 IDF 반영
+"""
+import pytest
+
+from api.services import corpus_index
+from api.services.corpus_index import (
+    CorpusIndex,
+    get_corpus_index,
+    term_hash,
+    update_corpus_index,
+    write_corpus_index,
+)
+from api.services.summarizer import ArticleSummarizer
+
+
+def _create_news(index, title, content=None, origin_news=None):
+    from api.models import CrawledNews
+
+    return CrawledNews.objects.create(
+        title=title, content=content, origin_news=origin_news, url=f"https://example.com/news/{index}"
+    )
+
+
+def test_missing_snapshot_is_empty_index():
+    index = get_corpus_index()
+
+    assert index.num_docs == 0
+    assert index.document_frequency("세븐틴") == 0
+    assert index.idf("세븐틴") == 1.0
+
+
+def test_snapshot_round_trip_with_colliding_slots(tmp_path):
+    path = tmp_path / "df.bin"
+    words = [f"단어{i}" for i in range(1000)]
+    frequencies = {term_hash(word): i + 1 for i, word in enumerate(words)}
+
+    write_corpus_index(path, 2000, frequencies)
+    index = CorpusIndex.load(path)
+
+    assert index.num_docs == 2000
+    assert index.num_terms == 1000
+    assert index.watermark is None
+    assert [index.document_frequency(word) for word in words] == list(range(1, 1001))
+    assert index.document_frequency("없는단어") == 0
+    assert index.frequencies() == frequencies
+
+
+def test_corrupted_snapshot_falls_back_to_empty_index():
+    path = corpus_index.CORPUS_INDEX_PATH
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not an index" * 10)
+
+    assert get_corpus_index().num_docs == 0
+
+
+@pytest.mark.django_db
+def test_update_counts_only_new_rows_and_reloads():
+    _create_news(1, "세븐틴 월드투어", content="세븐틴 공연 일정")
+    _create_news(2, "뉴진스 컴백", origin_news="뉴진스 신곡 공연")
+    _create_news(3, "")
+
+    first = update_corpus_index()
+    index = get_corpus_index()
+
+    assert first == {"added_docs": 2, "num_docs": 2, "num_terms": 7}
+    assert index.document_frequency("세븐틴") == 1  # 한 기사에 두 번 나와도 1
+    assert index.document_frequency("공연") == 2
+    assert index.watermark is not None
+
+    _create_news(4, "세븐틴 팬미팅")
+    assert update_corpus_index()["added_docs"] == 1
+    assert update_corpus_index()["added_docs"] == 0
+
+    # 다른 프로세스가 스냅샷을 교체한 경우: 확인 간격이 지나면 다시 엶
+    corpus_index._index_checked_at = 0.0
+    reloaded = get_corpus_index()
+    assert reloaded is not index
+    assert reloaded.num_docs == 3
+    assert reloaded.document_frequency("세븐틴") == 2
+
+
+@pytest.mark.django_db
+def test_update_counts_rows_committed_late_behind_the_watermark():
+    from datetime import timedelta
+
+    from api.models import CrawledNews
+
+    first = _create_news(1, "세븐틴 월드투어")
+    assert update_corpus_index()["added_docs"] == 1
+    watermark = get_corpus_index().watermark
+
+    # created_at은 INSERT 전에 찍힘: 늦게 커밋된 행이 마지막 행과 같은 시각이거나 더 이를 수 있음
+    same_time = _create_news(2, "뉴진스 컴백")
+    earlier = _create_news(3, "아이브 팬미팅")
+    CrawledNews.objects.filter(pk=same_time.pk).update(created_at=watermark)
+    CrawledNews.objects.filter(pk=earlier.pk).update(created_at=watermark - timedelta(seconds=30))
+
+    assert update_corpus_index() == {"added_docs": 2, "num_docs": 3, "num_terms": 6}
+    assert update_corpus_index()["added_docs"] == 0  # 재확인 구간의 행은 다시 세지 않음
+    index = get_corpus_index()
+    assert index.document_frequency("세븐틴") == 1
+    assert index.document_frequency("팬미팅") == 1
+    assert set(index.recent_rows()) == {first.pk, same_time.pk, earlier.pk}
+
+
+@pytest.mark.django_db
+def test_update_rebuilds_unreadable_snapshot():
+    path = corpus_index.CORPUS_INDEX_PATH
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"FPDF" + (1).to_bytes(4, "little") + bytes(32))
+    _create_news(1, "세븐틴 월드투어")
+
+    assert update_corpus_index() == {"added_docs": 1, "num_docs": 1, "num_terms": 2}
+
+
+@pytest.mark.django_db
+def test_get_corpus_index_is_loaded_once_per_process(monkeypatch):
+    _create_news(1, "세븐틴 공연")
+    update_corpus_index()
+    index = get_corpus_index()
+    monkeypatch.setattr(CorpusIndex, "load", classmethod(lambda cls, path: pytest.fail("reloaded")))
+
+    assert get_corpus_index() is index
+
+
+def test_keywords_rank_corpus_wide_words_lower():
+    text = (
+        "세븐틴 공연 소식이 전해졌다. 세븐틴 공연 일정은 다음 달 공개된다. "
+        "소속사는 암표 단속을 위해 본인 확인 절차를 강화한다. 세븐틴 공연 티켓 암표 거래는 금지된다."
+    )
+    summarizer = ArticleSummarizer(language="ko")
+    assert summarizer.summarize(text, 200, 50)["keywords"][0] == "세븐틴"
+
+    frequencies = {term_hash("세븐틴"): 95}
+    write_corpus_index(corpus_index.CORPUS_INDEX_PATH, 100, frequencies)
+    corpus_index.reset_corpus_index()
+
+    keywords = summarizer.summarize(text, 200, 50)["keywords"]
+
+    # 세 번 나와도 거의 모든 기사에 있는 단어라 한 번 나온 단어 10개에 밀림
+    assert "세븐틴" not in keywords
+    assert "소속사는" in keywords
+
+
+def test_ai_summarizer_keywords_use_corpus_idf():
+    from api.services.ai_summarizer import AISummarizer
+
+    text = "세븐틴 세븐틴 세븐틴 콘서트 콘서트 암표단속 본인확인"
+    summarizer = AISummarizer(language="ko")
+    assert summarizer._extract_keywords(text)[0] == "세븐틴"
+
+    write_corpus_index(corpus_index.CORPUS_INDEX_PATH, 100, {term_hash("세븐틴"): 99, term_hash("콘서트"): 99})
+    corpus_index.reset_corpus_index()
+
+    assert summarizer._extract_keywords(text) == ["암표단속", "본인확인", "세븐틴", "콘서트"]
@@ -0,0 +1,126 @@
+import pytest
+
+ARTICLE_HTML = ("<html><head><title>컴백 기사</title></head><body><article>"
+                + "아이돌 그룹이 새 앨범으로 컴백했다. " * 10
+                + "</article></body></html>").encode()
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch):
+    from api.services.url_security import SafeHttpResponse
+
+    calls = []
+    responses = []
+
+    def fetch(url, timeout, user_agent, extra_headers=None):
+        calls.append({"url": url, "headers": dict(extra_headers or {})})
+        if responses:
+            return responses.pop(0)
+        return SafeHttpResponse(
+            url=url, status=200, headers={"etag": '"v1"', "content-type": "text/html"}, body=ARTICLE_HTML,
+        )
+
+    monkeypatch.setattr("api.services.extractor.safe_fetch_url", fetch)
+    fetch.calls = calls
+    fetch.responses = responses
+    return fetch
+
+
+@pytest.mark.django_db
+def test_cached_extractor_reuses_result_for_normalized_url(fake_fetch):
+    from api.services.extraction_cache import CachedArticleExtractor, get_extraction_cache
+
+    first = CachedArticleExtractor()
+    assert first.extract("https://news.example/article?id=1")["success"] is True
+    assert first.last_cache_status == "miss"
+
+    second = CachedArticleExtractor()
+    result = second.extract("https://news.example/article?id=1#comments")
+
+    assert result["success"] is True
+    assert second.last_cache_status == "hit"
+    assert len(fake_fetch.calls) == 1
+    assert get_extraction_cache().stats()["hits"] == 1
+
+
+@pytest.mark.django_db
+def test_cached_extractor_uses_crawled_news_origin_text(fake_fetch):
+    from api.models import CrawledNews
+    from api.services.extraction_cache import CachedArticleExtractor
+
+    CrawledNews.objects.create(
+        title="저장된 기사",
+        url="https://news.example/stored",
+        origin_news="크롤링 때 추출해 둔 본문입니다. " * 5,
+    )
+
+    extractor = CachedArticleExtractor()
+    result = extractor.extract("https://news.example/stored")
+
+    assert extractor.last_cache_status == "stored"
+    assert result["title"] == "저장된 기사"
+    assert result["source"] == "news.example"
+    assert fake_fetch.calls == []
+
+
+@pytest.mark.django_db
+def test_cached_extractor_revalidates_stale_entry_with_etag(monkeypatch, fake_fetch):
+    from api.services import extraction_cache
+    from api.services.url_security import SafeHttpResponse
+
+    monkeypatch.setattr(extraction_cache, "EXTRACTION_CACHE_TTL", 0)
+    extraction_cache.CachedArticleExtractor().extract("https://news.example/etag")
+
+    fake_fetch.responses.append(
+        SafeHttpResponse(url="https://news.example/etag", status=304, headers={}, body=b"")
+    )
+    extractor = extraction_cache.CachedArticleExtractor()
+    result = extractor.extract("https://news.example/etag")
+
+    assert extractor.last_cache_status == "revalidated"
+    assert result["success"] is True
+    assert fake_fetch.calls[1]["headers"] == {"If-None-Match": '"v1"'}
+
+
+@pytest.mark.django_db
+def test_cached_extractor_does_not_cache_failures(fake_fetch):
+    from api.services.extraction_cache import CachedArticleExtractor
+    from api.services.url_security import SafeHttpResponse
+
+    fake_fetch.responses.append(
+        SafeHttpResponse(url="https://news.example/empty", status=200, headers={}, body=b"<html></html>")
+    )
+    assert CachedArticleExtractor().extract("https://news.example/empty")["success"] is False
+    assert CachedArticleExtractor().extract("https://news.example/empty")["success"] is True
+    assert len(fake_fetch.calls) == 2
+
+
+def test_extraction_cache_shares_entries_through_django_cache():
+    from api.services.extraction_cache import ExtractionCache, _new_entry
+
+    writer = ExtractionCache(use_django=True)
+    reader = ExtractionCache(use_django=True)
+    writer.set("https://news.example/shared", _new_entry({"success": True, "text": "본문"}))
+
+    assert reader.get("https://news.example/shared")["result"]["text"] == "본문"
+
+
+def test_safe_fetch_url_returns_not_modified_for_conditional_request(monkeypatch):
+    from api.services.url_security import SafeHttpResponse, safe_fetch_url
+
+    monkeypatch.setattr(
+        "api.services.url_security.socket.getaddrinfo",
+        lambda host, port, type=None: [(2, 1, 6, "", ("93.184.216.34", port))],
+    )
+    sent = []
+
+    def fake_request(target, timeout, max_bytes, user_agent, extra_headers=None):
+        sent.append(extra_headers)
+        return SafeHttpResponse(url=target.url, status=304, headers={}, body=b"")
+
+    monkeypatch.setattr("api.services.url_security._request_once", fake_request)
+
+    response = safe_fetch_url("https://example.com/a", extra_headers={"If-None-Match": '"v1"'})
+
+    assert response.status == 304
+    assert sent == [{"If-None-Match": '"v1"'}]
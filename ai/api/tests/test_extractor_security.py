@@ -28,7 +28,7 @@ def test_article_extractor_rejects_redirect_to_private_ip(monkeypatch):
         lambda host, port, type=None: [(2, 1, 6, "", ("93.184.216.34", port))],
     )
 
-    def fake_request(target, timeout, max_bytes, user_agent):
+    def fake_request(target, timeout, max_bytes, user_agent, extra_headers=None):
         requested.append(target.url)
         return SafeHttpResponse(
             url=target.url,
@@ -114,3 +114,385 @@ def test_storable_url_rejects_legacy_ipv4_and_explicit_zero_port(url):
 
     with pytest.raises(UnsafeUrlError):
         normalize_storable_article_url(url)
+
+
+@pytest.fixture
+def loopback_http_server(monkeypatch):
+    """keep-alive HTTP/1.1 서버. 테스트에서만 loopback peer를 허용한다."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from api.services import url_security
+
+    client_ports = []
+
+    class KeepAliveHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            client_ports.append(self.client_address[1])
+            body = b"<html>ok</html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    pool = url_security.SafeConnectionPool(maxsize=2, max_total=4, idle_timeout=30)
+    monkeypatch.setattr(url_security, "_connection_pool", pool)
+    monkeypatch.setattr(url_security, "_verify_connected_peer", lambda sock, target: None)
+    try:
+        yield server.server_address[1], client_ports, pool
+    finally:
+        pool.clear()
+        server.shutdown()
+        server.server_close()
+
+
+def _loopback_target(port, path="/"):
+    from api.services.url_security import ResolvedPublicUrl
+
+    return ResolvedPublicUrl(
+        url=f"http://example.com{path}",
+        scheme="http",
+        host="example.com",
+        port=port,
+        request_target=path,
+        host_header="example.com",
+        family=2,
+        socktype=1,
+        proto=6,
+        sockaddr=("127.0.0.1", port),
+    )
+
+
+def test_request_reuses_keep_alive_connection_for_same_pinned_address(loopback_http_server):
+    from api.services.url_security import _request_once
+
+    port, client_ports, pool = loopback_http_server
+
+    first = _request_once(_loopback_target(port, "/a"), timeout=2, max_bytes=1024, user_agent="test")
+    second = _request_once(_loopback_target(port, "/b"), timeout=2, max_bytes=1024, user_agent="test")
+
+    assert first.body == second.body == b"<html>ok</html>"
+    assert len(client_ports) == 2
+    assert client_ports[0] == client_ports[1]
+    assert pool.stats()["hits"] == 1
+    assert pool.stats()["misses"] == 1
+    assert pool.stats()["idle"] == 1
+
+
+def test_request_does_not_share_connections_across_hosts(loopback_http_server):
+    from dataclasses import replace
+
+    from api.services.url_security import _request_once
+
+    port, client_ports, pool = loopback_http_server
+    target = _loopback_target(port)
+
+    _request_once(target, timeout=2, max_bytes=1024, user_agent="test")
+    # 같은 sockaddr이라도 Host/SNI가 다르면 다른 풀 키를 쓴다.
+    _request_once(
+        replace(target, url="http://other.example/", host="other.example", host_header="other.example"),
+        timeout=2,
+        max_bytes=1024,
+        user_agent="test",
+    )
+
+    assert client_ports[0] != client_ports[1]
+    assert pool.stats()["hits"] == 0
+
+
+def test_request_discards_idle_connections_past_timeout(loopback_http_server):
+    from api.services import url_security
+
+    port, client_ports, pool = loopback_http_server
+    pool.idle_timeout = 0
+
+    url_security._request_once(_loopback_target(port), timeout=2, max_bytes=1024, user_agent="test")
+    url_security._request_once(_loopback_target(port), timeout=2, max_bytes=1024, user_agent="test")
+
+    assert client_ports[0] != client_ports[1]
+    assert pool.stats()["hits"] == 0
+    assert pool.stats()["discarded"] == 1
+
+
+def test_resolve_public_url_caches_dns_answers(monkeypatch):
+    from api.services.url_security import get_dns_cache_stats, resolve_public_url
+
+    lookups = []
+
+    def fake_getaddrinfo(host, port, type=None):
+        lookups.append(host)
+        return [(2, 1, 6, "", ("93.184.216.34", port))]
+
+    monkeypatch.setattr("api.services.url_security.socket.getaddrinfo", fake_getaddrinfo)
+
+    first = resolve_public_url("https://Example.com/a")
+    second = resolve_public_url("https://example.com/b")
+
+    assert lookups == ["example.com"]
+    assert first.sockaddr == second.sockaddr == ("93.184.216.34", 443)
+    assert second.request_target == "/b"
+    stats = get_dns_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_resolve_public_url_negative_caches_lookup_failures(monkeypatch):
+    import socket
+
+    from api.services.url_security import UnsafeUrlError, get_dns_cache_stats, resolve_public_url
+
+    lookups = []
+
+    def failing_getaddrinfo(host, port, type=None):
+        lookups.append(host)
+        raise socket.gaierror("Name or service not known")
+
+    monkeypatch.setattr("api.services.url_security.socket.getaddrinfo", failing_getaddrinfo)
+
+    for _ in range(3):
+        with pytest.raises(UnsafeUrlError):
+            resolve_public_url("https://missing.example/article")
+
+    assert lookups == ["missing.example"]
+    assert get_dns_cache_stats()["negative_hits"] == 2
+
+
+def test_resolve_public_url_revalidates_cached_private_answers(monkeypatch):
+    from api.services.url_security import UnsafeUrlError, resolve_public_url
+
+    lookups = []
+
+    def private_getaddrinfo(host, port, type=None):
+        lookups.append(host)
+        return [(2, 1, 6, "", ("93.184.216.34", port)), (2, 1, 6, "", ("10.0.0.5", port))]
+
+    monkeypatch.setattr("api.services.url_security.socket.getaddrinfo", private_getaddrinfo)
+
+    for _ in range(2):
+        with pytest.raises(UnsafeUrlError):
+            resolve_public_url("https://mixed.example/article")
+
+    assert lookups == ["mixed.example"]
+
+
+def test_resolve_public_url_expires_dns_answers_after_ttl(monkeypatch):
+    from api.services import url_security
+
+    clock = [1000.0]
+    lookups = []
+
+    def fake_getaddrinfo(host, port, type=None):
+        lookups.append(host)
+        return [(2, 1, 6, "", ("93.184.216.34", port))]
+
+    monkeypatch.setattr(url_security.socket, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(url_security.time, "monotonic", lambda: clock[0])
+
+    url_security.resolve_public_url("https://example.com/")
+    clock[0] += url_security._dns_cache.ttl - 1
+    url_security.resolve_public_url("https://example.com/")
+    clock[0] += 2
+    url_security.resolve_public_url("https://example.com/")
+
+    assert lookups == ["example.com", "example.com"]
+
+
+def test_extract_many_streams_results_with_stage_timings(monkeypatch):
+    from api.services.extractor import ArticleExtractor
+    from api.services.url_security import SafeHttpResponse
+
+    body = ("<html><body><article>" + "기사 본문입니다. " * 20 + "</article></body></html>").encode()
+    monkeypatch.setattr(
+        "api.services.extractor.safe_fetch_url",
+        lambda url, timeout, user_agent, extra_headers=None: SafeHttpResponse(url=url, status=200, headers={}, body=body),
+    )
+
+    results = list(ArticleExtractor().extract_many(
+        ["https://a.example/1", "http://127.0.0.1/private", "https://b.example/2"],
+        concurrency=2,
+    ))
+
+    by_index = {result["index"]: result for result in results}
+    assert sorted(by_index) == [0, 1, 2]
+    assert by_index[0]["success"] is True
+    assert by_index[0]["url"] == "https://a.example/1"
+    timings = by_index[0]["timings"]
+    assert {"queue_ms", "fetch_ms", "newspaper_ms", "bs4_ms", "total_ms"} <= set(timings)
+    assert timings["fetch_ms"] is not None and timings["total_ms"] >= timings["fetch_ms"]
+
+
+def test_extract_many_limits_concurrency_per_host(monkeypatch):
+    import threading
+    import time
+
+    from api.services.extractor import ArticleExtractor
+
+    lock = threading.Lock()
+    active = {}
+    peak = {}
+
+    def fake_extract_timed(self, url, timings):
+        host = url.split("/")[2]
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+        time.sleep(0.02)
+        with lock:
+            active[host] -= 1
+        return ArticleExtractor._failure("stub")
+
+    monkeypatch.setattr(ArticleExtractor, "_extract_timed", fake_extract_timed)
+
+    urls = [f"https://slow.example/{i}" for i in range(6)] + ["https://other.example/1"]
+    results = list(ArticleExtractor().extract_many(urls, concurrency=4, per_host_limit=2))
+
+    assert len(results) == 7
+    assert peak["slow.example"] == 2
+    # 같은 호스트 대기열에 막히지 않고 다른 호스트 URL이 먼저 끝난다.
+    assert [result["index"] for result in results].index(6) < 6
+
+
+def test_extract_many_rejects_out_of_range_concurrency():
+    from api.services.extractor import ArticleExtractor
+
+    with pytest.raises(ValueError):
+        list(ArticleExtractor().extract_many(["https://example.com/"], concurrency=0))
+
+
+def test_prepare_save_items_fetches_contents_in_input_order(monkeypatch):
+    from api.services.extractor import ArticleExtractor
+    from api.services.news_crawler import NaverNewsCrawler
+
+    def fake_extract_many(self, urls, concurrency=4, per_host_limit=None):
+        for index in reversed(range(len(urls))):
+            yield {"index": index, "url": urls[index], "success": True, "text": f"본문 {urls[index]}"}
+
+    monkeypatch.setattr(ArticleExtractor, "extract_many", fake_extract_many)
+
+    items = [
+        {"title": "a", "originallink": "https://a.example/1"},
+        {"title": "b", "originallink": "", "link": ""},
+        {"title": "c", "originallink": "", "link": "https://c.example/3"},
+    ]
+    save_items = NaverNewsCrawler.__new__(NaverNewsCrawler)._prepare_save_items(items, "query")
+
+    assert [item["origainal_news"] for item in save_items] == [
+        "본문 https://a.example/1",
+        "",
+        "본문 https://c.example/3",
+    ]
+
+
+def _fake_fetch(monkeypatch, body, content_type="text/html"):
+    from api.services.url_security import SafeHttpResponse
+
+    monkeypatch.setattr(
+        "api.services.extractor.safe_fetch_url",
+        lambda url, timeout, user_agent, extra_headers=None: SafeHttpResponse(
+            url=url, status=200, headers={"content-type": content_type}, body=body,
+        ),
+    )
+
+
+def test_decode_html_prefers_header_then_meta_charset():
+    from api.services.extractor import decode_html
+
+    korean = "아이돌 컴백 소식"
+    assert decode_html(korean.encode("euc-kr"), "text/html; charset=EUC-KR") == korean
+    meta_page = b'<html><head><meta charset="euc-kr"></head>' + korean.encode("euc-kr")
+    assert korean in decode_html(meta_page, "text/html")
+    assert decode_html(korean.encode("utf-8"), "text/html; charset=unknown-xx") == korean
+
+
+def test_single_parse_fallback_matches_beautifulsoup(monkeypatch):
+    from api.services.extractor import ArticleExtractor
+
+    page = (
+        "<html><head><title> 컴백 기사 </title></head><body>"
+        "<nav>메뉴</nav><div class='wrap article-content'>"
+        "<p>첫 문단 " + "본문 " * 20 + "</p><script>track()</script>"
+        "<p>둘째 문단<br>줄바꿈</p><footer>저작권</footer>꼬리 텍스트</div></body></html>"
+    ).encode("euc-kr")
+    _fake_fetch(monkeypatch, page, "text/html; charset=euc-kr")
+    monkeypatch.setattr(
+        ArticleExtractor, "_extract_with_newspaper",
+        lambda self, url, html_content, tree=None: ArticleExtractor._failure("too short"),
+    )
+
+    shared = ArticleExtractor(single_parse=True).extract("https://news.example/1")
+    legacy = ArticleExtractor(single_parse=False)._extract_with_bs4(
+        "https://news.example/1", page.decode("euc-kr").encode("utf-8")
+    )
+
+    assert shared["success"] is True
+    assert shared["text"] == legacy["text"]
+    assert shared["title"] == legacy["title"] == "컴백 기사"
+
+
+def test_single_parse_parses_html_once(monkeypatch):
+    import lxml.html
+
+    from api.services import extractor as extractor_module
+    from api.services.extractor import ArticleExtractor
+
+    page = ("<html><body><main>" + "한국어 기사 본문 " * 30 + "</main></body></html>").encode()
+    _fake_fetch(monkeypatch, page)
+
+    parses = []
+    real_fromstring = lxml.html.document_fromstring
+
+    def counting_fromstring(*args, **kwargs):
+        parses.append(1)
+        return real_fromstring(*args, **kwargs)
+
+    monkeypatch.setattr(lxml.html, "document_fromstring", counting_fromstring)
+    monkeypatch.setattr(
+        extractor_module, "BeautifulSoup",
+        lambda *args, **kwargs: pytest.fail("BeautifulSoup must not reparse the page"),
+    )
+
+    timings = {}
+    result = ArticleExtractor(single_parse=True)._extract_timed("https://news.example/2", timings)
+
+    assert result["success"] is True
+    assert "한국어 기사 본문" in result["text"]
+    assert parses == [1]
+    assert {"fetch_ms", "parse_ms", "newspaper_ms"} <= set(timings)
+
+
+def test_single_parse_newspaper_handles_mixed_text_and_block_div(monkeypatch):
+    from api.services.extractor import ArticleExtractor
+
+    # 텍스트와 블록 자식이 섞인 <div>: newspaper가 본문 정리 중 조각 HTML을 다시 파싱함
+    page = (
+        "<html><head><title>컴백 기사</title>"
+        "<meta property='article:published_time' content='2024-05-01T09:00:00+09:00'></head>"
+        "<body><div class='article'>도입 문장이 여기에 있습니다. "
+        "<p>" + "세븐틴 공연 본문 문장입니다. " * 10 + "</p>"
+        + "중간 텍스트 문장도 있습니다. " * 5
+        + "<p>" + "둘째 문단 내용입니다. " * 10 + "</p></div></body></html>"
+    ).encode()
+    _fake_fetch(monkeypatch, page)
+    monkeypatch.setattr(
+        ArticleExtractor, "_extract_from_tree",
+        lambda self, url, doc: pytest.fail("newspaper result must be used, not the fallback"),
+    )
+
+    result = ArticleExtractor(single_parse=True).extract("https://news.example/3")
+    legacy = ArticleExtractor(single_parse=False)._extract_with_newspaper("https://news.example/3", page)
+
+    assert result["success"] is True
+    assert result["title"] == "컴백 기사"
+    assert result["published_at"] == "2024-05-01T09:00:00+09:00"
+    assert result["text"].startswith("도입 문장이 여기에 있습니다.")
+    assert "둘째 문단 내용입니다." in result["text"]
+    assert result["text"] == legacy["text"]
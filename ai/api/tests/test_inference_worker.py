@@ -0,0 +1,223 @@
+"""
+추론 워커 (Unix 소켓 서버/클라이언트) 테스트
+
+실제 모델 대신 ai_moderation / comment_filter의 진입점을 가짜로 바꾸고,
+같은 프로세스 안에서 서버를 백그라운드 스레드로 띄웁니다.
+"""
+import os
+import shutil
+import tempfile
+import threading
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import Client
+
+from api.services import ai_moderation, comment_filter, inference_worker
+from api.services.ai_moderation import ModerationResult
+from api.services.comment_filter import FilterResult
+
+
+class FakeModerator:
+    language = "ko"
+
+    def __init__(self):
+        self.batches = []
+
+    def check(self, text, use_cache=True, custom_thresholds=None):
+        return ModerationResult(model_used="ko", highest_category=f"single:{text}")
+
+    def batch_check(self, texts, use_cache=True):
+        self.batches.append(list(texts))
+        return [ModerationResult(model_used="ko", highest_category=f"batch:{t}") for t in texts]
+
+
+class FakeFilterService:
+    def filter_comment(self, text):
+        return FilterResult(is_filtered="bad" in text)
+
+    def batch_filter(self, texts):
+        return [self.filter_comment(t) for t in texts]
+
+
+TEST_API_KEY = "test-secret-key-for-inference-worker"
+
+
+@pytest.fixture(autouse=True)
+def authkey(monkeypatch):
+    monkeypatch.setattr(inference_worker, "INFERENCE_AUTHKEY", b"test-inference-key")
+
+
+@pytest.fixture
+def client(settings):
+    settings.AI_SERVICE_ACCEPTED_KEYS = TEST_API_KEY
+    return Client(HTTP_X_API_KEY=TEST_API_KEY)
+
+
+@pytest.fixture
+def fake_services(monkeypatch):
+    moderator = FakeModerator()
+    monkeypatch.setattr(ai_moderation, "get_ai_moderator", lambda language="ko": moderator)
+    monkeypatch.setattr(comment_filter, "get_filter_service", lambda: FakeFilterService())
+    return moderator
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX 경로 길이 제한(108자) 때문에 짧은 /tmp 경로 사용
+    directory = tempfile.mkdtemp(prefix="fp-inf-", dir="/tmp")
+    yield os.path.join(directory, "inference.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def worker_mode(monkeypatch, socket_path):
+    monkeypatch.setattr(inference_worker, "INFERENCE_MODE", "worker")
+    monkeypatch.setattr(inference_worker, "_client", inference_worker.InferenceClient(address=socket_path))
+
+
+@pytest.fixture
+def server(fake_services, socket_path):
+    server = inference_worker.InferenceServer(address=socket_path, batch_wait_ms=200)
+    server.start()
+    yield server
+    server.close()
+
+
+def test_inprocess_mode_returns_local_services(fake_services):
+    assert inference_worker.get_moderator("ko") is fake_services
+    assert isinstance(inference_worker.get_comment_filter(), FakeFilterService)
+
+
+def test_remote_calls_round_trip(worker_mode, server):
+    moderator = inference_worker.get_moderator("ko")
+    filter_service = inference_worker.get_comment_filter()
+
+    checked = moderator.check("hello", custom_thresholds={"spam": 0.5})
+    batch = moderator.batch_check(["a", "b"])
+    filtered = filter_service.batch_filter(["fine", "bad words"])
+
+    assert isinstance(moderator, inference_worker.RemoteModerator)
+    assert checked.highest_category == "single:hello"
+    assert [r.highest_category for r in batch] == ["batch:a", "batch:b"]
+    assert [r.is_filtered for r in filtered] == [False, True]
+
+
+def test_concurrent_single_checks_are_batched_in_worker(worker_mode, server, fake_services):
+    moderator = inference_worker.get_moderator("ko")
+    results = {}
+
+    def run(text):
+        results[text] = moderator.check(text).highest_category
+
+    threads = [threading.Thread(target=run, args=(t,)) for t in ("x", "y", "z")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == {"x": "batch:x", "y": "batch:y", "z": "batch:z"}
+    assert sorted(sum(fake_services.batches, [])) == ["x", "y", "z"]
+    assert len(fake_services.batches) < 3
+
+
+def test_remote_exception_is_raised_without_fallback(worker_mode, server, monkeypatch):
+    def broken(texts):
+        raise RuntimeError("CUDA out of memory")
+
+    monkeypatch.setattr(FakeFilterService, "batch_filter", lambda self, texts: broken(texts))
+
+    with pytest.raises(inference_worker.InferenceError, match="CUDA out of memory"):
+        inference_worker.get_comment_filter().batch_filter(["x"])
+
+
+def test_unreachable_worker_falls_back_in_process(worker_mode, fake_services, monkeypatch):
+    monkeypatch.setattr(inference_worker, "INFERENCE_FALLBACK", True)
+    result = inference_worker.get_moderator("ko").check("hello")
+
+    assert result.highest_category == "single:hello"
+    status = inference_worker.get_model_status()
+    assert status["inference"] == {"mode": "worker", "reachable": False}
+    assert status["state"] == "degraded"
+
+
+def test_unreachable_worker_without_fallback_raises(worker_mode, fake_services, monkeypatch):
+    monkeypatch.setattr(inference_worker, "INFERENCE_FALLBACK", False)
+
+    with pytest.raises(inference_worker.InferenceUnavailable):
+        inference_worker.get_moderator("ko").check("hello")
+    assert inference_worker.get_model_status()["state"] == "warming"
+
+
+def test_client_reconnects_after_worker_restart(worker_mode, fake_services, socket_path):
+    first = inference_worker.InferenceServer(address=socket_path, batch_wait_ms=0)
+    first.start()
+    client = inference_worker.get_inference_client()
+    assert client.call("ping") == "pong"
+    first.close()
+
+    second = inference_worker.InferenceServer(address=socket_path, batch_wait_ms=0)
+    second.start()
+    try:
+        assert client.call("ping") == "pong"
+    finally:
+        second.close()
+
+
+def test_health_reports_worker_preload_state(worker_mode, server, client):
+    response = client.get("/api/health")
+
+    assert response.status_code == 200
+    assert response.json()["inference"] == {"mode": "worker", "reachable": True}
+    assert response.json()["models"] == "ready"
+
+
+def test_worker_mode_requires_authkey(monkeypatch, socket_path):
+    monkeypatch.setattr(inference_worker, "INFERENCE_AUTHKEY", b"")
+
+    with pytest.raises(ImproperlyConfigured, match="AI_INFERENCE_AUTHKEY"):
+        inference_worker.InferenceServer(address=socket_path)
+    with pytest.raises(ImproperlyConfigured, match="AI_INFERENCE_AUTHKEY"):
+        inference_worker.InferenceClient(address=socket_path)
+
+
+def test_remote_moderation_error_returns_degraded_result(worker_mode, server, monkeypatch, client):
+    def broken(self, texts, use_cache=True):
+        raise RuntimeError("CUDA out of memory")
+
+    monkeypatch.setattr(FakeModerator, "batch_check", broken)
+
+    response = client.post("/api/ai/moderate", {"text": "hello"}, content_type="application/json")
+    batch = inference_worker.get_moderator("ko").batch_check(["a", "b"])
+
+    assert response.status_code == 200
+    assert response.json()["model_used"] == "error"
+    assert response.json()["action"] == "allow"
+    assert "CUDA out of memory" in response.json()["error"]
+    assert [result.model_used for result in batch] == ["error", "error"]
+
+
+def test_remote_moderation_timeout_returns_degraded_result(worker_mode, server, monkeypatch, socket_path):
+    release = threading.Event()
+    monkeypatch.setattr(FakeModerator, "check", lambda self, text, **kwargs: release.wait(5))
+    monkeypatch.setattr(inference_worker, "_client", inference_worker.InferenceClient(address=socket_path, timeout=0.1))
+
+    try:
+        result = inference_worker.get_moderator("ko").check("hello", custom_thresholds={"spam": 0.5})
+    finally:
+        release.set()
+
+    assert result.model_used == "error"
+    assert "timed out" in result.error
+
+
+def test_filter_view_returns_503_when_worker_fails(worker_mode, server, monkeypatch, client):
+    def broken(self, text):
+        raise RuntimeError("CUDA out of memory")
+
+    monkeypatch.setattr(FakeFilterService, "filter_comment", broken)
+
+    response = client.post("/api/ai/filter", {"content": "hello"}, content_type="application/json")
+
+    assert response.status_code == 503
+    assert response.json()["title"] == "Service Unavailable"
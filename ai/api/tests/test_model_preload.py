@@ -0,0 +1,114 @@
+"""
+모델 사전 로드(warm-up) 테스트
+
+실제 모델 대신 PRELOADERS에 가짜 로더를 넣어 상태 전이만 확인합니다.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from api.services import model_preload
+
+
+def test_preload_runs_loader_then_warmup(monkeypatch):
+    calls = []
+
+    def loader():
+        calls.append("load")
+        return lambda: calls.append("warmup")
+
+    monkeypatch.setitem(model_preload.PRELOADERS, "fake", loader)
+
+    model_preload.preload_models(["fake"], warmup=True)
+
+    status = model_preload.get_preload_status()
+    assert calls == ["load", "warmup"]
+    assert status["state"] == model_preload.STATE_READY
+    assert status["models"]["fake"]["status"] == "ready"
+    assert status["models"]["fake"]["warmup_ms"] is not None
+
+
+def test_preload_skips_warmup_when_disabled(monkeypatch):
+    calls = []
+    monkeypatch.setitem(model_preload.PRELOADERS, "fake", lambda: lambda: calls.append("warmup"))
+
+    model_preload.preload_models(["fake"], warmup=False)
+
+    assert calls == []
+    assert model_preload.get_preload_status()["models"]["fake"]["warmup_ms"] is None
+
+
+def test_failed_model_marks_degraded_and_continues(monkeypatch):
+    def broken():
+        raise OSError("download failed")
+
+    monkeypatch.setitem(model_preload.PRELOADERS, "broken", broken)
+    monkeypatch.setitem(model_preload.PRELOADERS, "fake", lambda: lambda: None)
+
+    model_preload.preload_models(["broken", "nope", "fake"], warmup=True)
+
+    status = model_preload.get_preload_status()
+    assert status["state"] == model_preload.STATE_DEGRADED
+    assert status["models"]["broken"]["error"] == "download failed"
+    assert status["models"]["nope"]["error"] == "unknown model"
+    assert status["models"]["fake"]["status"] == "ready"
+
+
+def test_no_preload_configured_is_ready():
+    assert model_preload.start_preload([]) is None
+    assert model_preload.get_preload_status() == {"state": "ready", "models": {}}
+
+
+def test_moderation_preloader_warms_up_with_pipeline(monkeypatch):
+    from api.services import ai_moderation
+
+    inputs = []
+    monkeypatch.setattr(ai_moderation, "_models", {"korean": lambda text, **kw: inputs.append(text)})
+    monkeypatch.setattr(ai_moderation, "_moderator_instance", None)
+
+    model_preload.preload_models(["moderation"], warmup=True)
+
+    assert model_preload.get_preload_status()["models"]["moderation"]["status"] == "ready"
+    assert inputs == [model_preload.WARMUP_TEXT]
+
+
+def test_master_preload_loads_without_warmup_and_freezes_gc(monkeypatch):
+    calls = []
+
+    def loader():
+        calls.append("load")
+        return lambda: calls.append("warmup")
+
+    monkeypatch.setitem(model_preload.PRELOADERS, "fake", loader)
+    monkeypatch.setattr(model_preload, "_cuda_available", lambda: False)
+    monkeypatch.setattr(model_preload.gc, "freeze", lambda: calls.append("freeze"))
+
+    assert model_preload.preload_in_master(["fake"]) is True
+    assert calls == ["load", "freeze"]
+
+
+def test_master_preload_is_skipped_when_cuda_is_visible(monkeypatch):
+    monkeypatch.setitem(model_preload.PRELOADERS, "fake", lambda: pytest.fail("loaded in master"))
+    monkeypatch.setattr(model_preload, "_cuda_available", lambda: True)
+
+    assert model_preload.preload_in_master(["fake"]) is False
+    assert model_preload.get_preload_status()["state"] == model_preload.STATE_READY
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="procfs 필요")
+def test_worker_memory_report_lists_children():
+    from api.services.memory_report import read_process_memory, worker_memory_report
+
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        report = worker_memory_report(os.getpid())
+    finally:
+        child.kill()
+        child.wait()
+
+    assert report["master"]["pid"] == os.getpid()
+    assert child.pid in [worker["pid"] for worker in report["workers"]]
+    assert report["total"]["rss_kb"] >= report["total"]["pss_kb"] > 0
+    assert read_process_memory("999999999") is None
@@ -210,6 +210,8 @@ def test_save_news_to_db_rolls_back_whole_batch_when_later_relation_fails(monkey
     from api.models import CrawledNews, CrawledNewsArtist
     from api.services.news_crawler import save_news_to_db
 
+    # 관계 행을 chunk 하나씩 나눠 두 번째 bulk insert statement에서 실패시킨다.
+    monkeypatch.setattr("api.services.news_crawler.NEWS_UPSERT_CHUNK_SIZE", 1)
     original_bulk_create = CrawledNewsArtist.objects.bulk_create
     calls = 0
 
@@ -241,6 +243,127 @@ def test_save_news_to_db_rolls_back_whole_batch_when_later_relation_fails(monkey
     assert CrawledNewsArtist.objects.count() == 0
 
 
+@pytest.mark.django_db
+def test_save_news_to_db_merges_duplicate_urls_within_one_batch():
+    from api.models import CrawledNews, CrawledNewsArtist
+    from api.services.news_crawler import save_news_to_db
+
+    url = "https://example.com/duplicated"
+    first_artist = "11111111-1111-1111-1111-111111111111"
+    second_artist = "22222222-2222-2222-2222-222222222222"
+
+    result = save_news_to_db([
+        {"title": "first", "originallink": url, "artist_ids": [first_artist]},
+        {"title": "last", "originallink": url, "artist_ids": [second_artist, first_artist]},
+    ])
+
+    assert result == {"success": True, "count": 1, "error": None}
+    news = CrawledNews.objects.get(url=url)
+    assert news.title == "last"
+    assert CrawledNewsArtist.objects.filter(news=news).count() == 2
+
+
+@pytest.mark.django_db
+def test_save_news_to_db_uses_constant_statement_count(django_assert_max_num_queries):
+    from api.models import CrawledNews
+    from api.services.news_crawler import save_news_to_db
+
+    existing = [
+        {"title": f"existing {index}", "originallink": f"https://example.com/bulk-{index}"}
+        for index in range(20)
+    ]
+    save_news_to_db(existing)
+    batch = [
+        {
+            **item,
+            "title": f"updated {index}",
+            "artist_ids": ["11111111-1111-1111-1111-111111111111"],
+        }
+        for index, item in enumerate(existing)
+    ] + [
+        {
+            "title": f"new {index}",
+            "originallink": f"https://example.com/bulk-new-{index}",
+            "artist_ids": ["22222222-2222-2222-2222-222222222222"],
+        }
+        for index in range(30)
+    ]
+
+    # SELECT + INSERT + UPDATE + 관계 INSERT + savepoint 처리: 아이템 수와 무관하다.
+    with django_assert_max_num_queries(8):
+        result = save_news_to_db(batch)
+
+    assert result == {"success": True, "count": 30, "error": None}
+    assert CrawledNews.objects.count() == 50
+    assert CrawledNews.objects.get(url="https://example.com/bulk-3").title == "updated 3"
+
+
+def test_postgresql_upsert_counts_inserted_rows_from_xmax():
+    import uuid
+
+    from django.db import connection as django_connection
+
+    from api.services.news_crawler import _upsert_news_postgresql
+
+    inserted_id = uuid.uuid4()
+    updated_id = uuid.uuid4()
+
+    class FakeCursor:
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, sql, params):
+            self.statements.append((sql, params))
+
+        def fetchall(self):
+            return [
+                (inserted_id, "https://example.com/new", True),
+                (updated_id, "https://example.com/old", False),
+            ]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            return False
+
+    class FakeConnection:
+        # 값 변환/식별자 quoting은 실제 backend ops를 그대로 쓰고 cursor만 가로챈다.
+        vendor = "postgresql"
+        ops = django_connection.ops
+        features = django_connection.features
+
+        def __init__(self):
+            self.fake_cursor = FakeCursor()
+
+        def cursor(self):
+            return self.fake_cursor
+
+    defaults = {
+        "title": "title",
+        "content": "",
+        "origin_news": "",
+        "thumbnail_url": None,
+        "source": "Example",
+        "published_at": None,
+    }
+    connection = FakeConnection()
+    ids_by_url, inserted = _upsert_news_postgresql(connection, {
+        "https://example.com/new": {"defaults": defaults, "artist_ids": set()},
+        "https://example.com/old": {"defaults": defaults, "artist_ids": set()},
+    })
+
+    assert inserted == 1
+    assert ids_by_url == {
+        "https://example.com/new": inserted_id,
+        "https://example.com/old": updated_id,
+    }
+    [(sql, params)] = connection.fake_cursor.statements
+    assert 'ON CONFLICT ("url") WHERE "url" IS NOT NULL AND BTRIM("url") <> \'\'' in sql
+    assert "RETURNING \"id\", \"url\", (xmax = 0)" in sql
+    assert len(params) == 2 * 9
+
+
 def test_collect_news_deduplicates_urls_and_merges_artist_relations():
     from api.services.news_ingestion import ArtistNewsTarget, collect_news
 
@@ -289,6 +412,8 @@ def test_collect_news_deduplicates_urls_and_merges_artist_relations():
     assert captured["items"][1]["artist_ids"] == [bts_id]
     assert captured["items"][2]["artist_ids"] == [blackpink_id]
     assert captured["source"] == "google-news"
+    latencies = report.pop("query_latency_ms")
+    assert report.pop("fetch_elapsed_ms") >= 0
     assert report == {
         "queries": 2,
         "fetched": 4,
@@ -296,7 +421,83 @@ def test_collect_news_deduplicates_urls_and_merges_artist_relations():
         "inserted": 3,
         "failed_queries": 0,
         "errors": [],
+        "concurrency": 1,
     }
+    assert [entry["artist_id"] for entry in latencies] == [bts_id, blackpink_id]
+    assert all(entry["success"] and entry["latency_ms"] >= 0 for entry in latencies)
+
+
+def test_collect_news_concurrent_fan_out_merges_in_target_order():
+    import threading
+
+    from api.services.news_ingestion import ArtistNewsTarget, collect_news
+
+    targets = [
+        ArtistNewsTarget(
+            artist_id=f"{index:08d}-1111-1111-1111-111111111111",
+            name=f"A{index}",
+            english_name=None,
+        )
+        for index in range(6)
+    ]
+    release = threading.Event()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class SlowCrawler:
+        def search(self, query, display):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+                if active == 3:
+                    release.set()
+            # 앞쪽 검색어가 늦게 끝나도 병합 순서는 target 순서를 따라야 한다.
+            release.wait(timeout=2)
+            with lock:
+                active -= 1
+            slug = query.split('"')[1].lower()
+            return {
+                "success": True,
+                "items": [
+                    {"title": "shared", "originallink": "https://example.com/shared"},
+                    {"title": slug, "originallink": f"https://example.com/{slug}"},
+                ],
+                "error": None,
+            }
+
+    captured = []
+    report = collect_news(
+        crawler=SlowCrawler(),
+        targets=targets,
+        display=10,
+        source="google-news",
+        save_fn=lambda items, source: captured.extend(items) or {
+            "success": True,
+            "count": len(items),
+            "error": None,
+        },
+        concurrency=3,
+    )
+
+    assert peak == 3
+    assert report["concurrency"] == 3
+    assert [item["originallink"] for item in captured] == [
+        "https://example.com/shared",
+        *[f"https://example.com/a{index}" for index in range(6)],
+    ]
+    assert captured[0]["artist_ids"] == [target.artist_id for target in targets]
+    assert [entry["artist_id"] for entry in report["query_latency_ms"]] == [
+        target.artist_id for target in targets
+    ]
+
+
+def test_collect_news_rejects_out_of_range_concurrency():
+    from api.services.news_ingestion import collect_news
+
+    with pytest.raises(ValueError, match="concurrency"):
+        collect_news(crawler=None, targets=[], display=10, source="google-news", concurrency=0)
 
 
 def test_collect_news_keeps_successful_results_when_one_query_fails():
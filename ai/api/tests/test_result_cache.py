@@ -0,0 +1,48 @@
+def test_result_cache_evicts_least_recently_used():
+    from api.services.result_cache import ResultCache
+
+    cache = ResultCache("test", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_result_cache_expires_entries(monkeypatch):
+    from api.services import result_cache
+
+    clock = [100.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: clock[0])
+    cache = result_cache.ResultCache("test", maxsize=8, ttl=10)
+    cache.set("key", "value")
+
+    clock[0] += 9
+    assert cache.get("key") == "value"
+    clock[0] += 2
+    assert cache.get("key") is None
+    assert cache.stats()["hit_rate"] == 0.5
+    assert cache.stats()["expirations"] == 1
+
+
+def test_result_cache_reads_through_django_backend():
+    from api.services.result_cache import ResultCache
+
+    ResultCache("shared-test", maxsize=8, ttl=60, use_django=True).set("key", {"v": 1})
+    other_worker = ResultCache("shared-test", maxsize=8, ttl=60, use_django=True)
+
+    assert other_worker.get("key") == {"v": 1}
+    assert other_worker.stats()["backend"] == "django"
+
+
+def test_summary_cache_key_changes_with_model_id():
+    from api.services.summary_cache import summary_cache_key
+
+    base = summary_cache_key("본문", "ai", "ko", 200, 50, "model-a")
+    assert base == summary_cache_key("본문", "ai", "ko", 200, 50, "model-a")
+    assert base != summary_cache_key("본문", "ai", "ko", 200, 50, "model-b")
+    assert base != summary_cache_key("본문!", "ai", "ko", 200, 50, "model-a")
@@ -0,0 +1,65 @@
+"""
+ArticleSummarizer (규칙 기반 요약) 테스트
+"""
+import re
+
+import pytest
+
+from api.services.summarizer import ArticleSummarizer
+
+ARTICLE = (
+    "그룹 세븐틴이 월드투어 추가 공연을 발표했다. 이번 공연은 서울을 시작으로 12개 도시에서 진행된다. "
+    "짧은 문장. 관계자는 무대 연출과 세트리스트를 새롭게 준비했다고 설명했다! "
+    "세븐틴 공연 티켓은 예매 시작 3분 만에 매진됐다? 세븐틴 측은 추가 공연도 검토 중이라고 전했다."
+)
+
+
+@pytest.mark.parametrize("language", ["ko", "en"])
+def test_tokenize_matches_whole_text_tokens(language):
+    summarizer = ArticleSummarizer(language=language)
+    text = summarizer._clean_text(ARTICLE + " The Quick fox, and THE dog.")
+
+    sentences, tokens, spans = summarizer._tokenize(text)
+
+    assert tokens == re.findall(r"\b\w+\b", text.lower())
+    assert "짧은 문장" not in sentences
+    for sentence, (start, end) in zip(sentences, spans):
+        assert tokens[start:end] == re.findall(r"\b\w+\b", sentence.lower())
+
+
+def test_keywords_and_scores_share_single_tokenization():
+    result = ArticleSummarizer(language="ko").summarize(ARTICLE, max_length=120, min_length=30)
+
+    assert result["keywords"][0] == "세븐틴"
+    assert result["summary"]
+    assert len(result["bullets"]) == 5
+
+
+def test_text_without_sentences_returns_prefix():
+    result = ArticleSummarizer(language="ko").summarize("짧다", max_length=10, min_length=1)
+
+    assert result == {"summary": "짧다", "bullets": ["내용 분석 실패"], "keywords": []}
+
+
+def test_duplicate_sentences_are_selected_once_within_max_length():
+    repeated = "세븐틴 공연 티켓이 예매 시작 3분 만에 매진됐다"
+    text = f"{repeated}. 관계자는 추가 공연을 검토 중이라고 밝혔다. {repeated}. 팬들은 온라인에서 응원을 이어갔다."
+    summarizer = ArticleSummarizer(language="ko")
+
+    result = summarizer.summarize(text, max_length=40, min_length=10)
+
+    # 이전 구현은 선택된 문장과 같은 문장을 모두 원문 순서로 다시 넣어 max_length를 넘겼다.
+    assert result["summary"] == repeated
+    assert len(result["summary"]) <= 40
+
+
+def test_select_top_indices_scales_to_many_sentences():
+    summarizer = ArticleSummarizer(language="ko")
+    sentences = [f"{i}번째 문장은 테스트용 녹취록의 일부입니다" for i in range(10000)]
+    scores = [(i * 7919) % 10007 / 10007 for i in range(10000)]
+
+    selected = summarizer._select_top_indices(sentences, scores, max_length=50000)
+
+    assert selected == sorted(set(selected))
+    assert sum(len(sentences[i]) + 1 for i in selected) - 1 <= 50000
+    assert max(scores) == max(scores[i] for i in selected)
@@ -0,0 +1,262 @@
+"""
+배치 요약 비동기 작업 API 테스트
+
+POST /api/news/batch-summarize/jobs        -> 202 (job_id)
+GET  /api/news/batch-summarize/jobs/<id>   -> 진행 상태 + since 이후 결과
+"""
+import json
+import threading
+
+import pytest
+from django.test import Client
+
+from api.services import news_crawler, summary_jobs
+
+LONG_TEXT = (
+    "인공지능 기술의 발전으로 우리 생활에 많은 변화가 일어나고 있습니다. "
+    "자연어 처리 기술이 번역, 요약, 대화 등 다양한 분야에서 활용되고 있습니다."
+)
+
+
+TEST_API_KEY = "test-secret-key-for-summary-jobs"
+
+
+@pytest.fixture
+def client(settings):
+    settings.AI_SERVICE_ACCEPTED_KEYS = TEST_API_KEY
+    return Client(HTTP_X_API_KEY=TEST_API_KEY)
+
+
+class GatedSummarizer:
+    """본문별 Event가 set될 때까지 summarize가 끝나지 않는 가짜 요약기"""
+
+    language = "ko"
+    model_id = "gated-test"
+
+    def __init__(self):
+        self.gates = {}
+
+    def gate(self, text):
+        return self.gates.setdefault(text, threading.Event())
+
+    def summarize(self, text, max_length=300, min_length=50):
+        assert self.gate(text).wait(5)
+        return {"summary": f"요약:{text[-3:]}", "bullets": [], "keywords": []}
+
+
+@pytest.fixture
+def jobs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(news_crawler, "SUMMARIZED_DATA_DIR", tmp_path)
+    summary_jobs.reset_summary_jobs()
+    yield tmp_path
+    summary_jobs.reset_summary_jobs()
+
+
+def _post_job(client, items, method="rule"):
+    return client.post(
+        "/api/news/batch-summarize/jobs",
+        data=json.dumps({"items": items, "method": method}),
+        content_type="application/json",
+    )
+
+
+def test_job_endpoint_summarizes_in_background_and_saves(client, jobs_dir):
+    items = [
+        {"title": "A", "origainal_news": LONG_TEXT + " 첫 번째 기사입니다."},
+        {"title": "B", "origainal_news": "짧음"},
+        {"title": "C", "origainal_news": LONG_TEXT + " 세 번째 기사입니다."},
+    ]
+
+    response = _post_job(client, items)
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["progress"]["total"] == 3
+    assert summary_jobs._jobs[body["job_id"]].wait(5)
+
+    detail = client.get(f"/api/news/batch-summarize/jobs/{body['job_id']}")
+    state = detail.json()
+    assert detail.status_code == 200
+    assert state["status"] == summary_jobs.JOB_COMPLETED
+    assert state["progress"] == {"total": 3, "completed": 3, "succeeded": 2, "failed": 1, "pending": 0}
+    assert sorted(item["index"] for item in state["items"]) == [0, 1, 2]
+    assert state["next"] == 3
+
+    saved = json.loads((jobs_dir / state["filename"]).read_text(encoding="utf-8"))
+    assert [item["title"] for item in saved["items"]] == ["A", "B", "C"]
+    assert "index" not in saved["items"][0]
+
+
+def test_results_are_fetched_incrementally(jobs_dir):
+    summarizer = GatedSummarizer()
+    texts = [LONG_TEXT + " 0번", LONG_TEXT + " 1번"]
+    job = summary_jobs.submit_summary_job(
+        [{"title": str(i), "origainal_news": t} for i, t in enumerate(texts)], "rule", summarizer
+    )
+
+    summarizer.gate(texts[1]).set()
+    for _ in range(100):
+        if job.to_dict()["progress"]["completed"] == 1:
+            break
+        threading.Event().wait(0.01)
+    first = summary_jobs.get_summary_job_state(job.job_id, since=0)
+    assert first["status"] == summary_jobs.JOB_RUNNING
+    assert [item["index"] for item in first["items"]] == [1]
+
+    summarizer.gate(texts[0]).set()
+    assert job.wait(5)
+    second = summary_jobs.get_summary_job_state(job.job_id, since=first["next"])
+    assert [item["index"] for item in second["items"]] == [0]
+    assert second["next"] == 2
+
+
+def test_job_state_is_readable_from_another_worker(jobs_dir):
+    summarizer = GatedSummarizer()
+    summarizer.gate(LONG_TEXT).set()
+    job = summary_jobs.submit_summary_job([{"title": "A", "origainal_news": LONG_TEXT}], "rule", summarizer)
+    assert job.wait(5)
+
+    # 다른 gunicorn 워커: 메모리에 작업이 없으므로 상태 파일에서 읽는다.
+    summary_jobs.reset_summary_jobs()
+    state = summary_jobs.get_summary_job_state(job.job_id, since=0)
+
+    assert state["status"] == summary_jobs.JOB_COMPLETED
+    assert state["items"][0]["summary"].startswith("요약:")
+
+
+def test_unknown_or_invalid_job_id_returns_404(client, jobs_dir):
+    assert client.get("/api/news/batch-summarize/jobs/" + "0" * 32).status_code == 404
+    assert summary_jobs.get_summary_job_state("../summarized_rule") is None
+
+
+def test_job_endpoint_rejects_empty_items(client, jobs_dir):
+    assert _post_job(client, []).status_code == 400
+
+
+#######################
+# 규칙 기반 배치 요약 (프로세스 풀)
+#######################
+def _articles(count):
+    return [
+        {"title": f"기사 {i}", "origainal_news": f"{i}번 기사 도입부입니다. " + LONG_TEXT * (1 + i % 3)}
+        for i in range(count)
+    ]
+
+
+def test_summarize_many_pool_matches_sequential(monkeypatch):
+    from api.services import summarizer
+
+    texts = [item["origainal_news"] for item in _articles(6)]
+    monkeypatch.setattr(summarizer, "SUMMARY_RULE_POOL_MIN_ITEMS", 2)
+    try:
+        pooled = summarizer.summarize_many(texts, max_length=120, min_length=30, workers=2)
+    finally:
+        summarizer.shutdown_pool()
+
+    assert pooled == summarizer.summarize_many(texts, max_length=120, min_length=30, workers=1)
+
+
+def test_rule_items_match_per_item_summaries(jobs_dir):
+    from api.services.summarizer import ArticleSummarizer
+
+    items = _articles(4) + [{"title": "짧음", "origainal_news": "짧다"}]
+    items.append(dict(items[0], title="중복"))
+
+    batched = summary_jobs.summarize_rule_items(items, 200, 50, workers=1)
+    summary_jobs.get_summary_cache().clear()
+    sequential = [
+        summary_jobs.summarize_news_item(ArticleSummarizer(language="ko"), "rule", item, 200, 50)
+        for item in items
+    ]
+
+    assert batched == sequential
+    assert [item.get("cached") for item in batched] == [False, False, False, False, None, True]
+
+
+def test_rule_items_isolate_failures(jobs_dir, monkeypatch):
+    from api.services.summarizer import ArticleSummarizer
+
+    original = ArticleSummarizer.summarize
+
+    def flaky(self, text, max_length=200, min_length=50):
+        if text.startswith("1번"):
+            raise ValueError("boom")
+        return original(self, text, max_length, min_length)
+
+    monkeypatch.setattr(ArticleSummarizer, "summarize", flaky)
+
+    results = summary_jobs.summarize_rule_items(_articles(3), 200, 50, workers=1)
+
+    assert [item["summarized"] for item in results] == [True, False, True]
+    assert results[1]["error"] == "Summarization failed"
+
+
+def test_job_state_persistence_is_throttled(jobs_dir, monkeypatch):
+    monkeypatch.setattr(summary_jobs, "SUMMARY_JOB_PERSIST_INTERVAL", 60)
+    heartbeat = summary_jobs.SummaryJob._heartbeat
+    monkeypatch.setattr(summary_jobs.SummaryJob, "_heartbeat", lambda self: None)  # 백그라운드 스레드 정지
+    saves = []
+    real_save = news_crawler.SummarizedNewsManager.save_job_state
+    monkeypatch.setattr(
+        news_crawler.SummarizedNewsManager, "save_job_state",
+        staticmethod(lambda job_id, state: saves.append(state["progress"]["completed"]) or real_save(job_id, state)),
+    )
+    summarizer = GatedSummarizer()
+    texts = [LONG_TEXT + f" {i}번" for i in range(4)]
+    job = summary_jobs.submit_summary_job(
+        [{"title": str(i), "origainal_news": t} for i, t in enumerate(texts)], "rule", summarizer
+    )
+
+    summarizer.gate(texts[0]).set()
+    for _ in range(100):
+        if job.to_dict()["progress"]["completed"] == 1:
+            break
+        threading.Event().wait(0.01)
+    # 간격 안에서 끝난 아이템은 저장을 미루고, heartbeat 때 한 번에 씀
+    assert saves == [0, 0]
+    heartbeat(job)
+    assert saves == [0, 0, 1]
+
+    for text in texts[1:]:
+        summarizer.gate(text).set()
+    assert job.wait(5)
+    assert saves == [0, 0, 1, 4]
+
+
+def test_stale_running_job_is_reported_failed(jobs_dir):
+    import os
+    import time
+
+    job_id = "a" * 32
+    state = {
+        "job_id": job_id, "status": summary_jobs.JOB_RUNNING, "method": "ai",
+        "progress": {"total": 2, "completed": 1, "succeeded": 1, "failed": 0, "pending": 1},
+        "worker_pid": 4321, "results": [{"index": 0, "summary": "요약"}],
+    }
+    news_crawler.SummarizedNewsManager.save_job_state(job_id, state)
+
+    assert summary_jobs.get_summary_job_state(job_id)["status"] == summary_jobs.JOB_RUNNING
+
+    # heartbeat가 끊긴 뒤 SUMMARY_JOB_STALE_SECONDS가 지남
+    stale = time.time() - summary_jobs.SUMMARY_JOB_STALE_SECONDS - 1
+    os.utime(jobs_dir / "jobs" / f"{job_id}.json", (stale, stale))
+    reported = summary_jobs.get_summary_job_state(job_id)
+
+    assert reported["status"] == summary_jobs.JOB_FAILED
+    assert "pid 4321" in reported["error"]
+    assert reported["items"] == state["results"]
+
+
+def test_heartbeat_refreshes_running_job_state(jobs_dir):
+    import os
+
+    summarizer = GatedSummarizer()
+    job = summary_jobs.submit_summary_job([{"title": "A", "origainal_news": LONG_TEXT}], "rule", summarizer)
+    path = jobs_dir / "jobs" / f"{job.job_id}.json"
+    os.utime(path, (0, 0))
+
+    job._heartbeat()
+
+    assert path.stat().st_mtime > 0
+    summarizer.gate(LONG_TEXT).set()
+    assert job.wait(5)
@@ -0,0 +1,181 @@
+"""
+TF-IDF / TextRank 추출형 요약 테스트
+
+- 점수 방식별 문장 선택 (코퍼스 IDF 주입)
+- 배치 요약 순서/실패 격리
+- summarize_method / 배치 요약 API 연동
+"""
+import json
+from unittest.mock import patch
+
+import pytest
+from django.test import Client
+
+from api.services import summary_jobs, vector_summarizer
+from api.services.vector_summarizer import VectorArticleSummarizer, build_corpus_stats
+
+# "공연"/"세븐틴"은 코퍼스에 흔하고, "암표"/"본인 확인"은 이 기사에만 특징적인 단어
+ARTICLE = (
+    "세븐틴 공연 소식이 전해졌다. "
+    "세븐틴 공연 일정은 다음 달 공개된다. "
+    "소속사는 암표 거래를 막기 위해 본인 확인 절차를 강화한다. "
+    "세븐틴 공연 티켓은 곧 판매된다."
+)
+CORPUS = build_corpus_stats(
+    [f"세븐틴 공연 {i}번째 기사 본문입니다." for i in range(20)] + ["암표 단속 기사입니다."]
+)
+
+TEST_API_KEY = "test-secret-key-for-vector-summarizer"
+
+
+@pytest.fixture
+def client(settings):
+    settings.AI_SERVICE_ACCEPTED_KEYS = TEST_API_KEY
+    return Client(HTTP_X_API_KEY=TEST_API_KEY)
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        VectorArticleSummarizer(method="lsa")
+
+
+def test_corpus_idf_prefers_rare_words():
+    assert CORPUS.num_docs == 21
+    assert CORPUS.idf("암표") > CORPUS.idf("공연")
+    assert CORPUS.idf("처음보는단어") > CORPUS.idf("암표")
+
+
+def test_tfidf_selects_sentence_with_distinctive_words():
+    summarizer = VectorArticleSummarizer(method="tfidf", corpus=CORPUS)
+
+    result = summarizer.summarize(ARTICLE, max_length=40, min_length=10)
+
+    assert result["summary"] == "소속사는 암표 거래를 막기 위해 본인 확인 절차를 강화한다"
+    assert summarizer.model_id == "tfidf-v1"
+
+
+def test_textrank_selects_central_sentence():
+    summarizer = VectorArticleSummarizer(method="textrank", corpus=CORPUS)
+    analysis = summarizer._analyze(summarizer._clean_text(ARTICLE))
+
+    scores = summarizer._score_python(analysis)
+
+    # 다른 문장과 겹치는 단어가 없는 문장은 들어오는 간선이 없어 teleport 확률만 받음
+    assert len(scores) == len(analysis.sentences) == 4
+    assert scores[2] == pytest.approx((1 - vector_summarizer.TEXTRANK_DAMPING) / 4)
+    assert min(scores) == scores[2]
+
+
+def test_summarize_many_keeps_order_and_isolates_failures():
+    summarizer = VectorArticleSummarizer(method="textrank", corpus=CORPUS)
+    texts = [ARTICLE, "짧다", ARTICLE.replace("세븐틴", "뉴진스")]
+    expected = [summarizer.summarize(text, max_length=80, min_length=10) for text in texts]
+
+    assert summarizer.summarize_many(texts, max_length=80, min_length=10) == expected
+
+    original = summarizer._summarize_batch
+
+    def fail_on_batch(batch, max_length, min_length):
+        if len(batch) > 1 or batch[0] == "짧다":
+            raise RuntimeError("boom")
+        return original(batch, max_length, min_length)
+
+    with patch.object(summarizer, "_summarize_batch", side_effect=fail_on_batch):
+        results = summarizer.summarize_many(texts, max_length=80, min_length=10)
+
+    assert results == [expected[0], None, expected[2]]
+
+
+@pytest.mark.django_db
+def test_corpus_stats_default_to_document_frequency_index():
+    from api.models import CrawledNews
+    from api.services.corpus_index import update_corpus_index
+
+    for i in range(3):
+        CrawledNews.objects.create(title=f"세븐틴 공연 {i}", url=f"https://example.com/news/{i}")
+    update_corpus_index()
+
+    stats = vector_summarizer.get_corpus_stats()
+
+    assert stats.num_docs == 3
+    assert stats.document_frequency("세븐틴") == 3
+    assert vector_summarizer.get_corpus_stats() is stats
+
+
+def test_sparse_engine_matches_python_scores():
+    pytest.importorskip("scipy.sparse")
+    texts = [ARTICLE, ARTICLE.replace("세븐틴", "뉴진스") + " 뉴진스 공연 예매가 시작됐다."]
+    for method in ("tfidf", "textrank"):
+        summarizer = VectorArticleSummarizer(method=method, corpus=CORPUS)
+        analyses = [summarizer._analyze(summarizer._clean_text(text)) for text in texts]
+
+        sparse_scores = summarizer._score_sparse(analyses)
+
+        for analysis, scores in zip(analyses, sparse_scores):
+            assert scores == pytest.approx(summarizer._score_python(analysis), abs=1e-9)
+
+
+def test_sparse_textrank_does_not_depend_on_batch_composition():
+    pytest.importorskip("scipy.sparse")
+    summarizer = VectorArticleSummarizer(method="textrank", corpus=CORPUS)
+    # 사슬형 기사는 몇 번 만에 수렴하고, ARTICLE은 더 오래 반복함
+    chain = " ".join(f"단어{i} 단어{i + 1} 연결 문장{i}입니다." for i in range(30))
+    analyses = [summarizer._analyze(summarizer._clean_text(text)) for text in (chain, ARTICLE)]
+
+    alone = summarizer._score_sparse(analyses[:1])[0]
+    batched = summarizer._score_sparse(analyses)[0]
+
+    assert batched == pytest.approx(alone, abs=1e-12)
+    assert batched == pytest.approx(summarizer._score_python(analyses[0]), abs=1e-9)
+
+
+def test_summarize_view_accepts_tfidf(client):
+    vector_summarizer.reset_corpus_stats(CORPUS)
+
+    response = client.post(
+        "/api/ai/summarize",
+        data=json.dumps({"input_type": "text", "text": ARTICLE, "summarize_method": "tfidf",
+                         "max_length": 50, "min_length": 10}),
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["summarize_method"] == "tfidf"
+    assert "암표" in data["summary"]
+
+
+def test_batch_summarize_textrank_uses_one_batch_and_cache(client):
+    vector_summarizer.reset_corpus_stats(CORPUS)
+    items = [
+        {"title": "A", "origainal_news": ARTICLE},
+        {"title": "B", "origainal_news": "짧다"},
+        {"title": "C", "origainal_news": ARTICLE},
+    ]
+    calls = []
+    original = VectorArticleSummarizer.summarize_many
+
+    def record(self, texts, max_length=200, min_length=50):
+        calls.append(list(texts))
+        return original(self, texts, max_length, min_length)
+
+    with patch.object(VectorArticleSummarizer, "summarize_many", record), patch(
+        "api.services.news_crawler.SummarizedNewsManager.save_summarized_news",
+        return_value={"success": True, "filename": "summarized_textrank.json", "count": 3},
+    ):
+        response = client.post(
+            "/api/news/batch-summarize",
+            data=json.dumps({"items": items, "method": "textrank", "max_length": 80, "min_length": 10}),
+            content_type="application/json",
+        )
+        again = summary_jobs.summarize_vector_items(items[:1], "textrank", 80, 10)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["method"] == "textrank"
+    assert calls == [[ARTICLE]]  # 중복 본문은 한 번만, 캐시 적중은 다시 계산하지 않음
+    summarized = data["items"]
+    assert [item["summarized"] for item in summarized] == [True, False, True]
+    assert summarized[0]["summary"] == summarized[2]["summary"]
+    assert summarized[2]["cached"] is True
+    assert again[0]["cached"] is True
@@ -15,6 +15,8 @@ from .views import (
     SavedNewsListView,
     SavedNewsDetailView,
     BatchSummarizeView,
+    BatchSummarizeJobView,
+    BatchSummarizeJobDetailView,
     SummarizedNewsListView,
     SummarizedNewsDetailView,
     # 댓글 필터링 AI 서비스 API (유지)
@@ -24,6 +26,8 @@ from .views import (
     AIModerationCheckView,
     AIModerationBatchView,
     AIModerationStatusView,
+    # 런타임 지표 API
+    AIMetricsView,
 )
 
 urlpatterns = [
@@ -34,6 +38,8 @@ urlpatterns = [
     path('news/saved/<str:filename>', SavedNewsDetailView.as_view(), name='saved-news-detail'),
     # 배치 요약 및 요약 결과 조회
     path('news/batch-summarize', BatchSummarizeView.as_view(), name='batch-summarize'),
+    path('news/batch-summarize/jobs', BatchSummarizeJobView.as_view(), name='batch-summarize-jobs'),
+    path('news/batch-summarize/jobs/<str:job_id>', BatchSummarizeJobDetailView.as_view(), name='batch-summarize-job-detail'),
     path('news/summarized', SummarizedNewsListView.as_view(), name='summarized-news-list'),
     path('news/summarized/<str:filename>', SummarizedNewsDetailView.as_view(), name='summarized-news-detail'),
 
@@ -47,4 +53,7 @@ urlpatterns = [
     path('ai/moderate', AIModerationCheckView.as_view(), name='ai-moderation-check'),
     path('ai/moderate/batch', AIModerationBatchView.as_view(), name='ai-moderation-batch'),
     path('ai/moderate/status', AIModerationStatusView.as_view(), name='ai-moderation-status'),
+
+    # 런타임 지표 (캐시 hit-rate, prefix KV 캐시 재사용)
+    path('ai/metrics', AIMetricsView.as_view(), name='ai-metrics'),
 ]
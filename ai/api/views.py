@@ -14,6 +14,7 @@
 #######################
 """
 import logging
+import os
 import time
 import uuid
 from rest_framework.views import APIView
@@ -28,9 +29,19 @@ from drf_yasg import openapi
 # 내부 모듈 임포트
 #######################
 from .serializers import SummarizeRequestSerializer, SummarizeResponseSerializer
-from .services.extractor import ArticleExtractor      # URL에서 기사 추출
+from .services.extraction_cache import CachedArticleExtractor  # URL에서 기사 추출 (캐시 적용)
 from .services.summarizer import ArticleSummarizer    # 규칙 기반 요약
-from .services.ai_summarizer import AISummarizer, check_ai_available  # AI 기반 요약
+from .services.vector_summarizer import VECTOR_METHODS, VectorArticleSummarizer  # TF-IDF/TextRank 요약
+from .services.ai_summarizer import check_ai_available  # AI 기반 요약 가능 여부
+from .services.inference_worker import get_ai_summarizer  # AI 요약기 (추론 워커 또는 in-process)
+from .services.summary_cache import summarize_with_cache  # 요약 결과 캐시
+from .services.summary_jobs import (  # 배치 요약 작업
+    get_summary_job_state,
+    submit_summary_job,
+    summarize_news_item,
+    summarize_rule_items,
+    summarize_vector_items,
+)
 from .permissions import ApiKeyPermission
 
 #######################
@@ -48,19 +59,53 @@ class HealthCheckView(APIView):
 
     용도: 서버가 정상 동작하는지 확인 (모니터링, 로드밸런서 등에서 사용)
     경로: GET /api/health
-    응답: {"status": "ok"}
+    응답: {"status": "ok", "models": "ready", ...}
+    - AI_PRELOAD_MODELS 사전 로드 중이면 503 {"status": "warming"}
+      (compose healthcheck가 모델 준비 후에만 통과)
     """
     permission_classes = []  # Health check requires no auth
 
     @swagger_auto_schema(
         operation_id='health_check',
         operation_summary='서버 상태 확인',
-        operation_description='서버가 정상적으로 동작하는지 확인합니다.',
+        operation_description='''
+서버가 정상적으로 동작하는지 확인합니다.
+
+- **models**: 사전 로드 상태 (ready / warming / degraded)
+  - warming: AI_PRELOAD_MODELS 모델을 로드/워밍업 중 → **503**
+  - degraded: 일부 모델 사전 로드 실패 (요청 시 지연 로딩 또는 규칙 기반으로 동작) → 200
+- **preload**: 모델별 상태 (status, load_ms, warmup_ms, error)
+- **inference**: 추론 실행 위치 (mode: inprocess / worker, reachable: 추론 워커 연결 여부)
+  - worker 모드에서는 추론 워커 프로세스의 사전 로드 상태를 보고합니다.
+        ''',
         responses={
             200: openapi.Response(
                 description='서버 정상',
                 examples={
-                    'application/json': {'status': 'ok'}
+                    'application/json': {
+                        'status': 'ok',
+                        'models': 'ready',
+                        'preload': {
+                            'moderation': {
+                                'status': 'ready', 'load_ms': 5400, 'warmup_ms': 120, 'error': None
+                            }
+                        },
+                        'inference': {'mode': 'worker', 'reachable': True}
+                    }
+                }
+            ),
+            503: openapi.Response(
+                description='모델 워밍업 중',
+                examples={
+                    'application/json': {
+                        'status': 'warming',
+                        'models': 'warming',
+                        'preload': {
+                            'moderation': {
+                                'status': 'loading', 'load_ms': None, 'warmup_ms': None, 'error': None
+                            }
+                        }
+                    }
                 }
             )
         },
@@ -68,7 +113,14 @@ class HealthCheckView(APIView):
     )
     @method_decorator(never_cache)  # 캐시 비활성화 (항상 실시간 상태 확인)
     def get(self, request):
-        return Response({'status': 'ok'}, status=status.HTTP_200_OK)
+        from .services.inference_worker import get_model_status
+        from .services.model_preload import STATE_WARMING
+
+        preload = get_model_status()
+        body = {'models': preload['state'], 'preload': preload['models'], 'inference': preload['inference']}
+        if preload['state'] == STATE_WARMING:
+            return Response({'status': 'warming', **body}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return Response({'status': 'ok', **body}, status=status.HTTP_200_OK)
 
 
 #######################
@@ -107,6 +159,10 @@ class SummarizeView(APIView):
 - **url**: 뉴스 기사 URL 입력
 - **text**: 직접 텍스트 입력
 
+## 추출형 요약 방식 (AI 모델 불필요)
+- **tfidf**: 기사 내 빈도 x 코퍼스(crawled_news) IDF가 높은 단어가 많은 문장 선택
+- **textrank**: 문장 유사도 그래프에서 중심성이 높은 문장 선택
+
 ## 지원 언어
 - **ko**: 한국어
 - **en**: 영어
@@ -155,6 +211,7 @@ class SummarizeView(APIView):
                         'bullets': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING), description='주요 포인트'),
                         'keywords': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_STRING), description='키워드'),
                         'elapsed_ms': openapi.Schema(type=openapi.TYPE_INTEGER, description='처리 시간(ms)'),
+                        'cached': openapi.Schema(type=openapi.TYPE_BOOLEAN, description='요약 캐시 사용 여부'),
                     }
                 ),
                 examples={
@@ -173,7 +230,8 @@ class SummarizeView(APIView):
                             "GPT와 같은 대규모 언어 모델이 주목받음"
                         ],
                         "keywords": ["인공지능", "자연어", "처리", "기술", "GPT"],
-                        "elapsed_ms": 125
+                        "elapsed_ms": 125,
+                        "cached": False
                     }
                 }
             ),
@@ -246,7 +304,7 @@ class SummarizeView(APIView):
         language = validated_data['language']               # 'ko' 또는 'en'
         max_length = validated_data['max_length']           # 요약 최대 길이
         min_length = validated_data['min_length']           # 요약 최소 길이
-        summarize_method = validated_data.get('summarize_method', 'rule')  # 'rule' 또는 'ai'
+        summarize_method = validated_data.get('summarize_method', 'rule')  # 'rule', 'ai', 'tfidf', 'textrank'
 
         #######################
         # AI 사용 가능 여부 확인
@@ -265,8 +323,10 @@ class SummarizeView(APIView):
                 url = validated_data['url']
                 logger.info(f"[{request_id}] Extracting article from URL: {url}")
 
-                extractor = ArticleExtractor()
+                # 캐시 -> CrawledNews.origin_news -> 네트워크 순으로 조회
+                extractor = CachedArticleExtractor()
                 extraction_result = extractor.extract(url)
+                logger.info(f"[{request_id}] Extraction cache: {extractor.last_cache_status}")
 
                 # 추출 실패 시 에러 반환
                 if not extraction_result['success']:
@@ -300,12 +360,16 @@ class SummarizeView(APIView):
 
             # 요약 방식에 따라 적절한 요약기 선택
             if summarize_method == 'ai':
-                summarizer = AISummarizer(language=language)      # AI 기반 요약기
+                summarizer = get_ai_summarizer(language=language)  # AI 기반 요약기 (추론 워커 또는 in-process)
+            elif summarize_method in VECTOR_METHODS:
+                summarizer = VectorArticleSummarizer(method=summarize_method, language=language)  # TF-IDF/TextRank
             else:
                 summarizer = ArticleSummarizer(language=language)  # 규칙 기반 요약기
 
-            # 요약 실행
-            summary_result = summarizer.summarize(
+            # 요약 실행 (같은 본문/조건/모델이면 캐시 재사용)
+            summary_result, summary_cached = summarize_with_cache(
+                summarizer,
+                summarize_method,
                 text=article_text,
                 max_length=max_length,
                 min_length=min_length
@@ -327,7 +391,8 @@ class SummarizeView(APIView):
                 'summary': summary_result['summary'],    # 요약 결과
                 'bullets': summary_result['bullets'],    # 핵심 포인트 목록
                 'keywords': summary_result['keywords'],  # 추출된 키워드
-                'elapsed_ms': elapsed_ms                 # 처리 시간(ms)
+                'elapsed_ms': elapsed_ms,                # 처리 시간(ms)
+                'cached': summary_cached                 # 요약 캐시 사용 여부
             }
 
             #######################
@@ -582,6 +647,57 @@ class SavedNewsDetailView(APIView):
 #######################
 # 배치 요약 API
 #######################
+def _resolve_batch_summarizer(method):
+    """
+    배치 요약 방식 결정 및 요약기 생성
+
+    Returns:
+        tuple: (method, summarizer) - AI를 쓸 수 없으면 rule로 대체
+    """
+    if method not in ['rule', 'ai', *VECTOR_METHODS]:
+        method = 'rule'
+
+    # AI 사용 가능 여부 확인
+    if method == 'ai' and not check_ai_available():
+        logger.warning("AI requested but not available, falling back to rule-based")
+        method = 'rule'
+
+    # 요약기 선택
+    if method == 'ai':
+        return method, get_ai_summarizer(language='ko')
+    if method in VECTOR_METHODS:
+        return method, VectorArticleSummarizer(method=method, language='ko')
+    return method, ArticleSummarizer(language='ko')
+
+
+BATCH_SUMMARIZE_REQUEST_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=['items', 'method'],
+    properties={
+        'items': openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    'title': openapi.Schema(type=openapi.TYPE_STRING),
+                    'origainal_news': openapi.Schema(type=openapi.TYPE_STRING),
+                    'originallink': openapi.Schema(type=openapi.TYPE_STRING),
+                    'pubDate': openapi.Schema(type=openapi.TYPE_STRING),
+                }
+            ),
+            description='요약할 뉴스 아이템 목록'
+        ),
+        'method': openapi.Schema(
+            type=openapi.TYPE_STRING,
+            enum=['rule', 'ai', *VECTOR_METHODS],
+            description='요약 방식 (rule: 알고리즘, ai: AI 모델, tfidf/textrank: 추출형)'
+        ),
+        'max_length': openapi.Schema(type=openapi.TYPE_INTEGER, default=300),
+        'min_length': openapi.Schema(type=openapi.TYPE_INTEGER, default=50),
+    }
+)
+
+
 class BatchSummarizeView(APIView):
     """
     선택된 뉴스 배치 요약 엔드포인트
@@ -593,33 +709,11 @@ class BatchSummarizeView(APIView):
     @swagger_auto_schema(
         operation_id='batch_summarize',
         operation_summary='선택된 뉴스 배치 요약',
-        operation_description='저장된 뉴스에서 선택된 아이템들을 요약하고 결과를 저장합니다.',
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            required=['items', 'method'],
-            properties={
-                'items': openapi.Schema(
-                    type=openapi.TYPE_ARRAY,
-                    items=openapi.Schema(
-                        type=openapi.TYPE_OBJECT,
-                        properties={
-                            'title': openapi.Schema(type=openapi.TYPE_STRING),
-                            'origainal_news': openapi.Schema(type=openapi.TYPE_STRING),
-                            'originallink': openapi.Schema(type=openapi.TYPE_STRING),
-                            'pubDate': openapi.Schema(type=openapi.TYPE_STRING),
-                        }
-                    ),
-                    description='요약할 뉴스 아이템 목록'
-                ),
-                'method': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    enum=['rule', 'ai'],
-                    description='요약 방식 (rule: 알고리즘, ai: AI 모델)'
-                ),
-                'max_length': openapi.Schema(type=openapi.TYPE_INTEGER, default=300),
-                'min_length': openapi.Schema(type=openapi.TYPE_INTEGER, default=50),
-            }
+        operation_description=(
+            '저장된 뉴스에서 선택된 아이템들을 요약하고 결과를 저장합니다. '
+            '아이템이 많거나 method=ai이면 POST /api/news/batch-summarize/jobs (비동기 작업)를 사용하세요.'
         ),
+        request_body=BATCH_SUMMARIZE_REQUEST_SCHEMA,
         responses={
             200: openapi.Response(
                 description='요약 성공',
@@ -647,64 +741,19 @@ class BatchSummarizeView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        if method not in ['rule', 'ai']:
-            method = 'rule'
+        method, summarizer = _resolve_batch_summarizer(method)
 
-        # AI 사용 가능 여부 확인
-        if method == 'ai' and not check_ai_available():
-            logger.warning("AI requested but not available, falling back to rule-based")
-            method = 'rule'
-
-        # 요약기 선택
-        if method == 'ai':
-            summarizer = AISummarizer(language='ko')
+        # 각 아이템 요약 (규칙 기반은 CPU 코어 수만큼 프로세스로 나눠 처리,
+        # tfidf/textrank는 배치 전체를 한 번의 행렬 연산으로 점수 계산)
+        if method == 'rule':
+            summarized_items = summarize_rule_items(items, max_length, min_length)
+        elif method in VECTOR_METHODS:
+            summarized_items = summarize_vector_items(items, method, max_length, min_length)
         else:
-            summarizer = ArticleSummarizer(language='ko')
-
-        # 각 아이템 요약
-        summarized_items = []
-        for item in items:
-            text = item.get('origainal_news', '')
-            if not text or len(text.strip()) < 50:
-                # 텍스트가 짧으면 건너뛰기
-                summarized_items.append({
-                    **item,
-                    'summary': '',
-                    'bullets': [],
-                    'keywords': [],
-                    'summarized': False,
-                    'error': '텍스트가 너무 짧습니다.'
-                })
-                continue
-
-            try:
-                result = summarizer.summarize(
-                    text=text,
-                    max_length=max_length,
-                    min_length=min_length
-                )
-
-                summarized_items.append({
-                    'title': item.get('title', ''),
-                    'originallink': item.get('originallink', ''),
-                    'pubDate': item.get('pubDate', ''),
-                    'original_text': text[:500] + '...' if len(text) > 500 else text,
-                    'summary': result['summary'],
-                    'bullets': result['bullets'],
-                    'keywords': result['keywords'],
-                    'summarized': True,
-                    'error': None
-                })
-            except Exception as e:
-                logger.exception(f"요약 실패: {item.get('title', '')}")
-                summarized_items.append({
-                    **item,
-                    'summary': '',
-                    'bullets': [],
-                    'keywords': [],
-                    'summarized': False,
-                    'error': 'Summarization failed'
-                })
+            summarized_items = [
+                summarize_news_item(summarizer, method, item, max_length, min_length)
+                for item in items
+            ]
 
         # 결과 저장
         from .services.news_crawler import SummarizedNewsManager
@@ -726,6 +775,123 @@ class BatchSummarizeView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class BatchSummarizeJobView(APIView):
+    """
+    배치 요약 작업 등록 엔드포인트 (비동기)
+
+    경로: POST /api/news/batch-summarize/jobs
+    """
+    permission_classes = [ApiKeyPermission]
+
+    @swagger_auto_schema(
+        operation_id='batch_summarize_job_create',
+        operation_summary='배치 요약 작업 등록',
+        operation_description=(
+            '요약 작업을 등록하고 job_id를 즉시 반환합니다. '
+            '아이템은 백그라운드에서 병렬로 요약되며 GET /api/news/batch-summarize/jobs/{job_id}로 '
+            '진행 상태와 완료된 결과를 조회합니다. 모든 아이템이 끝나면 결과 파일로 저장됩니다.'
+        ),
+        request_body=BATCH_SUMMARIZE_REQUEST_SCHEMA,
+        responses={
+            202: openapi.Response(
+                description='작업 등록',
+                examples={
+                    'application/json': {
+                        'success': True,
+                        'job_id': '3f2c9a0e5b8d4c1e9f7a6b5c4d3e2f1a',
+                        'status': 'queued',
+                        'method': 'ai',
+                        'progress': {'total': 30, 'completed': 0, 'succeeded': 0, 'failed': 0, 'pending': 30},
+                    }
+                }
+            ),
+            400: openapi.Response(description='요약할 뉴스 없음'),
+        },
+        tags=['News']
+    )
+    def post(self, request):
+        items = request.data.get('items', [])
+        if not items:
+            return Response(
+                {'success': False, 'error': '요약할 뉴스를 선택해주세요.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        method, summarizer = _resolve_batch_summarizer(request.data.get('method', 'rule'))
+        job = submit_summary_job(
+            items,
+            method,
+            summarizer,
+            max_length=request.data.get('max_length', 300),
+            min_length=request.data.get('min_length', 50),
+        )
+        state = job.to_dict(since=job.total)
+        return Response({
+            'success': True,
+            'job_id': job.job_id,
+            'status': state['status'],
+            'method': method,
+            'progress': state['progress'],
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+class BatchSummarizeJobDetailView(APIView):
+    """
+    배치 요약 작업 상태/결과 조회
+
+    경로: GET /api/news/batch-summarize/jobs/<job_id>?since=N
+    """
+    permission_classes = [ApiKeyPermission]
+
+    @swagger_auto_schema(
+        operation_id='batch_summarize_job_detail',
+        operation_summary='배치 요약 작업 조회',
+        operation_description=(
+            '작업 진행 상태와 since번째 이후에 완료된 결과를 반환합니다. '
+            '결과는 완료 순서이며 index가 입력 순서입니다. 응답의 next를 다음 요청의 since로 사용합니다.'
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                'since', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, default=0,
+                description='이미 받은 결과 수'
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                description='조회 성공',
+                examples={
+                    'application/json': {
+                        'success': True,
+                        'job_id': '3f2c9a0e5b8d4c1e9f7a6b5c4d3e2f1a',
+                        'status': 'running',
+                        'method': 'ai',
+                        'progress': {'total': 30, 'completed': 12, 'succeeded': 11, 'failed': 1, 'pending': 18},
+                        'filename': None,
+                        'error': None,
+                        'items': [{'index': 3, 'title': '...', 'summary': '...', 'summarized': True}],
+                        'next': 12,
+                    }
+                }
+            ),
+            404: openapi.Response(description='작업을 찾을 수 없음'),
+        },
+        tags=['News']
+    )
+    def get(self, request, job_id):
+        try:
+            since = int(request.query_params.get('since', 0))
+        except (TypeError, ValueError):
+            since = 0
+
+        state = get_summary_job_state(job_id, since=since)
+        if state is None:
+            return Response(
+                {'success': False, 'error': '작업을 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response({'success': True, **state}, status=status.HTTP_200_OK)
+
+
 #######################
 # 요약된 뉴스 조회 API
 #######################
@@ -925,7 +1091,7 @@ class CommentFilterTestView(APIView):
     )
     def post(self, request):
         from .serializers import CommentFilterTestRequestSerializer
-        from .services.comment_filter import get_filter_service
+        from .services.inference_worker import get_comment_filter
 
         serializer = CommentFilterTestRequestSerializer(data=request.data)
         if not serializer.is_valid():
@@ -935,7 +1101,7 @@ class CommentFilterTestView(APIView):
             )
 
         content = serializer.validated_data['content']
-        filter_service = get_filter_service()
+        filter_service = get_comment_filter()
         result = filter_service.filter_comment(content)
 
         response_data = {
@@ -945,7 +1111,8 @@ class CommentFilterTestView(APIView):
             'rule_name': result.rule_name,
             'filter_type': result.filter_type,
             'matched_pattern': result.matched_pattern,
-            'reason': result.reason
+            'reason': result.reason,
+            'score': result.score
         }
 
         return Response(response_data, status=status.HTTP_200_OK)
@@ -1039,7 +1206,7 @@ class CommentFilterBatchView(APIView):
     )
     def post(self, request):
         from .serializers import CommentFilterBatchRequestSerializer
-        from .services.comment_filter import get_filter_service
+        from .services.inference_worker import get_comment_filter
 
         serializer = CommentFilterBatchRequestSerializer(data=request.data)
         if not serializer.is_valid():
@@ -1049,7 +1216,7 @@ class CommentFilterBatchView(APIView):
             )
 
         comments = serializer.validated_data['comments']
-        filter_service = get_filter_service()
+        filter_service = get_comment_filter()
         results = filter_service.batch_filter(comments)
 
         response_results = []
@@ -1058,6 +1225,7 @@ class CommentFilterBatchView(APIView):
             item = {
                 'index': i,
                 'is_filtered': result.is_filtered,
+                'score': result.score,
             }
             if result.is_filtered:
                 filtered_count += 1
@@ -1141,10 +1309,11 @@ AI 모델을 사용하여 텍스트 콘텐츠의 부적절한 내용을 감지
     "highest_category": "profanity",
     "highest_score": 0.95,
     "confidence": 0.95,
-    "model_used": "ko",
-    "processing_time_ms": 45,
+    "model_used": "rule_based",
+    "processing_time_ms": 1,
     "cached": false,
-    "error": null
+    "error": null,
+    "matched_rules": ["profanity.sibal"]
 }
 ```
 
@@ -1160,7 +1329,8 @@ AI 모델을 사용하여 텍스트 콘텐츠의 부적절한 내용을 감지
     "model_used": "ko",
     "processing_time_ms": 38,
     "cached": false,
-    "error": null
+    "error": null,
+    "matched_rules": []
 }
 ```
         ''',
@@ -1203,7 +1373,8 @@ AI 모델을 사용하여 텍스트 콘텐츠의 부적절한 내용을 감지
                         'model_used': 'ko',
                         'processing_time_ms': 38,
                         'cached': False,
-                        'error': None
+                        'error': None,
+                        'matched_rules': []
                     }
                 }
             ),
@@ -1221,7 +1392,7 @@ AI 모델을 사용하여 텍스트 콘텐츠의 부적절한 내용을 감지
     )
     def post(self, request):
         from .serializers import AIModerationCheckRequestSerializer
-        from .services.ai_moderation import get_ai_moderator
+        from .services.inference_worker import get_moderator
 
         serializer = AIModerationCheckRequestSerializer(data=request.data)
         if not serializer.is_valid():
@@ -1234,7 +1405,7 @@ AI 모델을 사용하여 텍스트 콘텐츠의 부적절한 내용을 감지
         use_cache = serializer.validated_data.get('use_cache', True)
         thresholds = serializer.validated_data.get('thresholds')
 
-        moderator = get_ai_moderator(language='ko')
+        moderator = get_moderator(language='ko')
         result = moderator.check(
             text=text,
             use_cache=use_cache,
@@ -1351,7 +1522,7 @@ class AIModerationBatchView(APIView):
     )
     def post(self, request):
         from .serializers import AIModerationBatchRequestSerializer
-        from .services.ai_moderation import get_ai_moderator
+        from .services.inference_worker import get_moderator
 
         serializer = AIModerationBatchRequestSerializer(data=request.data)
         if not serializer.is_valid():
@@ -1363,7 +1534,7 @@ class AIModerationBatchView(APIView):
         texts = serializer.validated_data['texts']
         use_cache = serializer.validated_data.get('use_cache', True)
 
-        moderator = get_ai_moderator(language='ko')
+        moderator = get_moderator(language='ko')
         results = moderator.batch_check(texts, use_cache)
 
         response_results = []
@@ -1410,6 +1581,11 @@ AI 모더레이션 기능의 사용 가능 여부와 시스템 상태를 확인
     "gpu_available": true,
     "gpu_name": "NVIDIA GeForce RTX 3080",
     "models_loaded": ["korean"],
+    "cache": {
+        "hits": 120, "misses": 45, "size": 45, "hit_rate": 0.7273,
+        "evictions": 0, "expirations": 3,
+        "maxsize": 1000, "ttl": 300, "backend": "local"
+    },
     "error": null
 }
 ```
@@ -1424,6 +1600,7 @@ AI 모더레이션 기능의 사용 가능 여부와 시스템 상태를 확인
                         'torch_installed': True,
                         'gpu_available': True,
                         'models_loaded': ['korean'],
+                        'cache': {'hits': 120, 'misses': 45, 'evictions': 0},
                         'error': None
                     }
                 }
@@ -1436,3 +1613,80 @@ AI 모더레이션 기능의 사용 가능 여부와 시스템 상태를 확인
 
         status_info = check_ai_moderation_available()
         return Response(status_info, status=status.HTTP_200_OK)
+
+
+#######################
+# 런타임 지표 API
+#######################
+class AIMetricsView(APIView):
+    """
+    캐시/추론 최적화 지표 조회 엔드포인트
+
+    경로: GET /api/ai/metrics
+    """
+    permission_classes = [ApiKeyPermission]
+
+    @swagger_auto_schema(
+        operation_id='ai_metrics',
+        operation_summary='AI 런타임 지표 조회',
+        operation_description='''
+워커 프로세스별 캐시 hit-rate와 prompt prefix KV 캐시 재사용 지표를 반환합니다.
+
+`memory`는 응답한 워커의 RSS/PSS(`process`)와, gunicorn 아래에서 실행 중이면
+master와 모든 워커의 리포트(`gunicorn`)를 포함합니다 (Linux procfs 기준, kB).
+
+## 응답 예시
+```json
+{
+    "prefix_cache": {
+        "comment_filter": {
+            "prefix_tokens": 58,
+            "ready": true,
+            "reused_prompts": 120,
+            "fallback_prompts": 0,
+            "saved_prefill_tokens": 6960
+        }
+    },
+    "summary_cache": {"hits": 3, "misses": 10, "size": 10, "hit_rate": 0.2308},
+    "extraction_cache": {"hits": 5, "misses": 7, "size": 7, "hit_rate": 0.4167},
+    "dns_cache": {"hits": 40, "negative_hits": 1, "misses": 12, "size": 12, "hit_rate": 0.7736},
+    "moderation_cache": {"hits": 120, "misses": 45, "size": 45, "hit_rate": 0.7273, "evictions": 0},
+    "memory": {
+        "preload_mode": "master",
+        "process": {"pid": 8, "rss_kb": 412000, "pss_kb": 96000, "shared_kb": 330000, "private_kb": 82000},
+        "gunicorn": {
+            "master": {"pid": 1, "rss_kb": 401000, "pss_kb": 90000},
+            "workers": [{"pid": 8, "rss_kb": 412000, "pss_kb": 96000}, {"pid": 9, "rss_kb": 409000, "pss_kb": 95000}],
+            "total": {"rss_kb": 1222000, "pss_kb": 281000, "shared_savings_kb": 941000}
+        }
+    }
+}
+```
+        ''',
+        tags=['AI Metrics']
+    )
+    @method_decorator(never_cache)
+    def get(self, request):
+        from .services.ai_moderation import get_moderation_cache
+        from .services.extraction_cache import get_extraction_cache
+        from .services.memory_report import read_process_memory, worker_memory_report
+        from .services.model_preload import PRELOAD_MODE
+        from .services.prefix_cache import get_prefix_cache_stats
+        from .services.summary_cache import get_summary_cache
+        from .services.url_security import get_dns_cache_stats
+
+        return Response({
+            'prefix_cache': get_prefix_cache_stats(),
+            'summary_cache': get_summary_cache().stats(),
+            'extraction_cache': get_extraction_cache().stats(),
+            'dns_cache': get_dns_cache_stats(),
+            'moderation_cache': get_moderation_cache().stats(),
+            'memory': {
+                'preload_mode': PRELOAD_MODE,
+                'process': read_process_memory(),
+                'gunicorn': (
+                    worker_memory_report(os.getppid())
+                    if request.META.get('SERVER_SOFTWARE', '').startswith('gunicorn') else None
+                ),
+            },
+        }, status=status.HTTP_200_OK)
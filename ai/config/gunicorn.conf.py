@@ -0,0 +1,37 @@
+"""
+gunicorn 설정 (scripts/start_django.sh에서 -c 로 지정)
+
+바인드/워커 수/타임아웃은 start_django.sh의 CLI 옵션으로 넘기고,
+여기서는 워커 수명주기 훅만 정의합니다.
+
+AI_PRELOAD_MODE=master 이면 앱을 master에서 먼저 로드하고(preload_app)
+AI_PRELOAD_MODELS 가중치를 fork 전에 올려 워커들이 copy-on-write로 공유합니다.
+"""
+import os
+
+preload_app = os.getenv("AI_PRELOAD_MODE", "worker").lower() == "master"
+# AI_INFERENCE_MODE=worker: 모델은 별도 추론 워커 프로세스가 로드하므로 HTTP 워커에서는 건너뜀
+models_in_inference_worker = os.getenv("AI_INFERENCE_MODE", "inprocess").lower() == "worker"
+
+
+def when_ready(server):
+    """master 준비 완료 (워커 fork 직전): master 모드면 모델 가중치 로드"""
+    if not preload_app or models_in_inference_worker:
+        return
+
+    from api.services.memory_report import read_process_memory
+    from api.services.model_preload import preload_in_master
+
+    if preload_in_master():
+        server.log.info("Models preloaded in master: %s", read_process_memory())
+
+
+def post_worker_init(worker):
+    """워커가 Django 앱을 로드한 직후: AI_PRELOAD_MODELS 모델을 백그라운드에서 사전 로드/워밍업"""
+    if models_in_inference_worker:
+        return
+
+    from api.services.model_preload import start_preload
+
+    if start_preload() is not None:
+        worker.log.info("Model preload started (worker pid %s)", worker.pid)
@@ -161,6 +161,20 @@ else:
     }
 
 
+#######################
+# 캐시 설정
+#######################
+# 추출/요약 결과 등을 워커 간에 공유할 때 사용 (기본: 프로세스 로컬 메모리)
+# 예: DJANGO_CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+#     DJANGO_CACHE_LOCATION=redis://redis:6379/1
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('DJANGO_CACHE_LOCATION', ''),
+    }
+}
+
+
 #######################
 # 비밀번호 검증 설정
 #######################
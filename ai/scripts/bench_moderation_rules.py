@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+AIContentModerator 규칙 기반 사전 필터 마이크로벤치마크
+
+5,000자 입력 기준으로 텍스트 1건당 비용을 측정한다.
+- legacy: 호출마다 패턴을 순회하며 re.search/re.findall 하던 이전 구현
+- engine: 미리 컴파일한 ModerationRuleEngine (_rule_based_check)
+
+사용법 (ai/ 디렉터리에서):
+    python scripts/bench_moderation_rules.py [--repeat 2000]
+"""
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.services.ai_moderation import AIContentModerator  # noqa: E402
+
+TEXT_LENGTH = 5000
+
+
+def legacy_rule_check(text):
+    """이전 _rule_based_check의 매칭 부분 (비교 기준)"""
+    profanity_patterns = [
+        r'시[발빠팔][ㄱ-ㅎㅏ-ㅣ]*',
+        r'씨[발빠팔][ㄱ-ㅎㅏ-ㅣ]*',
+        r'ㅅㅂ',
+        r'ㅂㅅ',
+        r'ㄱㅅㄲ',
+        r'병[신싄][ㄱ-ㅎㅏ-ㅣ]*',
+        r'ㅄ',
+    ]
+    profanity = False
+    for pattern in profanity_patterns:
+        if re.search(pattern, text, re.IGNORECASE):
+            profanity = True
+            break
+
+    spam_indicators = [
+        len(re.findall(r'http[s]?://\S+', text)) > 3,
+        len(re.findall(r'[\U0001F600-\U0001F64F]', text)) > 10,
+        bool(re.search(r'(.)\1{10,}', text)),
+        bool(re.search(r'(광고|홍보|클릭|무료|당첨)', text)),
+    ]
+    return profanity, sum(spam_indicators) / len(spam_indicators)
+
+
+def build_inputs():
+    """5,000자 입력 세트: 정상 / 끝부분 욕설 / URL·키워드 스팸"""
+    base = '오늘 콘서트 정말 최고였어요 다음 투어도 기대합니다 '
+    clean = (base * (TEXT_LENGTH // len(base) + 1))[:TEXT_LENGTH]
+    profanity = clean[:TEXT_LENGTH - 4] + ' 시발'
+    spam_unit = '무료 굿즈 당첨 https://example.com/event 😀 '
+    spam = (spam_unit * (TEXT_LENGTH // len(spam_unit) + 1))[:TEXT_LENGTH]
+    return {'clean': clean, 'profanity_tail': profanity, 'spam': spam}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=2000, help='입력당 반복 횟수')
+    args = parser.parse_args()
+
+    moderator = AIContentModerator()
+    print(f"{'input':<16}{'legacy us/text':>16}{'engine us/text':>16}{'speedup':>10}")
+    for name, text in build_inputs().items():
+        legacy = timeit.timeit(lambda: legacy_rule_check(text), number=args.repeat)
+        engine = timeit.timeit(lambda: moderator._rule_based_check(text), number=args.repeat)
+        legacy_us = legacy / args.repeat * 1e6
+        engine_us = engine / args.repeat * 1e6
+        print(f"{name:<16}{legacy_us:>16.1f}{engine_us:>16.1f}{legacy_us / engine_us:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
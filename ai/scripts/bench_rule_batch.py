@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+규칙 기반 배치 요약 처리량 벤치마크 (순차 vs 프로세스 풀)
+
+실제 기사 길이(약 1,000~2,500자, 평균 1,700자)의 한국어 기사를 생성해 비교한다.
+- sequential: 현재 프로세스에서 한 건씩 ArticleSummarizer.summarize
+- pool: summarize_many (CPU 코어 수만큼 프로세스에 chunk 분배, 순서 유지)
+
+풀 처리량은 코어 수에 비례하므로 `nproc`가 1이면 차이가 없다(전송 비용만큼 느려짐).
+
+사용법 (ai/ 디렉터리에서):
+    python scripts/bench_rule_batch.py [--articles 1000] [--workers 4]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.services import summarizer as summarizer_module  # noqa: E402
+
+SUBJECTS = [
+    '그룹 세븐틴', '가수 아이유', '방탄소년단', '뉴진스', '르세라핌', '에스파', '스트레이 키즈',
+    '소속사 관계자', '음반 유통사', '공연 기획사', '팬클럽 운영진', '음원 차트 집계 기관',
+]
+EVENTS = [
+    '월드투어 추가 공연을 발표했다', '정규 앨범 발매 일정을 공개했다', '신곡 뮤직비디오 조회수 1억 회를 돌파했다',
+    '팬미팅 티켓이 예매 시작 3분 만에 매진됐다', '글로벌 음원 차트 1위에 올랐다', '연말 시상식 대상 후보에 이름을 올렸다',
+    '해외 페스티벌 헤드라이너로 확정됐다', '데뷔 10주년 기념 전시회를 연다고 밝혔다',
+]
+DETAILS = [
+    '이번 공연은 서울을 시작으로 도쿄, 방콕, 로스앤젤레스 등 12개 도시에서 진행된다',
+    '관계자는 팬들의 성원에 보답하기 위해 무대 연출과 세트리스트를 새롭게 준비했다고 설명했다',
+    '음반 선주문량은 발매 일주일 전 이미 200만 장을 넘어선 것으로 집계됐다',
+    '업계에서는 이번 성과가 케이팝 시장의 외연을 넓히는 계기가 될 것으로 보고 있다',
+    '온라인 커뮤니티에서는 공연 실황 영상과 응원법을 공유하는 게시글이 잇따르고 있다',
+    '티켓 예매 과정에서 접속자가 몰리며 예매 사이트가 한때 지연되기도 했다',
+    '멤버들은 개인 채널을 통해 직접 준비 과정을 공개하며 기대감을 높였다',
+    '해외 언론들도 이번 활동을 비중 있게 다루며 높은 관심을 보였다',
+    '소속사는 암표 거래를 막기 위해 본인 확인 절차를 강화하겠다고 밝혔다',
+    '공연장 주변에는 팬들을 위한 포토존과 굿즈 판매 부스가 마련될 예정이다',
+]
+
+
+def build_articles(count, seed=20260125):
+    """실제 길이의 합성 한국어 기사 (문장 18~40개)"""
+    rng = random.Random(seed)
+    articles = []
+    for _ in range(count):
+        sentences = [f'{rng.choice(SUBJECTS)}이(가) {rng.choice(EVENTS)}.']
+        for _ in range(rng.randint(18, 40)):
+            sentences.append(f'{rng.choice(DETAILS)}. ')
+            if rng.random() < 0.3:
+                sentences.append(f'{rng.choice(SUBJECTS)} 측은 "{rng.choice(EVENTS)}"고 전했다. ')
+        articles.append(' '.join(sentences))
+    return articles
+
+
+def run_sequential(texts):
+    summarizer = summarizer_module.ArticleSummarizer(language='ko')
+    return [summarizer.summarize(text, max_length=300, min_length=50) for text in texts]
+
+
+def run_pool(texts, workers):
+    return summarizer_module.summarize_many(texts, max_length=300, min_length=50, workers=workers)
+
+
+def measure(label, func, texts):
+    started = time.perf_counter()
+    results = func(texts)
+    elapsed = time.perf_counter() - started
+    print(f'{label:<22} {elapsed:8.3f}s  {len(texts) / elapsed:9.1f} articles/s')
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--articles', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    texts = build_articles(args.articles)
+    avg_chars = sum(map(len, texts)) / len(texts)
+    print(f'{len(texts)} articles, avg {avg_chars:.0f} chars, {args.workers} workers (cpu_count={os.cpu_count()})')
+
+    sequential, seq_time = measure('sequential', run_sequential, texts)
+    # 풀 기동(forkserver + import) 비용은 첫 배치에만 들어가므로 따로 측정
+    warmup = texts[:max(summarizer_module.SUMMARY_RULE_POOL_MIN_ITEMS, args.workers * 4)]
+    measure('pool (cold start)', lambda t: run_pool(t, args.workers), warmup)
+    pooled, pool_time = measure('pool', lambda t: run_pool(t, args.workers), texts)
+    summarizer_module.shutdown_pool()
+
+    assert pooled == sequential, 'pooled output differs from sequential output'
+    print(f'speedup: {seq_time / pool_time:.2f}x (outputs identical, order preserved)')
+
+
+if __name__ == '__main__':
+    main()
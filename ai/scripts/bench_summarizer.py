@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+ArticleSummarizer 규칙 기반 요약 마이크로벤치마크
+
+긴 기사(기본 20,000자) 한 건당 요약 시간을 비교하고 출력이 같은지 확인한다.
+- legacy: 단계마다 텍스트를 다시 토큰화하고, 문장 선택/최소 길이 보충을
+  리스트 포함 검사(O(n²))로 하던 이전 구현
+- current: 한 번 토큰화 + 인덱스/힙 기반 문장 선택을 쓰는 ArticleSummarizer
+
+--scaling: 문장 수를 1,000 -> 20,000으로 늘리며 (요약 길이 = 원문의 50%, 예: 긴 녹취록 요약)
+두 구현의 시간 증가율을 비교한다. 입력 문장은 모두 서로 달라서
+(중복 문장 처리만 다른) 두 구현의 출력이 같아야 한다.
+
+사용법 (ai/ 디렉터리에서):
+    python scripts/bench_summarizer.py [--chars 20000] [--repeat 20]
+    python scripts/bench_summarizer.py --scaling
+"""
+import argparse
+import random
+import re
+import sys
+import time
+import timeit
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.services.summarizer import ArticleSummarizer  # noqa: E402
+from scripts.bench_rule_batch import DETAILS, EVENTS, SUBJECTS  # noqa: E402
+
+
+class LegacyArticleSummarizer(ArticleSummarizer):
+    """이전 구현 (비교 기준): 단계마다 re.findall로 다시 토큰화하고 불용어 set을 매번 생성"""
+
+    def _select_top_sentences(self, sentences, scores, max_length):
+        ranked = sorted(zip(sentences, scores), key=lambda x: x[1], reverse=True)
+        selected = []
+        total_length = 0
+        for sentence, score in ranked:
+            if total_length + len(sentence) <= max_length:
+                selected.append(sentence)
+                total_length += len(sentence) + 1
+            if total_length >= max_length * 0.9:
+                break
+        return [sent for sent in sentences if sent in selected]
+
+    def _extract_bullets(self, sentences, scores=None):
+        ranked = sorted(zip(sentences, scores), key=lambda x: x[1], reverse=True)
+        bullets = [sent for sent, score in ranked[:5]]
+        return [b[:100] + '...' if len(b) > 100 else b for b in bullets][:6]
+
+    def _summarize_rule_based(self, text, max_length, min_length):
+        text = re.sub(r'\s+', ' ', text).strip()
+        if self.language == 'ko':
+            sentences = re.split(r'[.!?]\s+', text)
+        else:
+            sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
+        if not sentences:
+            return {'summary': text[:max_length], 'bullets': ['내용 분석 실패'], 'keywords': []}
+
+        words = re.findall(r'\b\w+\b', text.lower())
+        stop_words = set([
+            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+            '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도'
+        ])
+        words = [w for w in words if w not in stop_words and len(w) > 1]
+        word_freq = Counter(words)
+        max_freq = max(word_freq.values()) if word_freq else 1
+        for word in word_freq:
+            word_freq[word] = word_freq[word] / max_freq
+
+        scores = []
+        for sentence in sentences:
+            words = re.findall(r'\b\w+\b', sentence.lower())
+            score = sum(word_freq.get(word, 0) for word in words)
+            if len(words) > 0:
+                score = score / len(words)
+            scores.append(score)
+
+        summary_sentences = self._select_top_sentences(sentences, scores, max_length)
+        summary = ' '.join(summary_sentences)
+        if len(summary) < min_length and len(sentences) > len(summary_sentences):
+            for sent in [s for s in sentences if s not in summary_sentences]:
+                if len(summary) + len(sent) <= max_length:
+                    summary += ' ' + sent
+                if len(summary) >= min_length:
+                    break
+
+        words = re.findall(r'\b\w+\b', text.lower())
+        stop_words = set([
+            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+            'this', 'that', 'with', 'from', 'by', 'as', 'be', 'have', 'has',
+            '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도',
+            '있다', '없다', '하다', '되다', '이다'
+        ])
+        words = [w for w in words if w not in stop_words and len(w) > 2]
+        keywords = [word for word, count in Counter(words).most_common(10)]
+
+        return {
+            'summary': summary.strip(),
+            'bullets': self._extract_bullets(sentences, scores),
+            'keywords': keywords,
+        }
+
+
+def build_sentences(count, seed=20260125):
+    """서로 다른 합성 한국어 문장 (중복 문장이 없어야 두 구현의 출력이 같음)"""
+    rng = random.Random(seed)
+    return [
+        f'{rng.choice(SUBJECTS)} {index}번째 소식에 따르면 {rng.choice(EVENTS)}고 하며 {rng.choice(DETAILS)}.'
+        for index in range(count)
+    ]
+
+
+def build_long_article(chars):
+    """chars 길이의 긴 기사"""
+    text = ''
+    count = 64
+    while len(text) < chars:
+        text = ' '.join(build_sentences(count))
+        count *= 2
+    return text[:text.rfind('.', 0, chars) + 1]
+
+
+def run_scaling():
+    legacy = LegacyArticleSummarizer(language='ko')
+    current = ArticleSummarizer(language='ko')
+    print(f'{"sentences":>9} {"chars":>9} {"legacy":>10} {"current":>10}')
+    for count in (1000, 2000, 5000, 10000, 20000):
+        text = ' '.join(build_sentences(count))
+        max_length = len(text) // 2
+        timings = []
+        outputs = []
+        for summarizer in (legacy, current):
+            started = time.perf_counter()
+            outputs.append(summarizer.summarize(text, max_length, max_length // 2))
+            timings.append(time.perf_counter() - started)
+        assert outputs[0] == outputs[1], f'outputs differ at {count} sentences'
+        print(f'{count:>9} {len(text):>9} {timings[0]:>9.3f}s {timings[1]:>9.3f}s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--chars', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--scaling', action='store_true', help='문장 수 대비 시간 증가율 비교')
+    args = parser.parse_args()
+    if args.scaling:
+        run_scaling()
+        return
+
+    text = build_long_article(args.chars)
+    legacy = LegacyArticleSummarizer(language='ko')
+    current = ArticleSummarizer(language='ko')
+    assert legacy.summarize(text, 300, 50) == current.summarize(text, 300, 50), 'outputs differ'
+
+    print(f'{len(text)} chars, repeat={args.repeat}')
+    timings = {}
+    for label, summarizer in (('legacy', legacy), ('current', current)):
+        seconds = min(timeit.repeat(
+            lambda: summarizer.summarize(text, 300, 50), number=args.repeat, repeat=3
+        )) / args.repeat
+        timings[label] = seconds
+        print(f'{label:<8} {seconds * 1000:8.2f} ms/article')
+    print(f'speedup: {timings["legacy"] / timings["current"]:.2f}x (outputs identical)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+gunicorn master/워커별 메모리 리포트 (RSS, PSS, 공유/전용 페이지)
+
+AI_PRELOAD_MODE=master로 가중치를 copy-on-write 공유할 때 워커당 실제 부담(PSS)과
+공유로 절약한 양(RSS 합 - PSS 합)을 확인합니다.
+
+사용법 (컨테이너 안, gunicorn master가 PID 1):
+    python scripts/report_worker_memory.py [master_pid]
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.services.memory_report import worker_memory_report  # noqa: E402
+
+
+def _mb(kb):
+    return f"{kb / 1024:.1f}"
+
+
+def main():
+    master_pid = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    report = worker_memory_report(master_pid)
+    if report["master"] is None:
+        print(f"pid {master_pid}: /proc/{master_pid}/smaps_rollup를 읽을 수 없습니다.", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"{'role':<8}{'pid':>8}{'RSS MB':>10}{'PSS MB':>10}{'shared MB':>11}{'private MB':>12}")
+    rows = [("master", report["master"])] + [("worker", w) for w in report["workers"]]
+    for role, p in rows:
+        print(
+            f"{role:<8}{p['pid']:>8}{_mb(p['rss_kb']):>10}{_mb(p['pss_kb']):>10}"
+            f"{_mb(p['shared_kb']):>11}{_mb(p['private_kb']):>12}"
+        )
+    total = report["total"]
+    print(
+        f"total RSS {_mb(total['rss_kb'])} MB, PSS {_mb(total['pss_kb'])} MB, "
+        f"saved by sharing {_mb(total['shared_savings_kb'])} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
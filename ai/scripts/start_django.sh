@@ -5,7 +5,41 @@ if [ "${DJANGO_RUN_MIGRATIONS:-false}" = "true" ]; then
   python manage.py migrate --fake-initial --noinput
 fi
 
+if [ "${AI_INFERENCE_MODE:-inprocess}" = "worker" ]; then
+  # 모델은 추론 워커가 소유하고 gunicorn 워커는 Unix 소켓으로 요청만 넘긴다.
+  # 소켓 인증 키: 지정하지 않으면 컨테이너마다 무작위로 만들어 두 프로세스에 같이 넘긴다.
+  if [ -z "${AI_INFERENCE_AUTHKEY:-}" ]; then
+    AI_INFERENCE_AUTHKEY="$(python -c 'import secrets; print(secrets.token_hex(32))')"
+  fi
+  export AI_INFERENCE_AUTHKEY
+
+  socket="${AI_INFERENCE_SOCKET:-/tmp/fanpulse-inference.sock}"
+  rm -f "$socket"
+
+  # 추론 워커가 종료되면 다시 띄운다 (gunicorn 쪽 클라이언트는 끊긴 연결을 새 연결로 재시도).
+  (
+    while true; do
+      python manage.py run_inference_worker || true
+      echo "inference worker exited, restarting in 1s" >&2
+      sleep 1
+    done
+  ) &
+
+  # 소켓이 열릴 때까지 기다린 뒤 gunicorn 시작 (모델 사전 로드는 리스닝 후 백그라운드로 진행)
+  waited=0
+  while [ ! -S "$socket" ]; do
+    if [ "$waited" -ge "${AI_INFERENCE_START_TIMEOUT:-60}" ]; then
+      echo "inference worker socket $socket not ready after ${waited}s" >&2
+      exit 1
+    fi
+    sleep 1
+    waited=$((waited + 1))
+  done
+fi
+
 exec gunicorn config.wsgi:application \
+  --config config/gunicorn.conf.py \
   --bind 0.0.0.0:8000 \
   --workers "${GUNICORN_WORKERS:-1}" \
+  --threads "${GUNICORN_THREADS:-1}" \
   --timeout "${GUNICORN_TIMEOUT:-120}"